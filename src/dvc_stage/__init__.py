@@ -16,3 +16,15 @@ try:
     __version__ = version("dvc-stage")
 except PackageNotFoundError:
     __version__ = "unknown version"
+
+
+def __getattr__(name: str) -> any:
+    """Import the `Stage` class on first access.
+
+    This keeps importing the package cheap, since running stages requires DVC.
+    """
+    if name == "Stage":
+        from dvc_stage.stage import Stage
+
+        return Stage
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,393 @@
+# -*- time-stamp-pattern: "changed[\s]+:[\s]+%%$"; -*-
+# %% Author ####################################################################
+# file    : caching.py
+# author  : Marcel Arpogaus <znepry.necbtnhf@tznvy.pbz>
+#
+# created : 2026-10-18 09:12:37 (Marcel Arpogaus)
+# changed : 2026-10-18 09:12:37 (Marcel Arpogaus)
+
+# %% Description ###############################################################
+"""caching module."""
+
+# %% imports ###################################################################
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import threading
+
+import pandas as pd
+
+# %% globals ###################################################################
+__LOGGER__ = logging.getLogger(__name__)
+__DEFAULT_CACHE_DIR__ = os.path.join(".dvc", "tmp", "dvc-stage")
+__SIZE_UNITS__ = {"": 1, "K": 1024, "M": 1024**2, "G": 1024**3, "T": 1024**4}
+
+
+# %% private functions #########################################################
+@functools.lru_cache(maxsize=8)
+def _get_dvc_repo(root: str) -> any:
+    """Open the DVC repository containing the given directory.
+
+    Parameters
+    ----------
+    root : str
+        Directory inside the DVC repository.
+
+    Returns
+    -------
+    any
+        The DVC repository or None if it cannot be opened.
+
+    """
+    from dvc.repo import Repo
+
+    try:
+        return Repo(root)
+    except Exception as e:
+        __LOGGER__.debug(f"unable to open dvc repository: {e}")
+        return None
+
+
+def _get_dvc_md5(path: str) -> str | None:
+    """Get the md5 of a file already computed by DVC.
+
+    DVC keeps the md5 of files together with their inode, mtime and size in its
+    state database. The hash is only returned if the file did not change since.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+
+    Returns
+    -------
+    str | None
+        The md5 or None if DVC has no valid hash for this file.
+
+    """
+    repo = _get_dvc_repo(os.getcwd())
+    if repo is None:
+        return None
+    try:
+        _, hash_info = repo.state.get(os.path.abspath(path), repo.fs)
+    except Exception as e:
+        __LOGGER__.debug(f"unable to query dvc state: {e}")
+        return None
+    if hash_info is not None and hash_info.name == "md5":
+        return hash_info.value
+    return None
+
+
+def _parse_size(size: int | str) -> int:
+    """Parse a size given in bytes or as a string with unit, e.g. "10GB".
+
+    Parameters
+    ----------
+    size : int | str
+        The size.
+
+    Returns
+    -------
+    int
+        The size in bytes.
+
+    Raises
+    ------
+    ValueError
+        If the size can not be parsed.
+
+    """
+    if isinstance(size, int):
+        return size
+    match = re.fullmatch(r"\s*([0-9.]+)\s*([KMGT]?)i?B?\s*", str(size).upper())
+    if match is None:
+        raise ValueError(f'invalid cache size "{size}"')
+    value, unit = match.groups()
+    return int(float(value) * __SIZE_UNITS__[unit])
+
+
+# %% public functions ##########################################################
+def get_file_hash(path: str) -> str:
+    """Get the md5 of a file, reusing the hash computed by DVC if possible.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+
+    Returns
+    -------
+    str
+        The md5 of the file content.
+
+    """
+    md5 = _get_dvc_md5(path)
+    if md5 is None:
+        __LOGGER__.debug(f"computing md5 of '{path}'")
+        h = hashlib.md5()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(2**20), b""):
+                h.update(block)
+        md5 = h.hexdigest()
+    return md5
+
+
+def get_hash(*objs: any) -> str:
+    """Get a stable hash of json serializable objects.
+
+    Parameters
+    ----------
+    *objs : any
+        Objects to hash. Objects not serializable by json are represented by
+        their string representation.
+
+    Returns
+    -------
+    str
+        The md5 of the serialized objects.
+
+    """
+    serialized = json.dumps(objs, sort_keys=True, default=str)
+    return hashlib.md5(serialized.encode()).hexdigest()
+
+
+def get_data_hash(data: any) -> str:
+    """Get a hash of the content of data.
+
+    Parameters
+    ----------
+    data : any
+        A DataFrame, a dictionary of data or any picklable object.
+
+    Returns
+    -------
+    str
+        The md5 of the data.
+
+    """
+    if isinstance(data, dict):
+        return get_hash({k: get_data_hash(v) for k, v in data.items()})
+    elif isinstance(data, (pd.DataFrame, pd.Series)):
+        try:
+            values = pd.util.hash_pandas_object(data, index=True).values
+        except TypeError:
+            # unhashable values, e.g. lists
+            return hashlib.md5(pickle.dumps(data)).hexdigest()
+        h = hashlib.md5(values.tobytes())
+        dtypes = data.dtypes if isinstance(data, pd.DataFrame) else data.dtype
+        h.update(repr(dtypes).encode())
+        return h.hexdigest()
+    else:
+        return hashlib.md5(pickle.dumps(data)).hexdigest()
+
+
+def get_cache_path(key: str, namespace: str, dir: str | None = None) -> str:
+    """Get the path of a cache entry.
+
+    Parameters
+    ----------
+    key : str
+        Key of the cache entry.
+    namespace : str
+        Subdirectory of the cache used to group entries.
+    dir : str | None, optional
+        The cache directory. Default is None, which uses ".dvc/tmp/dvc-stage".
+
+    Returns
+    -------
+    str
+        The path of the cache entry.
+
+    """
+    return os.path.join(dir or __DEFAULT_CACHE_DIR__, namespace, key)
+
+
+def read_cached_frame(path: str, backend: str = "numpy") -> pd.DataFrame | None:
+    """Read a DataFrame from a cache entry, using memory mapping.
+
+    Parameters
+    ----------
+    path : str
+        The path of the cache entry.
+    backend : str, optional
+        Either "numpy" to convert the data into NumPy-backed columns or "arrow"
+        to keep the memory mapped Arrow buffers. Default is "numpy".
+
+    Returns
+    -------
+    pd.DataFrame | None
+        The cached DataFrame or None if the entry does not exist.
+
+    """
+    if not os.path.exists(path):
+        return None
+    import pyarrow.feather as feather
+
+    __LOGGER__.debug(f"reading cached data from '{path}'")
+    table = feather.read_table(path, memory_map=True)
+    if backend == "arrow":
+        data = table.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        data = table.to_pandas()
+    # touch entry to mark it as recently used
+    os.utime(path)
+    return data
+
+
+def write_cached_frame(data: pd.DataFrame, path: str) -> bool:
+    """Write a DataFrame as Arrow IPC (feather) file to the cache.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The DataFrame to cache.
+    path : str
+        The path of the cache entry.
+
+    Returns
+    -------
+    bool
+        True if the data has been cached.
+
+    """
+    import pyarrow.feather as feather
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        # uncompressed files are memory-mapped without decoding on read
+        feather.write_feather(data, tmp_path, compression="uncompressed")
+    except Exception as e:
+        __LOGGER__.debug(f"unable to cache data: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    __LOGGER__.debug(f"cached data in '{path}'")
+    return True
+
+
+def read_cached_object(path: str) -> any:
+    """Read a pickled object from a cache entry.
+
+    Entries with the extension ".joblib" are read using joblib and their NumPy
+    arrays are memory mapped.
+
+    Parameters
+    ----------
+    path : str
+        The path of the cache entry.
+
+    Returns
+    -------
+    any
+        The cached object or None if the entry does not exist.
+
+    """
+    try:
+        if path.endswith(".joblib"):
+            import joblib
+
+            obj = joblib.load(path, mmap_mode="r")
+        else:
+            with open(path, "rb") as f:
+                obj = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    __LOGGER__.debug(f"read cached object from '{path}'")
+    # touch entry to mark it as recently used
+    os.utime(path)
+    return obj
+
+
+def write_cached_object(obj: any, path: str) -> bool:
+    """Pickle an object to the cache.
+
+    Entries with the extension ".joblib" are written using joblib, which stores
+    NumPy arrays, e.g. of fitted estimators, so that they can be memory mapped.
+
+    Parameters
+    ----------
+    obj : any
+        The object to cache.
+    path : str
+        The path of the cache entry.
+
+    Returns
+    -------
+    bool
+        True if the object has been cached.
+
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        if path.endswith(".joblib"):
+            import joblib
+
+            joblib.dump(obj, tmp_path)
+        else:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        __LOGGER__.debug(f"unable to cache object: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+    os.replace(tmp_path, path)
+    __LOGGER__.debug(f"cached object in '{path}'")
+    return True
+
+
+def evict(dir: str | None = None, max_size: int | str | None = None) -> int:
+    """Remove least recently used cache entries until the cache fits max_size.
+
+    Parameters
+    ----------
+    dir : str | None, optional
+        The cache directory. Default is None, which uses ".dvc/tmp/dvc-stage".
+    max_size : int | str | None, optional
+        Maximum size of the cache in bytes or as string with unit, e.g. "10GB".
+        If None, all entries are removed. Default is None.
+
+    Returns
+    -------
+    int
+        Number of bytes freed.
+
+    """
+    dir = dir or __DEFAULT_CACHE_DIR__
+    max_size = 0 if max_size is None else _parse_size(max_size)
+
+    entries = []
+    for root, _, files in os.walk(dir):
+        for name in files:
+            if name.endswith(".tmp"):
+                # written by a concurrent writer and not yet moved in place
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+    size = sum(e[1] for e in entries)
+    freed = 0
+    for _, entry_size, path in sorted(entries):
+        if size - freed <= max_size:
+            break
+        __LOGGER__.debug(f"evicting cache entry '{path}'")
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        freed += entry_size
+
+    return freed
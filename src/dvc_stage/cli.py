@@ -19,18 +19,9 @@ import sys
 
 import yaml
 
-from dvc_stage.config import (
-    get_stage_definition,
-    get_stage_params,
-    load_dvc_yaml,
-    stage_definition_is_valid,
-    validate_stage_definition,
-)
-from dvc_stage.loading import load_data
-from dvc_stage.transforming import apply_transformations
-from dvc_stage.utils import get_deps
-from dvc_stage.validating import apply_validations
-from dvc_stage.writing import write_data
+from dvc_stage.caching import evict
+from dvc_stage.config import ConfigSession, get_stage_definition
+from dvc_stage.stage import Stage
 
 # %% globals ###################################################################
 __LOGGER__ = logging.getLogger(__name__)
@@ -50,7 +41,9 @@ def _print_stage_definition(stage: str) -> None:
     print(yaml.dump(config))
 
 
-def _update_dvc_stage(stage: str, yes: bool) -> None:
+def _update_dvc_stage(
+    stage: str, yes: bool, session: ConfigSession | None = None
+) -> None:
     """Update the definition in the `dvc.yaml` file for the specified DVC stage.
 
     Parameters
@@ -59,16 +52,20 @@ def _update_dvc_stage(stage: str, yes: bool) -> None:
         The name of the DVC stage to update.
     yes : bool
         Whether to continue without asking for confirmation.
+    session : ConfigSession | None, optional
+        Session providing the parameters and dvc.yaml. Default is None, which
+        creates a new session.
 
     """
-    if stage_definition_is_valid(stage):
+    session = session or ConfigSession()
+    dvc_yaml = session.dvc_yaml
+    config = get_stage_definition(stage, session)["stages"][stage]
+    if dvc_yaml["stages"][stage] == config:
         __LOGGER__.info(f"stage definition of {stage} is up to date")
     else:
         __LOGGER__.info(
             f"stage definition of {stage} is invalid, dvc.yaml needs to be updated"
         )
-        dvc_yaml = load_dvc_yaml()
-        config = get_stage_definition(stage)["stages"][stage]
 
         s1 = yaml.dump(dvc_yaml["stages"][stage]).splitlines()
         s2 = yaml.dump(config).splitlines()
@@ -101,12 +98,14 @@ def _update_dvc_yaml(yes: bool) -> None:
         Whether to continue without asking for confirmation.
 
     """
-    dvc_yaml = load_dvc_yaml()
-    for stage, definition in dvc_yaml["stages"].items():
+    # parameters and dvc.yaml are loaded once for all stages
+    session = ConfigSession()
+    session.params
+    for stage, definition in list(session.dvc_yaml["stages"].items()):
         if definition is not None and definition.get(
             "cmd", definition.get("do", {}).get("cmd", "")
         ).startswith("dvc-stage"):
-            _update_dvc_stage(stage, yes)
+            _update_dvc_stage(stage, yes, session)
 
 
 def _run_stage(stage: str, validate: bool = True, item: str | None = None) -> None:
@@ -122,45 +121,23 @@ def _run_stage(stage: str, validate: bool = True, item: str | None = None) -> No
         Item identifier for foreach stages. Default is None.
 
     """
-    if validate:
-        validate_stage_definition(stage)
+    Stage(stage, validate=validate).run(item=item)
 
-    stage_params, global_params = get_stage_params(stage)
-    __LOGGER__.debug(f"{stage_params=}")
-    __LOGGER__.debug(f"{global_params=}")
 
-    deps, _ = get_deps(stage_params["load"].pop("path"), global_params, item)
+def _prune_cache(max_size: str | None = None, dir: str | None = None) -> None:
+    """Remove least recently used entries from the cache.
 
-    __LOGGER__.info("loading data")
-    data = load_data(
-        paths=deps,
-        **stage_params["load"],
-    )
-    __LOGGER__.info("all data loaded")
-
-    transformations = stage_params.get("transformations")
-    validations = stage_params.get("validations")
-    write = stage_params.get("write")
-
-    if transformations is not None:
-        assert write is not None, "No writer configured."
-        __LOGGER__.info("applying transformations")
-        data = apply_transformations(data, transformations, item=item)
-        __LOGGER__.info("all transformations applied")
-
-    if validations is not None:
-        __LOGGER__.info("applying validations")
-        apply_validations(data, validations, item=item)
-        __LOGGER__.info("all validations passed")
-
-    if write is not None:
-        __LOGGER__.info("writing data")
-        write_data(
-            data=data,
-            item=item,
-            **stage_params["write"],
-        )
-        __LOGGER__.info("all data written")
+    Parameters
+    ----------
+    max_size : str | None, optional
+        Maximum size of the cache, e.g. "10GB". If None, the cache is cleared.
+        Default is None.
+    dir : str | None, optional
+        The cache directory. Default is None, which uses ".dvc/tmp/dvc-stage".
+
+    """
+    freed = evict(dir, max_size)
+    __LOGGER__.info(f"freed {freed} bytes")
 
 
 # %% public functions ##########################################################
@@ -224,6 +201,25 @@ def cli() -> None:
     )
     update_all_parser.set_defaults(func=_update_dvc_yaml)
 
+    cache_parser = subparsers.add_parser("cache", help="manage the dvc-stage cache")
+    cache_subparsers = cache_parser.add_subparsers(
+        title="subcommands", help="valid subcommands", required=True
+    )
+    prune_parser = cache_subparsers.add_parser(
+        "prune", help="remove least recently used cache entries"
+    )
+    prune_parser.add_argument(
+        "--max-size",
+        type=str,
+        help='maximum size of the cache, e.g. "10GB". Clears the cache if omitted.',
+    )
+    prune_parser.add_argument(
+        "--dir",
+        type=str,
+        help="cache directory",
+    )
+    prune_parser.set_defaults(func=_prune_cache)
+
     args = parser.parse_args()
 
     # Configure logging
@@ -12,21 +12,155 @@
 # %% imports ###################################################################
 from __future__ import annotations
 
+import copy
 import logging
+import os
 
 import dvc.api
 import yaml
 
 import dvc_stage
+from dvc_stage.caching import (
+    evict,
+    get_cache_path,
+    get_hash,
+    read_cached_object,
+    write_cached_object,
+)
 from dvc_stage.loading import load_data
+from dvc_stage.tracing import get_source_stats, trace_keys
 from dvc_stage.transforming import apply_transformations
 from dvc_stage.utils import flatten_dict, get_deps, get_outs
 
 # %% globals ###################################################################
 __LOGGER__ = logging.getLogger(__name__)
+# maximum size of the cached outputs of traced stages
+__TRACE_CACHE_MAX_SIZE__ = "10MB"
 
 
-# %% functions #################################################################
+# %% private functions #########################################################
+def _split_params(
+    params: dict[str, any], stage: str
+) -> tuple[dict[str, any], dict[str, any]]:
+    """Split the parameters into the stage parameters and global parameters.
+
+    Parameters
+    ----------
+    params : dict[str, any]
+        The parameters as returned by `dvc.api.params_show`.
+    stage : str
+        The name of the dvc stage.
+
+    Returns
+    -------
+    tuple[dict[str, any], dict[str, any]]
+        A tuple (stage_params, global_params) containing the
+        stage parameters and global parameters as dictionaries.
+
+    """
+    stage_params = params[stage]
+    global_params = dict(
+        filter(lambda kv: isinstance(kv[1], (int, float, str)), params.items())
+    )
+    __LOGGER__.debug(stage_params, global_params)
+
+    return stage_params, global_params
+
+
+def _get_trace_cache_path(
+    deps: list[str],
+    load: dict[str, any],
+    transformations: list[dict[str, any]],
+    write: dict[str, any],
+) -> str:
+    """Get the cache path of the traced outputs of a stage.
+
+    Parameters
+    ----------
+    deps : list[str]
+        The files loaded by the stage.
+    load : dict[str, any]
+        Loading parameters of the stage.
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+    write : dict[str, any]
+        Writer configuration.
+
+    Returns
+    -------
+    str
+        The path of the cache entry.
+
+    """
+    key = get_hash(
+        deps,
+        load,
+        transformations,
+        write,
+        get_source_stats(transformations),
+        dvc_stage.__version__,
+    )
+    return get_cache_path(f"{key}.pkl", "trace")
+
+
+def _trace_outs(
+    deps: list[str],
+    load: dict[str, any],
+    transformations: list[dict[str, any]],
+    write: dict[str, any],
+    cache: bool = True,
+) -> list[str]:
+    """Get the output paths of a stage without loading any data.
+
+    The keys of the transformed data are derived statically if possible, else
+    all transformations are executed without data. Results are cached by a
+    hash of the parameters, the dependencies and the modules of custom
+    functions, if the project has a ".dvc" directory. The least recently used
+    entries are evicted once the cached outputs exceed 10MB.
+
+    Parameters
+    ----------
+    deps : list[str]
+        The files loaded by the stage.
+    load : dict[str, any]
+        Loading parameters of the stage.
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+    write : dict[str, any]
+        Writer configuration.
+    cache : bool, optional
+        Whether to cache the outputs. Default is True.
+
+    Returns
+    -------
+    list[str]
+        The output paths.
+
+    """
+    path = None
+    if cache and os.path.isdir(".dvc"):
+        path = _get_trace_cache_path(deps, load, transformations, write)
+        outs = read_cached_object(path)
+        if outs is not None:
+            __LOGGER__.debug("using cached outputs")
+            return outs
+
+    # if the format is None data loading is skipped and None is returned
+    data = load_data(paths=deps, quiet=True, **dict(load, format=None))
+    try:
+        keys = trace_keys(None if data is None else list(data.keys()), transformations)
+        data = None if keys is None else dict.fromkeys(keys)
+    except (ValueError, TypeError) as e:
+        __LOGGER__.debug(f"falling back to tracing with empty data: {e}")
+        data = apply_transformations(data, transformations, quiet=True)
+
+    outs = get_outs(data, **write)
+    if path is not None and write_cached_object(outs, path):
+        evict(os.path.dirname(path), __TRACE_CACHE_MAX_SIZE__)
+    return outs
+
+
+# %% public functions ##########################################################
 def load_dvc_yaml() -> dict[str, any]:
     """Load and return the dvc.yaml file as a dictionary.
 
@@ -43,13 +177,18 @@ def load_dvc_yaml() -> dict[str, any]:
     return dvc_yaml
 
 
-def get_stage_definition(stage: str) -> dict[str, any]:
+def get_stage_definition(
+    stage: str, session: ConfigSession | None = None
+) -> dict[str, any]:
     """Generate a dvc stage definition dictionary based on the given stage name.
 
     Parameters
     ----------
     stage : str
         The name of the dvc stage.
+    session : ConfigSession | None, optional
+        Session providing the parameters. Default is None, which creates a
+        new session.
 
     Returns
     -------
@@ -59,7 +198,8 @@ def get_stage_definition(stage: str) -> dict[str, any]:
     """
     __LOGGER__.debug(f"tracing dvc stage: {stage}")
 
-    stage_params, global_params = get_stage_params(stage, all=True)
+    session = session or ConfigSession()
+    stage_params, global_params = session.get_stage_params(stage)
 
     dvc_params = list(flatten_dict(stage_params, parent_key=stage).keys())
     deps, param_keys = get_deps(stage_params["load"].pop("path"), global_params)
@@ -85,15 +225,15 @@ def get_stage_definition(stage: str) -> dict[str, any]:
     write = stage_params.get("write", None)
     load = stage_params["load"]
 
-    # if the format is None data loading is skipped and None is returned
-    load["format"] = None
-
-    data = load_data(paths=deps, quiet=True, **load)
-
     if transformations is not None:
         assert write is not None, "No writer configured."
-        data = apply_transformations(data, transformations, quiet=True)
-        outs = get_outs(data, **write)
+        outs = _trace_outs(
+            deps,
+            load,
+            transformations,
+            write,
+            cache=stage_params.get("trace_cache", True),
+        )
         config["outs"] = outs + stage_params.get("extra_outs", [])
 
     if "foreach" in stage_params:
@@ -104,13 +244,16 @@ def get_stage_definition(stage: str) -> dict[str, any]:
     return config
 
 
-def stage_definition_is_valid(stage: str) -> bool:
+def stage_definition_is_valid(stage: str, session: ConfigSession | None = None) -> bool:
     """Check if the dvc.yaml file for the given stage is valid.
 
     Parameters
     ----------
     stage : str
         The name of the dvc stage.
+    session : ConfigSession | None, optional
+        Session providing the parameters and dvc.yaml. Default is None, which
+        creates a new session.
 
     Returns
     -------
@@ -118,21 +261,25 @@ def stage_definition_is_valid(stage: str) -> bool:
         True if dvc.yaml is valid.
 
     """
-    dvc_yaml = load_dvc_yaml()["stages"][stage]
+    session = session or ConfigSession()
+    dvc_yaml = session.dvc_yaml["stages"][stage]
     __LOGGER__.debug(f"dvc.yaml:\n{yaml.dump(dvc_yaml)}")
-    config = get_stage_definition(stage)["stages"][stage]
+    config = get_stage_definition(stage, session)["stages"][stage]
     __LOGGER__.debug(f"expected:\n{yaml.dump(config)}")
 
     return dvc_yaml == config
 
 
-def validate_stage_definition(stage: str) -> None:
+def validate_stage_definition(stage: str, session: ConfigSession | None = None) -> None:
     """Validate the dvc.yaml file for the given stage.
 
     Parameters
     ----------
     stage : str
         The name of the dvc stage.
+    session : ConfigSession | None, optional
+        Session providing the parameters and dvc.yaml. Default is None, which
+        creates a new session.
 
     Note
     ----
@@ -140,7 +287,9 @@ def validate_stage_definition(stage: str) -> None:
 
     """
     __LOGGER__.debug("validating dvc.yaml")
-    assert stage_definition_is_valid(stage), f"dvc.yaml for {stage} is invalid."
+    assert stage_definition_is_valid(stage, session), (
+        f"dvc.yaml for {stage} is invalid."
+    )
 
 
 def get_stage_params(
@@ -163,10 +312,70 @@ def get_stage_params(
 
     """
     params = dvc.api.params_show(stages=None if all else stage)
-    stage_params = params[stage]
-    global_params = dict(
-        filter(lambda kv: isinstance(kv[1], (int, float, str)), params.items())
-    )
-    __LOGGER__.debug(stage_params, global_params)
+    return _split_params(params, stage)
 
-    return stage_params, global_params
+
+# %% classes ###################################################################
+class ConfigSession:
+    """The parameters and dvc.yaml of a project, each loaded only once.
+
+    A session is shared by the validation, tracing and execution of stages,
+    so `dvc.api.params_show` is called once per stage, instead of once per
+    phase. The parameters of a single stage are loaded with the stage filter
+    of `params_show`, unless the parameters of all stages have already been
+    loaded through `params`. Resolved dependencies are memoized by
+    `resolve_globs`.
+
+    Examples
+    --------
+    >>> session = ConfigSession()  # doctest: +SKIP
+    >>> validate_stage_definition("my_stage", session)  # doctest: +SKIP
+    >>> Stage("my_stage", validate=False, session=session).run()  # doctest: +SKIP
+
+    """
+
+    def __init__(self) -> None:
+        """Create an empty session, loading the configuration on first access."""
+        self._params = None
+        self._stage_params = {}
+        self._dvc_yaml = None
+
+    @property
+    def params(self) -> dict[str, any]:
+        """The parameters of all stages as returned by `dvc.api.params_show`."""
+        if self._params is None:
+            __LOGGER__.debug("loading params")
+            self._params = dvc.api.params_show()
+        return self._params
+
+    @property
+    def dvc_yaml(self) -> dict[str, any]:
+        """The contents of the dvc.yaml file."""
+        if self._dvc_yaml is None:
+            self._dvc_yaml = load_dvc_yaml()
+        return self._dvc_yaml
+
+    def get_stage_params(self, stage: str) -> tuple[dict[str, any], dict[str, any]]:
+        """Get a copy of the stage parameters and the global parameters.
+
+        Parameters
+        ----------
+        stage : str
+            The name of the dvc stage.
+
+        Returns
+        -------
+        tuple[dict[str, any], dict[str, any]]
+            A tuple (stage_params, global_params) containing the
+            stage parameters and global parameters as dictionaries.
+
+        """
+        if self._params is not None:
+            params = self._params
+        elif stage in self._stage_params:
+            params = self._stage_params[stage]
+        else:
+            __LOGGER__.debug(f"loading params of stage {stage}")
+            params = self._stage_params[stage] = dvc.api.params_show(stages=stage)
+        stage_params, global_params = _split_params(params, stage)
+        return copy.deepcopy(stage_params), global_params
@@ -13,29 +13,405 @@
 from __future__ import annotations
 
 import fnmatch
+import functools
+import glob
+import importlib.util
+import inspect
 import logging
 import os
+import re
+from collections.abc import ItemsView, ValuesView
 
 import pandas as pd
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
-from dvc_stage.utils import import_from_string
+from dvc_stage.caching import (
+    evict,
+    get_cache_path,
+    get_file_hash,
+    get_hash,
+    read_cached_frame,
+    write_cached_frame,
+)
+from dvc_stage.utils import get_executor, import_from_string
 
 # %% globals ###################################################################
 __LOGGER__ = logging.getLogger(__name__)
+__LOADERS__ = {}
+__LOADER_ENTRY_POINT_GROUP__ = "dvc_stage.loaders"
+# path separators of the platform
+__SEPARATORS__ = os.sep + (os.altsep or "")
+# options not supported by the pyarrow engine of `pd.read_csv`
+__PYARROW_CSV_UNSUPPORTED__ = {
+    "chunksize",
+    "comment",
+    "converters",
+    "dayfirst",
+    "dialect",
+    "float_precision",
+    "iterator",
+    "lineterminator",
+    "low_memory",
+    "memory_map",
+    "nrows",
+    "on_bad_lines",
+    "quoting",
+    "skipfooter",
+    "skipinitialspace",
+    "thousands",
+}
 
 
 # %% private functions #########################################################
-def _get_loading_function(format: str, import_from: str) -> callable:
+def _to_pandas(table: any, backend: str) -> pd.DataFrame:
+    """Convert an Arrow table or record batch to a pandas DataFrame.
+
+    Parameters
+    ----------
+    table : any
+        The Arrow table or record batch.
+    backend : str
+        Either "numpy" to convert into NumPy-backed columns or "arrow" to keep
+        the Arrow buffers, which avoids copying the data.
+
+    Returns
+    -------
+    pd.DataFrame
+        The converted DataFrame.
+
+    """
+    if backend == "arrow":
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    else:
+        return table.to_pandas()
+
+
+def _read_feather_arrow(
+    path: str, columns: list[str] | None = None, **kwds: any
+) -> pd.DataFrame:
+    """Read a feather (Arrow IPC) file using memory mapping.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    columns : list[str] | None, optional
+        Columns to read. Default is None, which reads all columns.
+    **kwds : any
+        Additional keyword arguments passed to `pyarrow.feather.read_table`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Arrow-backed DataFrame referencing the memory mapped file.
+
+    """
+    import pyarrow.feather as feather
+
+    table = feather.read_table(path, columns=columns, memory_map=True, **kwds)
+    return _to_pandas(table, "arrow")
+
+
+def _read_parquet_filtered(
+    path: str,
+    filters: list,
+    columns: list[str] | None = None,
+    dtype_backend: str | None = None,
+) -> pd.DataFrame:
+    """Read the rows of a parquet file matching filters, keeping their labels.
+
+    Row groups are skipped based on their statistics. Unlike reading with
+    `filters` directly, the rows keep the index labels they have in the
+    unfiltered data, like after `DataFrame.query`.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    filters : list
+        Row filters in the format of `pyarrow.parquet.read_table`.
+    columns : list[str] | None, optional
+        Columns to read. Default is None, which reads all columns.
+    dtype_backend : str | None, optional
+        Set to "pyarrow" to return an Arrow-backed DataFrame. Default is None.
+
+    Returns
+    -------
+    pd.DataFrame
+        The matching rows.
+
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    expression = pq.filters_to_expression(filters)
+    fragment = next(ds.dataset(path, format="parquet").get_fragments())
+    schema = fragment.physical_schema
+    index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+    if columns is not None:
+        columns = list(columns) + [
+            c for c in index_columns if isinstance(c, str) and c not in columns
+        ]
+
+    read_columns = None
+    if columns is not None:
+        conjunctions = filters if isinstance(filters[0], list) else [filters]
+        filter_columns = [f[0] for c in conjunctions for f in c]
+        read_columns = list(dict.fromkeys(columns + filter_columns))
+
+    metadata = fragment.metadata
+    offsets = np.cumsum(
+        [0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+    )
+    tables = []
+    positions = []
+    for row_group in fragment.split_by_row_group(expression):
+        table = row_group.to_table(columns=read_columns)
+        offset = offsets[row_group.row_groups[0].id]
+        position = pa.array(np.arange(offset, offset + table.num_rows))
+        table = table.append_column("__position__", position).filter(expression)
+        positions.append(table.column("__position__").to_numpy())
+        tables.append(table.select(columns or schema.names))
+    if tables:
+        table = pa.concat_tables(tables)
+    else:
+        table = fragment.to_table(columns=columns, filter=expression)
+    table = table.replace_schema_metadata(schema.metadata)
+
+    data = _to_pandas(table, "arrow" if dtype_backend == "pyarrow" else "numpy")
+    if not any(isinstance(c, str) for c in index_columns):
+        # restore the labels of a range index from the row positions
+        index = {"start": 0, "step": 1}
+        index.update(next((c for c in index_columns if isinstance(c, dict)), {}))
+        position = np.concatenate(positions) if positions else np.array([], int)
+        data.index = pd.Index(index["start"] + position * index["step"])
+    return data
+
+
+def _read_parquet_arrow(
+    path: str,
+    columns: list[str] | None = None,
+    filters: list | None = None,
+    **kwds: any,
+) -> pd.DataFrame:
+    """Read a parquet file through pyarrow.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    columns : list[str] | None, optional
+        Columns to read. Default is None, which reads all columns.
+    filters : list | None, optional
+        Row filters passed to `pyarrow.parquet.read_table`. Default is None.
+    **kwds : any
+        Additional keyword arguments passed to `pyarrow.parquet.read_table`.
+
+    Returns
+    -------
+    pd.DataFrame
+        Arrow-backed DataFrame.
+
+    """
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(
+        path, columns=columns, filters=filters, memory_map=True, **kwds
+    )
+    return _to_pandas(table, "arrow")
+
+
+def _read_json_orjson(
+    path: str, lines: bool = False, orient: str | None = None, **kwds: any
+) -> pd.DataFrame:
+    """Read JSON records using orjson.
+
+    Only JSON lines and arrays of records are supported. Unlike `pd.read_json`,
+    no dtype conversion is applied, e.g. date-like columns are kept as strings.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    lines : bool, optional
+        Read the file as JSON lines, one record per line. Default is False.
+    orient : str | None, optional
+        The JSON format, only "records" is supported. Default is None.
+    **kwds : any
+        Additional keyword arguments passed to `pd.DataFrame`.
+
+    Returns
+    -------
+    pd.DataFrame
+        The loaded records.
+
+    Raises
+    ------
+    ValueError
+        If the orient is not supported.
+
+    """
+    import orjson
+
+    if orient not in (None, "records"):
+        raise ValueError(f'orient "{orient}" is not supported by the orjson engine')
+    with open(path, "rb") as f:
+        if lines:
+            records = [orjson.loads(line) for line in f if line.strip()]
+        else:
+            records = orjson.loads(f.read())
+    return pd.DataFrame(records, **kwds)
+
+
+@functools.lru_cache(maxsize=None)
+def _is_available(module: str) -> bool:
+    """Check if a module can be imported without importing it.
+
+    Parameters
+    ----------
+    module : str
+        The module name.
+
+    Returns
+    -------
+    bool
+        True if the module is installed.
+
+    """
+    return importlib.util.find_spec(module) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts(fn: callable, parameter: str) -> bool:
+    """Check if a function accepts a given keyword argument.
+
+    Parameters
+    ----------
+    fn : callable
+        The function.
+    parameter : str
+        The name of the keyword argument.
+
+    Returns
+    -------
+    bool
+        True if the parameter is part of the function signature.
+
+    """
+    try:
+        return parameter in inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _get_entry_points() -> dict[tuple[str, str | None], any]:
+    """Get all loaders registered through package entry points.
+
+    Entry points of the group "dvc_stage.loaders" are named after the format
+    they load, optionally followed by the engine, e.g. "json.orjson".
+
+    Returns
+    -------
+    dict[tuple[str, str | None], any]
+        Mapping from (format, engine) to the entry points.
+
+    """
+    from importlib.metadata import entry_points
+
+    try:
+        eps = entry_points(group=__LOADER_ENTRY_POINT_GROUP__)
+    except TypeError:
+        # python < 3.10
+        eps = entry_points().get(__LOADER_ENTRY_POINT_GROUP__, [])
+    loaders = {}
+    for ep in eps:
+        format, _, engine = ep.name.partition(".")
+        loaders[(format, engine or None)] = ep
+    return loaders
+
+
+def _select_engine(
+    format: str, engine: str | None, chunksize: int | None, kwds: dict
+) -> str | None:
+    """Select the engine used to load a given file-format.
+
+    If engine is "auto", the fastest installed engine supporting the given
+    loading arguments is selected.
+
+    Parameters
+    ----------
+    format : str
+        The file-format to load the data from.
+    engine : str | None
+        The requested engine, "auto" or None to use the default engine.
+    chunksize : int | None
+        Number of rows per chunk, if the data is loaded in chunks.
+    kwds : dict
+        The keyword arguments passed to the loading function.
+
+    Returns
+    -------
+    str | None
+        The selected engine or None to use the default engine.
+
+    """
+    if engine != "auto":
+        return engine
+    if "engine" in kwds:
+        return None
+    if format == "csv":
+        if (
+            _is_available("pyarrow")
+            and chunksize is None
+            and not __PYARROW_CSV_UNSUPPORTED__.intersection(kwds.keys())
+            # e.g. a `ColumnSelector` pushed down by the planner
+            and not callable(kwds.get("usecols"))
+        ):
+            return "pyarrow"
+    elif format == "json":
+        if (
+            chunksize is None
+            and kwds.get("lines", False)
+            and kwds.get("orient") in (None, "records")
+            and set(kwds.keys()) <= {"lines", "orient"}
+        ):
+            if _is_available("pyarrow") and _accepts(pd.read_json, "engine"):
+                return "pyarrow"
+            elif _is_available("orjson"):
+                return "orjson"
+    elif format == "excel":
+        if _is_available("python_calamine"):
+            return "calamine"
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _get_loading_function(
+    format: str,
+    import_from: str | None,
+    backend: str = "numpy",
+    engine: str | None = None,
+) -> callable:
     """Get the loading function for a given file-format.
 
+    Loaders registered via `register_loader` take precedence over loaders
+    provided by package entry points and the builtin loaders. The result is
+    cached, so the loading function is only resolved once per stage.
+
     Parameters
     ----------
     format : str
         The file-format to load the data from.
-    import_from : str
+    import_from : str | None
         Module name or path where the custom loading function is located.
+    backend : str, optional
+        Data backend, either "numpy" or "arrow". Default is "numpy".
+    engine : str | None, optional
+        The engine used to load the data. Default is None.
 
     Returns
     -------
@@ -45,18 +421,302 @@ def _get_loading_function(format: str, import_from: str) -> callable:
     Raises
     ------
     ValueError
-        If the loading function for the format is not found.
+        If the loading function for the format or the engine is not found.
 
     """
+    if backend not in ("numpy", "arrow"):
+        raise ValueError(
+            f"backend {backend} unsupported. can either be 'numpy' or 'arrow'."
+        )
+    entry_points = _get_entry_points()
+    engine_loader = None
     if format == "custom":
         fn = import_from_string(import_from)
+    elif (format, engine) in __LOADERS__:
+        fn = engine_loader = __LOADERS__[(format, engine)]
+    elif (format, engine) in entry_points:
+        fn = engine_loader = entry_points[(format, engine)].load()
+    elif format == "json" and engine == "orjson":
+        fn = engine_loader = _read_json_orjson
+    elif (format, None) in __LOADERS__:
+        fn = __LOADERS__[(format, None)]
+    elif (format, None) in entry_points:
+        fn = entry_points[(format, None)].load()
+    elif backend == "arrow" and format == "feather":
+        fn = _read_feather_arrow
+    elif backend == "arrow" and format == "parquet":
+        fn = _read_parquet_arrow
     elif hasattr(pd, "read_" + format):
         fn = getattr(pd, "read_" + format)
     else:
         raise ValueError(f'loading function for format "{format}" not found')
+
+    name = f"{fn.__module__}.{getattr(fn, '__qualname__', fn)}"
+    if engine is not None and engine_loader is None:
+        if not _accepts(fn, "engine"):
+            raise ValueError(f'engine "{engine}" not found for format "{format}"')
+        __LOGGER__.info(f'loading "{format}" data using {name} with engine "{engine}"')
+    else:
+        __LOGGER__.info(f'loading "{format}" data using {name}')
     return fn
 
 
+def _get_schema_kwds(fn: callable, schema: dict, kwds: dict) -> dict:
+    """Derive the `dtype` and `parse_dates` arguments from a Pandera schema.
+
+    Datetime columns are parsed using `parse_dates`, all other columns with a
+    dtype are read with this dtype. Nullable integer and boolean columns using
+    NumPy dtypes are left for pandas to infer, since these dtypes cannot hold
+    missing values. Arguments already given in kwds take precedence.
+
+    Parameters
+    ----------
+    fn : callable
+        The loading function.
+    schema : dict
+        The schema specification, as passed to `validate_pandera_schema`.
+    kwds : dict
+        The keyword arguments passed to the loading function.
+
+    Returns
+    -------
+    dict
+        The updated keyword arguments.
+
+    """
+    import numpy as np
+    import pandera as pa
+
+    from dvc_stage.validating import get_pandera_schema
+
+    schema = get_pandera_schema(schema)
+    columns = dict(schema.columns)
+    if isinstance(schema.index, pa.Index) and schema.index.name is not None:
+        columns[schema.index.name] = schema.index
+
+    dtype = {}
+    parse_dates = []
+    for name, column in columns.items():
+        if column.dtype is None or getattr(column, "regex", False):
+            continue
+        elif pa.dtypes.is_datetime(column.dtype):
+            parse_dates.append(name)
+        elif (
+            column.nullable
+            and isinstance(column.dtype.type, np.dtype)
+            and (pa.dtypes.is_int(column.dtype) or pa.dtypes.is_bool(column.dtype))
+        ):
+            continue
+        elif pa.dtypes.is_string(column.dtype):
+            dtype[name] = str
+        else:
+            dtype[name] = column.dtype.type
+
+    kwds = kwds.copy()
+    usecols = kwds.get("usecols")
+    if callable(usecols):
+        # e.g. a ColumnSelector of the columns pushed down by the planner
+        parse_dates = [c for c in parse_dates if usecols(c)]
+    elif usecols is not None and not isinstance(usecols, str):
+        usecols = set(usecols)
+        parse_dates = [c for c in parse_dates if c in usecols]
+    if _accepts(fn, "dtype"):
+        if isinstance(kwds.get("dtype"), dict):
+            dtype.update(kwds["dtype"])
+        kwds.setdefault("dtype", dtype)
+        __LOGGER__.debug(f"using dtypes from schema: {kwds['dtype']}")
+    if _accepts(fn, "parse_dates") and parse_dates:
+        kwds.setdefault("parse_dates", parse_dates)
+        __LOGGER__.debug(f"parsing dates from schema: {kwds['parse_dates']}")
+    return kwds
+
+
+def _iter_chunks(
+    fn: callable,
+    format: str,
+    path: str,
+    chunksize: int,
+    backend: str = "numpy",
+    **kwds: any,
+) -> any:
+    """Iterate over chunks of data from a single file.
+
+    Parameters
+    ----------
+    fn : callable
+        The loading function.
+    format : str
+        The file-format to load the data from.
+    path : str
+        The file path.
+    chunksize : int
+        Number of rows per chunk.
+    backend : str, optional
+        Data backend, either "numpy" or "arrow". Default is "numpy".
+    **kwds : any
+        Additional keyword arguments to pass to the loading function.
+
+    Yields
+    ------
+    any
+        The loaded chunks.
+
+    """
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        columns = kwds.pop("columns", None)
+        offset = 0
+        for batch in pq.ParquetFile(path).iter_batches(
+            batch_size=chunksize, columns=columns
+        ):
+            chunk = _to_pandas(batch, backend)
+            if isinstance(chunk.index, pd.RangeIndex):
+                # continue the index across chunks, like pandas readers do
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            yield chunk
+    else:
+        reader = fn(path, chunksize=chunksize, **kwds)
+        if hasattr(reader, "__enter__"):
+            with reader:
+                yield from reader
+        else:
+            yield from reader
+
+
+def _load_cached(
+    fn: callable, path: str, cache: bool | dict, backend: str = "numpy", **kwds: any
+) -> any:
+    """Load data from a file, reusing the previously parsed DataFrame if cached.
+
+    Cache entries are keyed by the md5 of the file together with the loading
+    function and its keyword arguments.
+
+    Parameters
+    ----------
+    fn : callable
+        The loading function.
+    path : str
+        The file path.
+    cache : bool | dict
+        True or a dictionary with the optional key "dir", the cache directory.
+        Its "max_size" is enforced by `load_data` once all data is loaded.
+    backend : str, optional
+        Data backend, either "numpy" or "arrow". Default is "numpy".
+    **kwds : any
+        Additional keyword arguments to pass to the loading function.
+
+    Returns
+    -------
+    any
+        The loaded data.
+
+    """
+    cache = cache if isinstance(cache, dict) else {}
+    key = get_hash(
+        get_file_hash(path),
+        fn.__module__,
+        fn.__qualname__,
+        pd.__version__,
+        backend,
+        kwds,
+    )
+    cache_path = get_cache_path(f"{key}.feather", "load", cache.get("dir"))
+
+    data = read_cached_frame(cache_path, backend)
+    if data is None:
+        data = fn(path, **kwds)
+        if isinstance(data, pd.DataFrame):
+            write_cached_frame(data, cache_path)
+    else:
+        __LOGGER__.debug(f"using cached data for '{path}'")
+    return data
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_key_map(
+    key_map: tuple[tuple[str, str]],
+) -> tuple[dict[str, int], dict[str, callable], list[str]]:
+    """Compile the patterns of a key map for fast matching.
+
+    Patterns without wildcards are looked up in a dictionary. All other
+    patterns are grouped by their static directory, the part before the first
+    wildcard up to the last separator. The patterns of each directory are
+    combined into a single regular expression with one named group per
+    pattern, so a path is only matched against the patterns of its ancestor
+    directories, and the first matching pattern is the group that matched.
+
+    Parameters
+    ----------
+    key_map : tuple[tuple[str, str]]
+        The items of a mapping from filename patterns to data keys.
+
+    Returns
+    -------
+    tuple[dict[str, int], dict[str, callable], list[str]]
+        The index of each literal pattern, the match function of the other
+        patterns of each static directory and the data keys.
+
+    """
+    literals = {}
+    wildcards = {}
+    for i, (pat, _) in enumerate(key_map):
+        pat = os.path.normcase(pat)
+        if not glob.has_magic(pat):
+            literals.setdefault(pat, i)
+        else:
+            prefix = re.split(r"[*?[]", pat, maxsplit=1)[0]
+            static_dir = prefix[: max(map(prefix.rfind, __SEPARATORS__)) + 1]
+            wildcards.setdefault(static_dir, []).append(
+                f"(?P<p{i}>{fnmatch.translate(pat)})"
+            )
+    matches = {d: re.compile("|".join(p)).match for d, p in wildcards.items()}
+    return literals, matches, [key for _, key in key_map]
+
+
+def _get_data_keys(paths: list[str], key_map: dict) -> list[str]:
+    """Private function to get the data keys of multiple file paths.
+
+    The key map is compiled once for all paths.
+
+    Parameters
+    ----------
+    paths : list[str]
+        The file paths.
+    key_map : dict
+        A mapping from filename patterns to data keys. The first matching
+        pattern determines the key.
+
+    Returns
+    -------
+    list[str]
+        The data key associated with each file path.
+
+    """
+    if key_map:
+        literals, matches, keys = _compile_key_map(tuple(key_map.items()))
+    data_keys = []
+    for path in paths:
+        k = os.path.basename(path)
+        k = os.path.splitext(k)[0]
+        if key_map:
+            normed_path = os.path.normcase(path)
+            index = literals.get(normed_path, len(keys))
+            # the static directory of a matching pattern is a prefix of the path
+            ends = [i + 1 for i, c in enumerate(normed_path) if c in __SEPARATORS__]
+            for end in [0, *ends]:
+                match = matches.get(normed_path[:end])
+                m = match(normed_path) if match is not None else None
+                if m is not None:
+                    index = min(index, int(m.lastgroup[1:]))
+            if index < len(keys):
+                k = keys[index]
+        __LOGGER__.debug(f'using key "{k}" for file "{path}"')
+        data_keys.append(k)
+    return data_keys
+
+
 def _get_data_key(path: str, key_map: dict) -> str:
     """Private function to get the data key from a file path.
 
@@ -65,7 +725,8 @@ def _get_data_key(path: str, key_map: dict) -> str:
     path : str
         The file path.
     key_map : dict
-        A mapping from filename patterns to data keys.
+        A mapping from filename patterns to data keys. The first matching
+        pattern determines the key.
 
     Returns
     -------
@@ -73,19 +734,241 @@ def _get_data_key(path: str, key_map: dict) -> str:
         The data key associated with the file path.
 
     """
-    k = os.path.basename(path)
-    k = os.path.splitext(k)[0]
-    if key_map:
-        for pat, key in key_map.items():
-            match = fnmatch.fnmatch(path, pat)
-            if match:
-                k = key
-                break
-    __LOGGER__.debug(f'using key "{k}" for file "{path}"')
-    return k
+    return _get_data_keys([path], key_map)[0]
+
+
+# %% classes ##################################################################
+class LazyDataDict(dict):
+    """Dictionary of data, loading its values on first access.
+
+    Keys registered with `set_loader` are backed by a loading function,
+    which is only called once the value is accessed.
+    Loaded values of these keys can be released again using `release`.
+    Values assigned directly behave as in a regular dictionary.
+    """
+
+    def __init__(self, *args: any, **kwds: any) -> None:
+        """Initialize the dictionary.
+
+        Parameters
+        ----------
+        *args : any
+            Positional arguments passed to `dict`.
+        **kwds : any
+            Keyword arguments passed to `dict`.
+
+        """
+        super().__init__(*args, **kwds)
+        self._loaders = {}
+        self._unloaded = set()
+
+    def set_loader(self, key: str, loader: callable) -> None:
+        """Register a key whose value is loaded on first access.
+
+        Parameters
+        ----------
+        key : str
+            The data key.
+        loader : callable
+            Function without arguments returning the value.
+
+        """
+        dict.__setitem__(self, key, None)
+        self._loaders[key] = loader
+        self._unloaded.add(key)
+
+    def get_loader(self, key: str) -> callable | None:
+        """Return the loading function of a key.
+
+        Parameters
+        ----------
+        key : str
+            The data key.
+
+        Returns
+        -------
+        callable | None
+            The loading function or None if the value is not backed by one.
+
+        """
+        return self._loaders.get(key, None)
+
+    def is_loaded(self, key: str) -> bool:
+        """Check if the value of a key is held in memory.
+
+        Parameters
+        ----------
+        key : str
+            The data key.
+
+        Returns
+        -------
+        bool
+            True if the value is loaded.
+
+        """
+        return key in self and key not in self._unloaded
+
+    def release(self, key: str) -> None:
+        """Release a loaded value, so that it is loaded again on next access.
+
+        Values not backed by a loading function are kept.
+
+        Parameters
+        ----------
+        key : str
+            The data key.
+
+        """
+        if key in self._loaders:
+            __LOGGER__.debug(f"releasing data with key '{key}'")
+            dict.__setitem__(self, key, None)
+            self._unloaded.add(key)
+
+    def copy_item(self, key: str, target: dict) -> None:
+        """Copy an item into another dictionary without loading it if possible.
+
+        Parameters
+        ----------
+        key : str
+            The data key.
+        target : dict
+            The dictionary to copy the item to.
+
+        """
+        if key in self._unloaded and isinstance(target, LazyDataDict):
+            target.set_loader(key, self._loaders[key])
+        else:
+            target[key] = self[key]
+
+    def __getitem__(self, key: str) -> any:
+        """Return the value of a key, loading it if necessary."""
+        if key in self._unloaded:
+            __LOGGER__.debug(f"lazy loading data with key '{key}'")
+            dict.__setitem__(self, key, self._loaders[key]())
+            self._unloaded.remove(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key: str, value: any) -> None:
+        """Set the value of a key, dropping its loading function."""
+        dict.__setitem__(self, key, value)
+        self._loaders.pop(key, None)
+        self._unloaded.discard(key)
+
+    def __delitem__(self, key: str) -> None:
+        """Delete a key."""
+        dict.__delitem__(self, key)
+        self._loaders.pop(key, None)
+        self._unloaded.discard(key)
+
+    def __iter__(self) -> any:
+        """Iterate over the keys.
+
+        Overriding this method forces `dict.update` and `dict(...)` to access
+        values via `__getitem__` instead of copying the placeholders.
+        """
+        return dict.__iter__(self)
+
+    def __eq__(self, other: any) -> bool:
+        """Compare the loaded values with another mapping."""
+        return dict(self.items()) == other
+
+    def __ne__(self, other: any) -> bool:
+        """Compare the loaded values with another mapping."""
+        return not self == other
+
+    def __repr__(self) -> str:
+        """Represent the dictionary without loading any values."""
+        items = (
+            f"{k!r}: " + ("<not loaded>" if k in self._unloaded else repr(v))
+            for k, v in dict.items(self)
+        )
+        return f"{type(self).__name__}({{{', '.join(items)}}})"
+
+    def get(self, key: str, default: any = None) -> any:
+        """Return the value of a key if it exists, else default."""
+        return self[key] if key in self else default
+
+    def items(self) -> ItemsView:
+        """Return a view on the items, loading values on iteration."""
+        return ItemsView(self)
+
+    def values(self) -> ValuesView:
+        """Return a view on the values, loading values on iteration."""
+        return ValuesView(self)
+
+    def pop(self, key: str, *default: any) -> any:
+        """Remove a key and return its value."""
+        if key in self:
+            value = self[key]
+            del self[key]
+            return value
+        elif default:
+            return default[0]
+        else:
+            raise KeyError(key)
+
+    def popitem(self) -> tuple[str, any]:
+        """Remove and return the last inserted item."""
+        if not len(self):
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(reversed(dict.keys(self)))
+        return key, self.pop(key)
+
+    def setdefault(self, key: str, default: any = None) -> any:
+        """Return the value of a key and insert default if it does not exist."""
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: any, **kwds: any) -> None:
+        """Update the dictionary from another mapping."""
+        for key, value in dict(*args, **kwds).items():
+            self[key] = value
+
+    def copy(self) -> LazyDataDict:
+        """Return a shallow copy without loading any values."""
+        other = LazyDataDict()
+        for key in self:
+            self.copy_item(key, other)
+        return other
 
 
 # %% public functions ##########################################################
+def register_loader(
+    format: str, fn: callable | None = None, engine: str | None = None
+) -> callable:
+    """Register a loading function for a file-format.
+
+    Can be used as a decorator. Loaders can also be provided by other packages
+    through entry points of the group "dvc_stage.loaders", named after the
+    format and optionally the engine, e.g. "json.orjson".
+
+    Parameters
+    ----------
+    format : str
+        The file-format loaded by the function.
+    fn : callable | None, optional
+        The loading function, called with the file path and the loading
+        arguments. Default is None, which returns a decorator.
+    engine : str | None, optional
+        Register the function as a specific engine of the format, selected
+        via the `engine` argument of `load_data`. Default is None, which
+        registers the default loader of the format.
+
+    Returns
+    -------
+    callable
+        The registered loading function or a decorator if fn is None.
+
+    """
+    if fn is None:
+        return functools.partial(register_loader, format, engine=engine)
+    __LOADERS__[(format, engine)] = fn
+    _get_loading_function.cache_clear()
+    return fn
+
+
 def load_data(
     format: str,
     paths: str | list,
@@ -93,6 +976,15 @@ def load_data(
     import_from: str | None = None,
     quiet: bool = False,
     return_keys: list | None = None,
+    workers: int | None = None,
+    executor: str = "thread",
+    lazy: bool = False,
+    chunksize: int | None = None,
+    cache: bool | dict = False,
+    backend: str = "numpy",
+    engine: str | None = None,
+    dtypes_from_schema: dict | None = None,
+    optimize_dtypes: bool | dict = False,
     **kwds: any,
 ) -> object | dict:
     """Load data from one or more files. Executes substage "loading".
@@ -114,6 +1006,45 @@ def load_data(
     return_keys : list | None, optional
         Provide keys in case custom loading functions return a dict containing
         multiple DataFrames. Default is None.
+    workers : int | None, optional
+        Number of workers used to load multiple files concurrently.
+        Files are loaded sequentially if None or 1. Default is None.
+    executor : str, optional
+        Executor used for concurrent loading, either "thread" or "process".
+        Default is "thread".
+    lazy : bool, optional
+        If True, multiple files are not loaded immediately, but on first access
+        through the returned `LazyDataDict`. Default is False.
+    chunksize : int | None, optional
+        If provided, an iterator over chunks with the given number of rows is
+        returned for each file instead of the loaded data. Default is None.
+    cache : bool | dict, optional
+        Cache parsed DataFrames as Arrow IPC files keyed by the file content and
+        the loading arguments. Can be a dictionary with the optional keys "dir"
+        and "max_size" to configure the cache directory and its maximum size.
+        Least recently used entries are evicted if the cache grows larger.
+        Default is False.
+    backend : str, optional
+        Data backend, either "numpy" or "arrow". With "arrow", feather files are
+        memory mapped and parquet files are read through pyarrow into
+        Arrow-backed DataFrames without copying into NumPy arrays. Other pandas
+        readers are called with `dtype_backend="pyarrow"`. Default is "numpy".
+    engine : str | None, optional
+        Engine used to load the data. Either the name of a loader registered
+        for the format or passed to the pandas reader, e.g. "pyarrow" for
+        "csv". With "auto", the fastest installed engine supporting the given
+        arguments is selected, e.g. "pyarrow" for "csv", "pyarrow" or "orjson"
+        for JSON lines and "calamine" for "excel". Faster engines may infer different
+        dtypes. Default is None, which uses the default loader.
+    dtypes_from_schema : dict | None, optional
+        Pandera schema specification, as passed to `validate_pandera_schema`.
+        The column dtypes of the schema are passed to the loading function as
+        `dtype` and `parse_dates` arguments, which avoids type inference.
+        Default is None.
+    optimize_dtypes : bool | dict, optional
+        Apply the `optimize_dtypes` transformation to each loaded DataFrame
+        to reduce its memory usage. Can be a dictionary of arguments passed to
+        the transformation. Default is False.
     **kwds : any
         Additional keyword arguments to pass to the loading function.
 
@@ -124,25 +1055,60 @@ def load_data(
 
     """
     __LOGGER__.disabled = quiet
+    if format is not None and dtypes_from_schema is not None:
+        fn = _get_loading_function(format, import_from, backend)
+        kwds = _get_schema_kwds(fn, dtypes_from_schema, kwds)
     if isinstance(paths, list):
         __LOGGER__.debug("got a list of paths")
         data = {}
+        load_kwds = dict(
+            format=format,
+            key_map=key_map,
+            import_from=import_from,
+            chunksize=chunksize,
+            cache=cache,
+            backend=backend,
+            engine=engine,
+            optimize_dtypes=optimize_dtypes,
+            **kwds,
+        )
+        if isinstance(cache, dict) and not lazy:
+            # evict once after all keys are loaded instead of after each one
+            load_kwds["cache"] = {**cache, "max_size": None}
 
+        keys = _get_data_keys(paths, key_map)
         with logging_redirect_tqdm():
-            it = tqdm(paths, disable=quiet, leave=False)
-            for path in it:
-                k = _get_data_key(path, key_map)
-                __LOGGER__.debug(
-                    f"loading data from '{os.path.basename(path)}' as key '{k}'"
-                )
-                it.set_description(f"loading data as key '{k}'")
-                data[k] = load_data(
-                    format=format,
-                    paths=path,
-                    key_map=key_map,
-                    import_from=import_from,
-                    **kwds,
-                )
+            if format is not None and chunksize is not None:
+                for k, path in zip(keys, paths):
+                    data[k] = load_data(paths=path, **load_kwds)
+            elif format is not None and lazy:
+                __LOGGER__.debug("deferring data loading until first access")
+                data = LazyDataDict()
+                for k, path in zip(keys, paths):
+                    data.set_loader(
+                        k, functools.partial(load_data, paths=path, **load_kwds)
+                    )
+            elif format is not None and workers is not None and workers > 1:
+                __LOGGER__.debug(f"loading data using {workers} {executor} workers")
+                with get_executor(executor, workers) as pool:
+                    futures = {
+                        k: pool.submit(load_data, paths=path, **load_kwds)
+                        for k, path in zip(keys, paths)
+                    }
+                    it = tqdm(futures.items(), disable=quiet, leave=False)
+                    for k, future in it:
+                        it.set_description(f"loading data as key '{k}'")
+                        data[k] = future.result()
+            else:
+                it = tqdm(list(zip(keys, paths)), disable=quiet, leave=False)
+                for k, path in it:
+                    __LOGGER__.debug(
+                        f"loading data from '{os.path.basename(path)}' as key '{k}'"
+                    )
+                    it.set_description(f"loading data as key '{k}'")
+                    data[k] = load_data(paths=path, **load_kwds)
+        if isinstance(cache, dict) and cache.get("max_size") is not None and not lazy:
+            evict(cache.get("dir"), cache["max_size"])
         return data
     else:
         if format is None:
@@ -152,5 +1118,35 @@ def load_data(
                 return None
         else:
             __LOGGER__.debug(f"loading data from {paths}")
-            fn = _get_loading_function(format, import_from)
-            return fn(paths, **kwds)
+            engine = _select_engine(format, engine, chunksize, kwds)
+            fn = _get_loading_function(format, import_from, backend, engine)
+            if (
+                fn in (pd.read_parquet, _read_parquet_arrow)
+                and kwds.get("filters")
+                and set(kwds.keys()) <= {"columns", "filters"}
+            ):
+                fn = _read_parquet_filtered
+            if engine is not None and _accepts(fn, "engine"):
+                kwds.setdefault("engine", engine)
+            if backend == "arrow" and _accepts(fn, "dtype_backend"):
+                kwds.setdefault("dtype_backend", "pyarrow")
+            if chunksize is not None:
+                data = _iter_chunks(fn, format, paths, chunksize, backend, **kwds)
+            elif cache:
+                data = _load_cached(fn, paths, cache, backend, **kwds)
+                if isinstance(cache, dict) and cache.get("max_size") is not None:
+                    evict(cache.get("dir"), cache["max_size"])
+            else:
+                data = fn(paths, **kwds)
+            if optimize_dtypes:
+                from dvc_stage.transforming import optimize_dtypes as optimize
+
+                opts = (
+                    dict(optimize_dtypes) if isinstance(optimize_dtypes, dict) else {}
+                )
+                opts.setdefault("key", _get_data_key(paths, key_map))
+                if chunksize is not None:
+                    data = (optimize(chunk, **opts) for chunk in data)
+                elif isinstance(data, pd.DataFrame):
+                    data = optimize(data, **opts)
+            return data
@@ -0,0 +1,355 @@
+# -*- time-stamp-pattern: "changed[\s]+:[\s]+%%$"; -*-
+# %% Author ####################################################################
+# file    : planning.py
+# author  : Marcel Arpogaus <znepry.necbtnhf@tznvy.pbz>
+#
+# created : 2026-10-18 10:41:05 (Marcel Arpogaus)
+# changed : 2026-10-18 10:41:05 (Marcel Arpogaus)
+
+# %% Description ###############################################################
+"""planning module."""
+
+# %% imports ###################################################################
+from __future__ import annotations
+
+import ast
+import logging
+
+# %% globals ###################################################################
+__LOGGER__ = logging.getLogger(__name__)
+__COMPARISON_OPERATORS__ = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+    ast.NotIn: "not in",
+}
+__REVERSED_OPERATORS__ = {"<": ">", "<=": ">=", ">": "<", ">=": "<="}
+__COLUMN_TRANSFORMATIONS__ = (
+    "column_transformer_transform",
+    "column_transformer_fit_transform",
+)
+# operators keeping rows with missing values in pandas, but not in Arrow filters
+__NULL_UNSAFE_OPERATORS__ = ("!=", "not in")
+
+
+# %% private functions #########################################################
+def _parse_query(expr: str) -> ast.AST | None:
+    """Parse a query expression.
+
+    Parameters
+    ----------
+    expr : str
+        The query expression as passed to `pd.DataFrame.query`.
+
+    Returns
+    -------
+    ast.AST | None
+        The root node of the expression or None if it is not valid python, e.g.
+        because it references local variables using "@" or uses backticks.
+
+    """
+    try:
+        return ast.parse(expr, mode="eval").body
+    except SyntaxError:
+        return None
+
+
+def _get_query_columns(node: ast.AST) -> set[str]:
+    """Get the names of all columns referenced in a query expression.
+
+    Parameters
+    ----------
+    node : ast.AST
+        The root node of the query expression.
+
+    Returns
+    -------
+    set[str]
+        The referenced column names.
+
+    """
+    functions = {
+        n.func.id
+        for n in ast.walk(node)
+        if isinstance(n, ast.Call) and isinstance(n.func, ast.Name)
+    }
+    return {n.id for n in ast.walk(node) if isinstance(n, ast.Name)} - functions
+
+
+def _get_query_filters(node: ast.AST) -> list[tuple[str, str, any]] | None:
+    """Convert a query expression into a list of conjunctive filters.
+
+    Only conjunctions of comparisons between a column and a literal are
+    supported, e.g. "a > 1 and b in ['x', 'y']".
+
+    Parameters
+    ----------
+    node : ast.AST
+        The root node of the query expression.
+
+    Returns
+    -------
+    list[tuple[str, str, any]] | None
+        Filters in the format `(column, operator, value)` or None if the
+        expression can not be converted.
+
+    """
+    if isinstance(node, ast.BoolOp) and isinstance(node.op, ast.And):
+        operands = node.values
+    elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd):
+        operands = [node.left, node.right]
+    elif isinstance(node, ast.Compare):
+        filters = []
+        left = node.left
+        for op, right in zip(node.ops, node.comparators):
+            op_str = __COMPARISON_OPERATORS__.get(type(op), None)
+            if op_str is None:
+                return None
+            try:
+                if isinstance(left, ast.Name):
+                    filters.append((left.id, op_str, ast.literal_eval(right)))
+                elif isinstance(right, ast.Name) and op_str in __REVERSED_OPERATORS__:
+                    op_str = __REVERSED_OPERATORS__[op_str]
+                    filters.append((right.id, op_str, ast.literal_eval(left)))
+                elif isinstance(right, ast.Name) and op_str in ("==", "!="):
+                    filters.append((right.id, op_str, ast.literal_eval(left)))
+                else:
+                    return None
+            except (ValueError, TypeError, SyntaxError):
+                return None
+            left = right
+        return filters
+    else:
+        return None
+
+    filters = []
+    for operand in operands:
+        operand_filters = _get_query_filters(operand)
+        if operand_filters is None:
+            return None
+        filters += operand_filters
+    return filters
+
+
+def _get_projection(kwds: dict[str, any]) -> list[str] | None:
+    """Get the columns selected by a transformation.
+
+    Parameters
+    ----------
+    kwds : dict[str, any]
+        The transformation parameters.
+
+    Returns
+    -------
+    list[str] | None
+        The selected columns or None if the transformation is no projection.
+
+    """
+    id = kwds["id"]
+    if id == "filter" and isinstance(kwds.get("items"), list):
+        return kwds["items"]
+    elif (
+        id in __COLUMN_TRANSFORMATIONS__
+        and "transformers" in kwds
+        and kwds.get("remainder", "drop") == "drop"
+    ):
+        columns = []
+        for trafo in kwds["transformers"]:
+            if not isinstance(trafo.get("columns"), list):
+                return None
+            columns += trafo["columns"]
+        return columns
+    else:
+        return None
+
+
+# %% classes ###################################################################
+class ColumnSelector:
+    """Select columns by name, ignoring names missing in the data.
+
+    Passed as `usecols` to `pandas.read_csv`, which raises for missing names if
+    given a list, e.g. if the columns are selected by `filter`.
+    """
+
+    def __init__(self, columns: list[str]) -> None:
+        """Create a selector for the given column names.
+
+        Parameters
+        ----------
+        columns : list[str]
+            The column names.
+
+        """
+        self.columns = sorted(columns)
+        self._columns = frozenset(columns)
+
+    def __call__(self, column: str) -> bool:
+        """Return True if the column is selected."""
+        return column in self._columns
+
+    def __repr__(self) -> str:
+        """Return the representation of the selector, used in cache keys."""
+        return f"{self.__class__.__name__}({self.columns!r})"
+
+    def __eq__(self, other: any) -> bool:
+        """Compare the selected columns."""
+        return isinstance(other, ColumnSelector) and self.columns == other.columns
+
+    def __hash__(self) -> int:
+        """Hash the selected columns."""
+        return hash(self._columns)
+
+
+# %% public functions ##########################################################
+def plan_pushdown(
+    transformations: list[dict[str, any]],
+) -> tuple[set[str] | None, list[tuple[str, str, any]]]:
+    """Derive required columns and row filters from a list of transformations.
+
+    The transformations are traversed until the first projection, i.e. a
+    `filter` with `items` or a column transformer dropping the remainder.
+    Only renames, queries and column specific `fillna` and `astype` are allowed
+    before that point, since the columns they use are known.
+    Row filters are derived from leading `query` transformations, which may only
+    be preceded by renames.
+
+    Parameters
+    ----------
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+
+    Returns
+    -------
+    tuple[set[str] | None, list[tuple[str, str, any]]]
+        A tuple (columns, filters) of the required source columns, or None if
+        all columns are required, and the row filters on source columns.
+
+    """
+    aliases = {}
+    used = set()
+    filters = []
+    filters_active = True
+
+    def source(column: str) -> str:
+        return aliases.get(column, column)
+
+    for kwds in transformations:
+        id = kwds["id"]
+        if kwds.get("include") or kwds.get("exclude"):
+            __LOGGER__.debug(f"stop planning at transformation '{id}' with keys")
+            break
+
+        projection = _get_projection(kwds)
+        if projection is not None:
+            return used | {source(c) for c in projection}, filters
+
+        if id == "rename" and isinstance(kwds.get("columns"), dict):
+            renamed = {new: source(old) for old, new in kwds["columns"].items()}
+            for old in kwds["columns"].keys():
+                aliases.pop(old, None)
+            aliases.update(renamed)
+            continue
+        elif id == "query" and isinstance(kwds.get("expr"), str):
+            node = _parse_query(kwds["expr"])
+            if node is None:
+                break
+            columns = _get_query_columns(node)
+            if "index" in columns:
+                break
+            used |= {source(c) for c in columns}
+            if filters_active:
+                query_filters = _get_query_filters(node)
+                if query_filters is not None:
+                    filters += [(source(c), op, v) for c, op, v in query_filters]
+                    continue
+        elif id == "fillna" and isinstance(kwds.get("value"), dict):
+            # columns missing in the data are ignored by fillna
+            pass
+        elif id == "astype" and isinstance(kwds.get("dtype"), dict):
+            used |= {source(c) for c in kwds["dtype"].keys()}
+        else:
+            __LOGGER__.debug(f"stop planning at transformation '{id}'")
+            break
+        filters_active = False
+
+    return None, filters
+
+
+def push_down(
+    load: dict[str, any], transformations: list[dict[str, any]]
+) -> dict[str, any]:
+    """Push required columns and row filters down into the loading parameters.
+
+    Columns are passed as `usecols` for "csv" and as `columns` for "parquet".
+    Columns selected by `filter` may be missing in the data. They are passed
+    to "csv" loaders as `ColumnSelector` and not pushed down for "parquet".
+    Row filters are only supported by the "parquet" loader, which keeps the
+    index labels of the unfiltered rows. Comparisons `!=` and `not in` are not
+    pushed down, since Arrow drops missing values, which `query` keeps.
+    The transformations are still applied, so the result does not change.
+    Parameters already configured by the user are never overwritten.
+
+    Parameters
+    ----------
+    load : dict[str, any]
+        The loading parameters.
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+
+    Returns
+    -------
+    dict[str, any]
+        The updated loading parameters.
+
+    """
+    columns, filters = plan_pushdown(transformations)
+    # columns selected by `filter` are not known to exist
+    strict = columns is None or all(
+        kwds["id"] != "filter"
+        for kwds in transformations
+        if _get_projection(kwds) is not None
+    )
+    filters = [
+        (c, op, v)
+        for c, op, v in filters
+        if op not in __NULL_UNSAFE_OPERATORS__
+        and v is not None
+        and not (isinstance(v, (list, tuple, set)) and None in v)
+    ]
+    load = load.copy()
+    format = load.get("format")
+    if format == "csv":
+        index_col = load.get("index_col")
+        parse_dates = load.get("parse_dates")
+        # further columns required by the loader itself
+        extra = []
+        pending = [index_col, parse_dates]
+        while pending:
+            arg = pending.pop(0)
+            if arg is None or isinstance(arg, bool):
+                continue
+            elif isinstance(arg, (str, int)):
+                extra.append(arg)
+            elif isinstance(arg, dict):
+                # columns combined into new date columns
+                pending += list(arg.values())
+            elif isinstance(arg, (list, tuple)):
+                pending += list(arg)
+        if columns and "usecols" not in load and all(isinstance(c, str) for c in extra):
+            usecols = sorted(set(columns) | set(extra))
+            load["usecols"] = usecols if strict else ColumnSelector(usecols)
+            __LOGGER__.info(f"pushing down columns: {usecols}")
+    elif format == "parquet":
+        if columns and strict and "columns" not in load:
+            load["columns"] = sorted(columns)
+            __LOGGER__.info(f"pushing down columns: {load['columns']}")
+        if filters and "filters" not in load:
+            load["filters"] = filters
+            __LOGGER__.info(f"pushing down filters: {load['filters']}")
+    else:
+        __LOGGER__.debug(f"pushdown not supported for format {format}")
+    return load
@@ -0,0 +1,714 @@
+# -*- time-stamp-pattern: "changed[\s]+:[\s]+%%$"; -*-
+# %% Author ####################################################################
+# file    : polars_engine.py
+# author  : Marcel Arpogaus <znepry.necbtnhf@tznvy.pbz>
+#
+# created : 2026-10-18 18:24:51 (Marcel Arpogaus)
+# changed : 2026-10-18 18:24:51 (Marcel Arpogaus)
+
+# %% Description ###############################################################
+"""polars engine module.
+
+Loads data as polars LazyFrames and translates common transformations into
+lazy expressions, which are executed by the multithreaded polars query engine
+once all data is collected. Transformations without translation continue on
+pandas DataFrames, converted through Arrow.
+"""
+
+# %% imports ###################################################################
+from __future__ import annotations
+
+import json
+import logging
+import re
+
+import numpy as np
+import pandas as pd
+
+from dvc_stage import loading, transforming
+from dvc_stage.planning import _get_query_columns, _get_query_filters, _parse_query
+from dvc_stage.utils import key_is_skipped
+
+# %% globals ###################################################################
+__LOGGER__ = logging.getLogger(__name__)
+# keys of a transformation dictionary without effect on the lazy execution
+__IGNORED_STEP_KEYS__ = {"description", "executor", "memoize", "parallel", "row_local"}
+# load parameters without effect on the lazy execution
+__IGNORED_LOAD_KEYS__ = {"executor", "lazy", "quiet", "workers"}
+# load parameters translated for each format
+__SCAN_KEYS__ = {
+    "csv": {
+        "delimiter",
+        "header",
+        "nrows",
+        "parse_dates",
+        "sep",
+        "skiprows",
+        "usecols",
+    },
+    "feather": {"columns"},
+    "json": {"lines"},
+    "parquet": {"columns", "filters"},
+}
+# column holding the row labels of the pandas index, like in pandas Arrow tables.
+# Other indices are stored in columns with this prefix and their name as json.
+__INDEX_COLUMN__ = "__index_level_0__"
+# strings parsed as missing values by `pandas.read_csv`
+__NA_VALUES__ = [
+    "",
+    "#N/A",
+    "#N/A N/A",
+    "#NA",
+    "-1.#IND",
+    "-1.#QNAN",
+    "-NaN",
+    "-nan",
+    "1.#IND",
+    "1.#QNAN",
+    "<NA>",
+    "N/A",
+    "NA",
+    "NULL",
+    "NaN",
+    "None",
+    "n/a",
+    "nan",
+    "null",
+]
+
+
+# %% private functions #########################################################
+def _is_lazy(data: any) -> bool:
+    """Check if data consists of LazyFrames only.
+
+    Parameters
+    ----------
+    data : any
+        A LazyFrame, a dictionary of data or any other object.
+
+    Returns
+    -------
+    bool
+        True if all data is lazy.
+
+    """
+    import polars as pl
+
+    if isinstance(data, dict):
+        return all(isinstance(v, pl.LazyFrame) for v in data.values())
+    return isinstance(data, pl.LazyFrame)
+
+
+def _get_index_column(name: any) -> str:
+    """Get the name of the column storing an index with the given name.
+
+    Parameters
+    ----------
+    name : any
+        The name of the index.
+
+    Returns
+    -------
+    str
+        The column name.
+
+    """
+    return __INDEX_COLUMN__ + json.dumps(name, default=str)
+
+
+def _get_index_columns(data: any) -> list[str]:
+    """Get the columns of a LazyFrame storing the index.
+
+    Parameters
+    ----------
+    data : any
+        The LazyFrame.
+
+    Returns
+    -------
+    list[str]
+        The names of the index columns.
+
+    """
+    return [c for c in data.collect_schema().names() if c.startswith(__INDEX_COLUMN__)]
+
+
+def _is_comparable(dtype: any, value: any) -> bool:
+    """Check if a column can be compared with a query literal.
+
+    Parameters
+    ----------
+    dtype : any
+        The polars dtype of a numeric or string column.
+    value : any
+        The literal or a list of literals.
+
+    Returns
+    -------
+    bool
+        True if the literals are numbers for numeric columns or strings for
+        string columns.
+
+    """
+    values = value if isinstance(value, (list, tuple, set)) else [value]
+    types = (int, float) if dtype.is_numeric() else (str,)
+    return all(v is None or isinstance(v, types) for v in values)
+
+
+def _get_filter_expression(filters: list[tuple[str, str, any]]) -> any:
+    """Convert conjunctive filters into a polars expression.
+
+    Missing values are handled like in pandas, i.e. they do not satisfy any
+    comparison except "!=" and "not in".
+
+    Parameters
+    ----------
+    filters : list[tuple[str, str, any]]
+        Filters in the format `(column, operator, value)`.
+
+    Returns
+    -------
+    any
+        The polars expression.
+
+    """
+    import polars as pl
+
+    expressions = []
+    for column, op, value in filters:
+        col = pl.col(column)
+        if op == "==":
+            expr = col.eq(value)
+        elif op == "!=":
+            expr = col.ne_missing(value)
+        elif op == "<":
+            expr = col.lt(value)
+        elif op == "<=":
+            expr = col.le(value)
+        elif op == ">":
+            expr = col.gt(value)
+        elif op == ">=":
+            expr = col.ge(value)
+        elif op == "in":
+            expr = col.is_in(list(value))
+        else:
+            expr = (~col.is_in(list(value))).fill_null(True)
+        expressions.append(expr.fill_null(False))
+    return pl.all_horizontal(expressions)
+
+
+def _scan(path: str, format: str, **kwds: any) -> any:
+    """Scan a file lazily.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    format : str
+        The format of the file.
+    **kwds : any
+        Loading parameters, named like the parameters of the pandas readers.
+
+    Returns
+    -------
+    any
+        The LazyFrame or None if the file can not be scanned with the given
+        parameters.
+
+    """
+    import polars as pl
+
+    if format not in __SCAN_KEYS__ or not set(kwds) <= __SCAN_KEYS__[format]:
+        return None
+
+    columns = None
+    if format == "csv":
+        parse_dates = kwds.get("parse_dates", False)
+        # pandas names the columns of files without header by integers, which
+        # are no valid polars column names
+        if kwds.get("header", "infer") not in ("infer", 0):
+            return None
+        data = pl.scan_csv(
+            path,
+            separator=kwds.get("sep", kwds.get("delimiter", ",")),
+            skip_rows=kwds.get("skiprows", 0),
+            n_rows=kwds.get("nrows", None),
+            try_parse_dates=parse_dates is True,
+            null_values=__NA_VALUES__,
+        )
+        if isinstance(parse_dates, list):
+            data = data.with_columns(pl.col(parse_dates).str.to_datetime())
+        columns = kwds.get("usecols", None)
+    elif format == "feather":
+        data = pl.scan_ipc(path)
+        columns = kwds.get("columns", None)
+    elif format == "json":
+        if not kwds.get("lines", False):
+            return None
+        data = pl.scan_ndjson(path)
+    else:
+        import pyarrow.parquet as pq
+
+        data = pl.scan_parquet(path)
+        columns = kwds.get("columns", None)
+        # restore stored indices like pandas
+        metadata = pq.read_schema(path).pandas_metadata or {}
+        index_columns = metadata.get("index_columns", [])
+        if len(index_columns) > 1:
+            return None
+        elif index_columns and isinstance(index_columns[0], dict):
+            # stored range index
+            start, step = index_columns[0]["start"], index_columns[0]["step"]
+            index = pl.int_range(pl.len(), dtype=pl.Int64) * step + start
+            data = data.with_columns(index.alias(__INDEX_COLUMN__))
+        elif index_columns:
+            name = next(
+                c["name"]
+                for c in metadata["columns"]
+                if c["field_name"] == index_columns[0]
+            )
+            data = data.rename({index_columns[0]: _get_index_column(name)})
+
+    names = data.collect_schema().names()
+    index = [c for c in names if c.startswith(__INDEX_COLUMN__)]
+    if not index:
+        # label the rows like the default index of pandas
+        index = [__INDEX_COLUMN__]
+        data = data.with_row_index(__INDEX_COLUMN__)
+    if kwds.get("filters"):
+        data = data.filter(_get_filter_expression(kwds["filters"]))
+    if columns is not None:
+        # keep the column order of the file like pandas
+        if not callable(columns):
+            columns = set(columns).__contains__
+        data = data.select(index + [c for c in names if c not in index and columns(c)])
+    return data
+
+
+def _load(path: str, format: str, **kwds: any) -> any:
+    """Load a single file as LazyFrame.
+
+    Files not supported by the polars scanners are loaded with pandas and
+    converted through Arrow. DataFrames with column names other than strings,
+    e.g. of files without header, are returned as they are.
+
+    Parameters
+    ----------
+    path : str
+        The file path.
+    format : str
+        The format of the file.
+    **kwds : any
+        Loading parameters.
+
+    Returns
+    -------
+    any
+        The LazyFrame or the DataFrame loaded by pandas.
+
+    """
+    import polars as pl
+
+    kwds = {k: v for k, v in kwds.items() if k not in __IGNORED_LOAD_KEYS__}
+    data = _scan(path, format, **kwds)
+    if data is None:
+        __LOGGER__.debug(f"scanning '{path}' not supported, loading with pandas")
+        data = loading.load_data(format=format, paths=path, quiet=True, **kwds)
+        if isinstance(data, pd.DataFrame) and not all(
+            isinstance(c, str) for c in data.columns
+        ):
+            # polars only supports string column names, continue with pandas
+            return data
+        elif isinstance(data, pd.DataFrame):
+            if isinstance(data.index, pd.RangeIndex) and data.index.name is None:
+                data = data.reset_index(names=__INDEX_COLUMN__)
+            elif data.index.nlevels == 1:
+                # other indices keep their dtype and name
+                data = data.reset_index(names=_get_index_column(data.index.name))
+            data = pl.from_pandas(data, include_index=data.index.nlevels > 1).lazy()
+    return data
+
+
+def _split(
+    data: any, by: str, left_split_key: str, right_split_key: str, **kwds: any
+) -> any:
+    """Split a LazyFrame like `transforming.split`.
+
+    Parameters
+    ----------
+    data : any
+        The LazyFrame.
+    by : str
+        Type of split.
+    left_split_key : str
+        Key for left split.
+    right_split_key : str
+        Key for right split.
+    **kwds : any
+        Additional keyword arguments of the split.
+
+    Returns
+    -------
+    any
+        Dictionary containing left and right split or NotImplemented.
+
+    """
+    import polars as pl
+
+    if by == "id" and kwds.get("id_col"):
+        id_col = kwds["id_col"]
+        ids = data.select(pl.col(id_col).unique()).collect().to_series().to_list()
+        selected_ids = transforming._sample_ids(ids, kwds["size"], kwds["seed"])
+        mask = pl.col(id_col).is_in(selected_ids).fill_null(False)
+        left, right = data.filter(mask), data.filter(~mask)
+    elif by == "date_time":
+        column = kwds["date_time_col"]
+        bounds = data.select(
+            pl.col(column).min().alias("min"), pl.col(column).max().alias("max")
+        ).collect()
+        periods = pd.period_range(bounds["min"][0], bounds["max"][0], freq=kwds["freq"])
+        split_point = int(np.round(kwds["size"] * len(periods)))
+        if split_point < len(periods):
+            boundary = periods[split_point].start_time
+        else:
+            boundary = pd.Timestamp.max
+        date_time = pl.col(column)
+        if data.collect_schema()[column].time_zone is not None:
+            # periods are defined on the local wall time
+            date_time = date_time.dt.replace_time_zone(None)
+        # sort and move the date time column first and drop the row labels,
+        # like the pandas split
+        index = _get_index_columns(data)
+        columns = [column] + [
+            c for c in data.collect_schema().names() if c != column and c not in index
+        ]
+        left, right = (
+            data.filter(mask).sort(column, maintain_order=True).select(columns)
+            for mask in (date_time < boundary, date_time >= boundary)
+        )
+    else:
+        return NotImplemented
+    return {left_split_key: left, right_split_key: right}
+
+
+def _combine(
+    data: dict[str, any],
+    include: list[str],
+    exclude: list[str],
+    new_key: str = "combined",
+    key_column: str | None = None,
+    ignore_index: bool = False,
+) -> any:
+    """Concatenate multiple LazyFrames like `transforming.combine`.
+
+    Parameters
+    ----------
+    data : dict[str, any]
+        Dictionary of LazyFrames.
+    include : list[str]
+        Keys to include.
+    exclude : list[str]
+        Keys to exclude.
+    new_key : str, optional
+        New key for concatenated data. Default is "combined".
+    key_column : str | None, optional
+        Name of a categorical column holding the key of each row.
+        Default is None.
+    ignore_index : bool, optional
+        Drop the row labels, so a new range index is created when the data is
+        collected. Default is False.
+
+    Returns
+    -------
+    any
+        The combined LazyFrame or a dictionary containing it.
+
+    """
+    import polars as pl
+
+    data = data.copy()
+    keys = [k for k in data.keys() if not key_is_skipped(k, include, exclude)]
+    frames = [data.pop(k) for k in keys]
+    if ignore_index:
+        frames = [frame.drop(_get_index_columns(frame)) for frame in frames]
+    if key_column is not None:
+        dtype = pl.Enum(keys)
+        frames = [
+            frame.with_columns(pl.lit(k, dtype=dtype).alias(key_column))
+            for k, frame in zip(keys, frames)
+        ]
+    combined = pl.concat(frames, how="diagonal_relaxed")
+    if len(data) > 0:
+        data[new_key] = combined
+        return data
+    return combined
+
+
+def _transform(data: any, id: str, **kwds: any) -> any:
+    """Apply a transformation to a single LazyFrame.
+
+    Parameters
+    ----------
+    data : any
+        The LazyFrame.
+    id : str
+        The transformation id.
+    **kwds : any
+        The parameters of the transformation.
+
+    Returns
+    -------
+    any
+        The transformed LazyFrame, a dictionary of LazyFrames or NotImplemented
+        if the transformation can not be translated.
+
+    """
+    import polars as pl
+
+    index = _get_index_columns(data)
+    names = set(data.collect_schema().names()) - set(index)
+    keys = set(kwds.keys())
+    if id == "rename" and keys == {"columns"} and isinstance(kwds["columns"], dict):
+        return data.rename({k: v for k, v in kwds["columns"].items() if k in names})
+    elif id == "drop" and keys == {"columns"}:
+        columns = kwds["columns"]
+        return data.drop([columns] if isinstance(columns, str) else columns)
+    elif id == "fillna" and keys == {"value"}:
+        value = kwds["value"]
+        if isinstance(value, dict):
+            values = {c: v for c, v in value.items() if c in names}
+        else:
+            values = dict.fromkeys(names, value)
+        schema = data.collect_schema()
+        return data.with_columns(
+            (
+                pl.col(c).fill_nan(v).fill_null(v)
+                if schema[c].is_float()
+                else pl.col(c).fill_null(v)
+            )
+            for c, v in values.items()
+        )
+    elif id == "query" and keys == {"expr"}:
+        node = _parse_query(kwds["expr"])
+        if node is None or not _get_query_columns(node) <= names:
+            return NotImplemented
+        filters = _get_query_filters(node)
+        if filters is None:
+            return NotImplemented
+        schema = data.collect_schema()
+        if not all(
+            schema[c].is_numeric() or schema[c] == pl.String for c, _, _ in filters
+        ):
+            # e.g. date times compared with strings are parsed by pandas
+            return NotImplemented
+        for column, _, value in filters:
+            # polars fails on comparisons of other types only when collecting
+            if not _is_comparable(schema[column], value):
+                raise ValueError(
+                    f"query literal {value!r} can not be compared with column "
+                    f"'{column}' of type {schema[column]}"
+                )
+        return data.filter(_get_filter_expression(filters))
+    elif id == "filter" and len(keys) == 1 and keys <= {"items", "like", "regex"}:
+        if "items" in keys:
+            return data.select(index + [c for c in kwds["items"] if c in names])
+        elif "like" in keys:
+            pattern = f"^.*{re.escape(kwds['like'])}.*$"
+        else:
+            pattern = f"^.*(?:{kwds['regex']}).*$"
+        return data.select(*index, pl.col(pattern).exclude(index))
+    elif id == "split":
+        return _split(data, **kwds)
+    else:
+        return NotImplemented
+
+
+def _apply_transformation(
+    data: any,
+    id: str,
+    include: list[str] = [],
+    exclude: list[str] = [],
+    **kwds: any,
+) -> any:
+    """Apply a transformation to a LazyFrame or a dictionary of LazyFrames.
+
+    Parameters
+    ----------
+    data : any
+        A LazyFrame or a dictionary of LazyFrames.
+    id : str
+        The transformation id.
+    include : list[str], optional
+        Keys to include. Default is [].
+    exclude : list[str], optional
+        Keys to exclude. Default is [].
+    **kwds : any
+        The parameters of the transformation.
+
+    Returns
+    -------
+    any
+        The transformed data or NotImplemented if the transformation can not be
+        translated.
+
+    """
+    if id == "combine":
+        if not isinstance(data, dict):
+            return NotImplemented
+        return _combine(data, include, exclude, **kwds)
+    elif isinstance(data, dict):
+        result = {}
+        for key, value in data.items():
+            if key_is_skipped(key, include, exclude):
+                result[key] = value
+                continue
+            transformed = _transform(value, id, **kwds)
+            if transformed is NotImplemented:
+                return NotImplemented
+            elif isinstance(transformed, dict):
+                result.update(transformed)
+            else:
+                result[key] = transformed
+        return result
+    else:
+        return _transform(data, id, **kwds)
+
+
+# %% public functions ##########################################################
+def load_data(
+    format: str,
+    paths: str | list,
+    key_map: dict | None = None,
+    import_from: str | None = None,
+    **kwds: any,
+) -> any:
+    """Load data from one or more files as polars LazyFrames.
+
+    Parameters
+    ----------
+    format : str
+        The format to load the data from.
+    paths : str | list
+        The file path(s) to load the data from.
+    key_map : dict | None, optional
+        A mapping from filename patterns to data keys. Default is None.
+    import_from : str | None, optional
+        Module name or path where a custom loading function is located. The
+        loaded DataFrames are converted to LazyFrames. Default is None.
+    **kwds : any
+        Additional loading parameters, named like the parameters of the pandas
+        readers. Files are loaded with pandas, if the parameters can not be
+        translated.
+
+    Returns
+    -------
+    any
+        The LazyFrame or a dictionary of LazyFrames.
+
+    """
+    if import_from is not None:
+        kwds["import_from"] = import_from
+    if isinstance(paths, list):
+        keys = loading._get_data_keys(paths, key_map)
+        return {k: _load(path, format, **kwds) for k, path in zip(keys, paths)}
+    return _load(paths, format, **kwds)
+
+
+def apply_transformations(
+    data: any,
+    transformations: list[dict[str, any]],
+    quiet: bool = False,
+    item: str | None = None,
+) -> any:
+    """Apply transformations lazily where possible.
+
+    The transformations "rename", "drop", "fillna", "query" (conjunctions of
+    comparisons), "filter", "split" (by "id" with `id_col` and by "date_time")
+    and "combine" are translated into lazy expressions. Starting with the first
+    transformation that can not be translated, the data is converted to pandas
+    and all remaining transformations are applied by
+    `transforming.apply_transformations`.
+
+    Parameters
+    ----------
+    data : any
+        A LazyFrame or a dictionary of LazyFrames.
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+    quiet : bool, optional
+        Whether to disable logging messages or not. Default is False.
+    item : str | None, optional
+        Item identifier for foreach stages. Default is None.
+
+    Returns
+    -------
+    any
+        The transformed data, either lazy or as pandas DataFrames.
+
+    """
+    __LOGGER__.disabled = quiet
+    for i, kwds in enumerate(transformations):
+        if not _is_lazy(data):
+            break
+        kwds = {k: v for k, v in kwds.items() if k not in __IGNORED_STEP_KEYS__}
+        if kwds.pop("pass_item_to_fn", False):
+            kwds["item"] = item
+        result = _apply_transformation(data, **kwds)
+        if result is NotImplemented:
+            break
+        __LOGGER__.debug(f"translated transformation '{kwds['id']}'")
+        data = result
+    else:
+        return data
+
+    __LOGGER__.info(
+        f"continuing with pandas at transformation '{transformations[i]['id']}'"
+    )
+    return transforming.apply_transformations(
+        collect(data), transformations[i:], quiet=quiet, item=item
+    )
+
+
+def collect(data: any) -> any:
+    """Execute all lazy queries and convert the results to pandas.
+
+    All LazyFrames are collected at once, so common parts of the queries, e.g.
+    the scan of a file that is split, are only executed once. Arrow-backed
+    pandas columns are used to avoid copying the data. The row labels of the
+    loaded files are restored as index.
+
+    Parameters
+    ----------
+    data : any
+        A LazyFrame, a dictionary of data or any other object.
+
+    Returns
+    -------
+    any
+        The data with all LazyFrames converted to pandas DataFrames.
+
+    """
+    import polars as pl
+
+    if isinstance(data, pl.LazyFrame):
+        return collect({None: data})[None]
+    elif isinstance(data, dict):
+        keys = [k for k, v in data.items() if isinstance(v, pl.LazyFrame)]
+        frames = pl.collect_all([data[k] for k in keys])
+        data = data.copy()
+        for k, frame in zip(keys, frames):
+            index = None
+            if __INDEX_COLUMN__ in frame.columns:
+                index = pd.Index(frame[__INDEX_COLUMN__].cast(pl.Int64).to_numpy())
+                frame = frame.drop(__INDEX_COLUMN__)
+            else:
+                for c in frame.columns:
+                    if c.startswith(__INDEX_COLUMN__):
+                        name = json.loads(c[len(__INDEX_COLUMN__) :])
+                        index = pd.Index(frame[c].to_pandas()).rename(name)
+                        frame = frame.drop(c)
+                        break
+            data[k] = frame.to_pandas(use_pyarrow_extension_array=True)
+            if index is not None:
+                data[k].index = index
+    return data
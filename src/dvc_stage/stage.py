@@ -0,0 +1,408 @@
+# -*- time-stamp-pattern: "changed[\s]+:[\s]+%%$"; -*-
+# %% Author ####################################################################
+# file    : stage.py
+# author  : Marcel Arpogaus <znepry.necbtnhf@tznvy.pbz>
+#
+# created : 2026-10-18 14:02:11 (Marcel Arpogaus)
+# changed : 2026-10-18 14:02:11 (Marcel Arpogaus)
+
+# %% Description ###############################################################
+"""stage module."""
+
+# %% imports ###################################################################
+from __future__ import annotations
+
+import copy
+import logging
+
+from dvc_stage.caching import get_file_hash, get_hash
+from dvc_stage.config import ConfigSession, validate_stage_definition
+from dvc_stage.loading import LazyDataDict, load_data
+from dvc_stage.planning import push_down
+from dvc_stage.transforming import (
+    __MULTI_KEY_TRANSFORMATIONS__,
+    apply_transformations,
+    check_partial_fits,
+    check_row_local,
+    dump_partial_fits,
+    reset_partial_fits,
+    resolve_transformations,
+)
+from dvc_stage.utils import get_deps
+from dvc_stage.validating import apply_validations, resolve_validations
+from dvc_stage.writing import check_appendable, write_data
+
+# %% globals ###################################################################
+__LOGGER__ = logging.getLogger(__name__)
+
+
+# %% private functions #########################################################
+def _run_stage_chunked(
+    data: dict | any,
+    transformations: list[dict] | None,
+    validations: list[dict] | None,
+    write: dict | None,
+    item: str | None = None,
+) -> None:
+    """Apply transformations, validations and write output chunk by chunk.
+
+    Parameters
+    ----------
+    data : dict | any
+        Iterator over chunks or dictionary of chunk iterators as returned by
+        `load_data` if `chunksize` is set.
+    transformations : list[dict] | None
+        List of row-local transformations.
+    validations : list[dict] | None
+        List of validations, applied to each chunk separately. Validations
+        comparing rows, e.g. checks for unique values, only see a single chunk.
+    write : dict | None
+        Writer configuration. Output is appended chunk by chunk, so the format
+        must support appending.
+    item : str | None, optional
+        Item identifier for foreach stages. Default is None.
+
+    """
+    if transformations is not None:
+        check_row_local(transformations)
+    if write is not None:
+        check_appendable(write.get("format"))
+
+    if isinstance(data, dict):
+        chunks = ({k: chunk} for k, it in data.items() for chunk in it)
+    else:
+        chunks = iter(data)
+
+    written_keys = set()
+    num_chunks = 0
+    for chunk in chunks:
+        __LOGGER__.debug(f"processing chunk {num_chunks}")
+        num_chunks += 1
+        if transformations is not None:
+            chunk = apply_transformations(
+                chunk, transformations, item=item, partial=True
+            )
+        if validations is not None:
+            apply_validations(chunk, validations, item=item)
+        if write is not None:
+            keys = chunk.keys() if isinstance(chunk, dict) else [None]
+            for k in keys:
+                write_data(
+                    data=chunk if k is None else {k: chunk[k]},
+                    item=item,
+                    append=k in written_keys,
+                    **write,
+                )
+                written_keys.add(k)
+    dump_partial_fits()
+    __LOGGER__.debug(f"processed {num_chunks} chunks")
+
+
+def _check_depth_first(
+    transformations: list[dict] | None, validations: list[dict] | None
+) -> None:
+    """Ensure that all steps can be applied to each key separately.
+
+    Parameters
+    ----------
+    transformations : list[dict] | None
+        List of transformations.
+    validations : list[dict] | None
+        List of validations.
+
+    Raises
+    ------
+    ValueError
+        If any step requires the data of multiple keys or uses an
+        incrementally fitted transformer before all keys have been seen.
+
+    """
+    if transformations is not None:
+        check_partial_fits(transformations)
+    barriers = [
+        kwds.get("description", kwds["id"])
+        for kwds in (transformations or []) + (validations or [])
+        if kwds["id"] in __MULTI_KEY_TRANSFORMATIONS__
+        or kwds.get("pass_dict_to_fn", False)
+    ]
+    if barriers:
+        raise ValueError(
+            f"steps {barriers} require the data of multiple keys and can not be "
+            "applied depth-first. Disable 'depth_first' for this stage."
+        )
+
+
+def _run_stage_depth_first(
+    data: dict,
+    transformations: list[dict] | None,
+    validations: list[dict] | None,
+    write: dict | None,
+    item: str | None = None,
+) -> None:
+    """Apply transformations, validations and write output key by key.
+
+    Each key is released before the next one is processed, so only the data
+    of a single key is kept in memory.
+
+    Parameters
+    ----------
+    data : dict
+        Dictionary of data as returned by `load_data`, preferably a
+        `LazyDataDict`.
+    transformations : list[dict] | None
+        List of transformations, which must not combine multiple keys.
+    validations : list[dict] | None
+        List of validations, which must not combine multiple keys.
+    write : dict | None
+        Writer configuration.
+    item : str | None, optional
+        Item identifier for foreach stages. Default is None.
+
+    """
+    _check_depth_first(transformations, validations)
+
+    for key in list(data.keys()):
+        __LOGGER__.debug(f"processing data with key {key}")
+        key_data = {key: data[key]}
+        if transformations is not None:
+            key_data = apply_transformations(
+                key_data, transformations, item=item, partial=True
+            )
+        if validations is not None:
+            apply_validations(key_data, validations, item=item)
+        if write is not None:
+            write_data(data=key_data, item=item, **write)
+        del key_data
+        if isinstance(data, LazyDataDict):
+            data.release(key)
+        else:
+            del data[key]
+    dump_partial_fits()
+
+
+# %% classes ###################################################################
+class Stage:
+    """A DVC-Stage, parsed once and runnable repeatedly in the same process.
+
+    The stage parameters are read from "params.yaml" and all transformation
+    and validation functions are resolved when the stage is created.
+
+    Examples
+    --------
+    >>> stage = Stage("my_stage")  # doctest: +SKIP
+    >>> for item in ("a", "b"):  # doctest: +SKIP
+    ...     stage.run(item=item)
+
+    """
+
+    def __init__(
+        self, name: str, validate: bool = True, session: ConfigSession | None = None
+    ) -> None:
+        """Parse the parameters of a stage.
+
+        Parameters
+        ----------
+        name : str
+            The name of the DVC stage.
+        validate : bool, optional
+            Whether to validate the stage definition in "dvc.yaml".
+            Default is True.
+        session : ConfigSession | None, optional
+            Session providing the parameters, e.g. shared by multiple stages.
+            Default is None, which creates a new session.
+
+        """
+        # parameters are loaded once for validation and execution
+        session = session or ConfigSession()
+        if validate:
+            validate_stage_definition(name, session)
+
+        stage_params, global_params = session.get_stage_params(name)
+        __LOGGER__.debug(f"{stage_params=}")
+        __LOGGER__.debug(f"{global_params=}")
+
+        self.name = name
+        self.global_params = global_params
+        self.load = copy.deepcopy(stage_params["load"])
+        self.path = self.load.pop("path")
+        self.transformations = stage_params.get("transformations")
+        self.validations = stage_params.get("validations")
+        self.write = stage_params.get("write")
+        self.parallel = stage_params.get("parallel", False)
+        self.executor = stage_params.get("executor", "thread")
+        self.depth_first = stage_params.get("depth_first", False)
+        self.memoize = stage_params.get("memoize", False)
+        self.engine = stage_params.get("engine", "pandas")
+
+        if self.engine not in ("pandas", "polars"):
+            raise ValueError(f"invalid choice for engine: {self.engine}")
+        if self.engine == "polars" and (
+            self.depth_first or self.memoize or "chunksize" in self.load
+        ):
+            raise ValueError(
+                "engine 'polars' does not support 'depth_first', 'memoize' and "
+                "chunked loading"
+            )
+        if self.depth_first and (self.parallel or self.memoize):
+            raise ValueError(
+                "'depth_first' processes one key at a time and does not support "
+                "'parallel' and 'memoize'"
+            )
+
+        if self.load.pop("pushdown", False) and self.transformations is not None:
+            self.load = push_down(self.load, self.transformations)
+        if self.transformations is not None:
+            assert self.write is not None, "No writer configured."
+            resolve_transformations(self.transformations)
+        if self.validations is not None:
+            resolve_validations(self.validations)
+        if self.depth_first:
+            _check_depth_first(self.transformations, self.validations)
+            # load each key only when it is processed
+            self.load.setdefault("lazy", True)
+
+    def __repr__(self) -> str:
+        """Return the representation of the stage."""
+        return f"{self.__class__.__name__}({self.name!r})"
+
+    def get_deps(self, item: str | None = None) -> list[str]:
+        """Get the files loaded by the stage.
+
+        Parameters
+        ----------
+        item : str | None, optional
+            Item identifier for foreach stages. Default is None.
+
+        Returns
+        -------
+        list[str]
+            The dependencies of the stage.
+
+        """
+        deps, _ = get_deps(self.path, self.global_params, item)
+        return deps
+
+    def run(self, item: str | None = None) -> any:
+        """Load, apply transformations, validate and write output.
+
+        Parameters
+        ----------
+        item : str | None, optional
+            Item identifier for foreach stages. Default is None.
+
+        Returns
+        -------
+        any
+            The transformed data or None if the data is processed in chunks or
+            key by key.
+
+        """
+        deps = self.get_deps(item)
+        # incremental fits start from scratch in each run
+        reset_partial_fits()
+
+        if self.engine == "polars":
+            return self._run_polars(deps, item)
+
+        __LOGGER__.info("loading data")
+        data = load_data(paths=deps, **self.load)
+        __LOGGER__.info("all data loaded")
+
+        if self.load.get("chunksize") is not None:
+            __LOGGER__.info("processing data in chunks")
+            _run_stage_chunked(
+                data, self.transformations, self.validations, self.write, item=item
+            )
+            __LOGGER__.info("all chunks processed")
+            return None
+
+        if self.depth_first and isinstance(data, dict):
+            __LOGGER__.info("processing data key by key")
+            _run_stage_depth_first(
+                data, self.transformations, self.validations, self.write, item=item
+            )
+            __LOGGER__.info("all keys processed")
+            return None
+
+        if self.transformations is not None:
+            __LOGGER__.info("applying transformations")
+            data_hash = None
+            if self.memoize:
+                # identify the input by the paths and contents of the files and
+                # the loading parameters to avoid hashing the loaded data
+                data_hash = get_hash(
+                    [(p, get_file_hash(p)) for p in deps], self.load, item
+                )
+            data = apply_transformations(
+                data,
+                self.transformations,
+                item=item,
+                parallel=self.parallel,
+                executor=self.executor,
+                memoize=self.memoize,
+                data_hash=data_hash,
+            )
+            __LOGGER__.info("all transformations applied")
+
+        return self._validate_and_write(data, item)
+
+    def _run_polars(self, deps: list[str], item: str | None = None) -> any:
+        """Load and transform the data lazily using polars.
+
+        Parameters
+        ----------
+        deps : list[str]
+            The files loaded by the stage.
+        item : str | None, optional
+            Item identifier for foreach stages. Default is None.
+
+        Returns
+        -------
+        any
+            The transformed data.
+
+        """
+        from dvc_stage import polars_engine
+
+        __LOGGER__.info("scanning data")
+        data = polars_engine.load_data(paths=deps, **self.load)
+
+        if self.transformations is not None:
+            __LOGGER__.info("planning transformations")
+            data = polars_engine.apply_transformations(
+                data, self.transformations, item=item
+            )
+
+        __LOGGER__.info("collecting data")
+        data = polars_engine.collect(data)
+        __LOGGER__.info("all transformations applied")
+
+        return self._validate_and_write(data, item)
+
+    def _validate_and_write(self, data: any, item: str | None = None) -> any:
+        """Validate and write the transformed data.
+
+        Parameters
+        ----------
+        data : any
+            The transformed data.
+        item : str | None, optional
+            Item identifier for foreach stages. Default is None.
+
+        Returns
+        -------
+        any
+            The data.
+
+        """
+        if self.validations is not None:
+            __LOGGER__.info("applying validations")
+            apply_validations(data, self.validations, item=item)
+            __LOGGER__.info("all validations passed")
+
+        if self.write is not None:
+            __LOGGER__.info("writing data")
+            write_data(data=data, item=item, **self.write)
+            __LOGGER__.info("all data written")
+
+        return data
@@ -0,0 +1,234 @@
+# -*- time-stamp-pattern: "changed[\s]+:[\s]+%%$"; -*-
+# %% Author ####################################################################
+# file    : tracing.py
+# author  : Marcel Arpogaus <znepry.necbtnhf@tznvy.pbz>
+#
+# created : 2026-10-18 16:20:44 (Marcel Arpogaus)
+# changed : 2026-10-18 16:20:44 (Marcel Arpogaus)
+
+# %% Description ###############################################################
+"""tracing module."""
+
+# %% imports ###################################################################
+from __future__ import annotations
+
+import importlib.util
+import logging
+import os
+
+import pandas as pd
+
+from dvc_stage import transforming
+from dvc_stage.transforming import __MULTI_KEY_TRANSFORMATIONS__, __STEP_KEYS__
+from dvc_stage.utils import import_from_string, key_is_skipped
+
+# %% globals ###################################################################
+__LOGGER__ = logging.getLogger(__name__)
+# transformations returning a dictionary of new keys for each DataFrame
+__KEY_TRANSFORMATIONS__ = ("date_time_folds", "partition_by", "split")
+__KEYS_ATTRIBUTE__ = "_dvc_stage_keys"
+
+
+# %% private functions #########################################################
+def _get_params(kwds: dict[str, any]) -> dict[str, any]:
+    """Get the parameters passed to a transformation function.
+
+    Parameters
+    ----------
+    kwds : dict[str, any]
+        The transformation dictionary.
+
+    Returns
+    -------
+    dict[str, any]
+        The parameters without the keys controlling the transformation.
+
+    """
+    return {k: v for k, v in kwds.items() if k not in __STEP_KEYS__}
+
+
+def _get_step_keys_fn(kwds: dict[str, any]) -> callable:
+    """Get a function returning the keys a transformation returns for one key.
+
+    Parameters
+    ----------
+    kwds : dict[str, any]
+        The transformation dictionary.
+
+    Returns
+    -------
+    callable
+        A function of the key and the transformation parameters, returning the
+        new keys or None if the key is kept.
+
+    Raises
+    ------
+    ValueError
+        If the keys returned by the transformation are unknown.
+
+    """
+    id = kwds["id"]
+    if id == "custom":
+        fn = import_from_string(kwds["import_from"])
+        if not hasattr(fn, __KEYS_ATTRIBUTE__):
+            raise ValueError(
+                f"keys returned by '{kwds['import_from']}' are not declared"
+            )
+        return getattr(fn, __KEYS_ATTRIBUTE__)
+    elif id in __KEY_TRANSFORMATIONS__:
+        fn = getattr(transforming, id)
+        if id == "partition_by":
+            return lambda key, **params: list(fn(None, key=key, **params).keys())
+        return lambda _, **params: list(fn(None, **params).keys())
+    elif hasattr(transforming, id) or hasattr(pd.DataFrame, id):
+        return lambda *_, **__: None
+    else:
+        raise ValueError(f'transformation function "{id}" not found')
+
+
+def _trace_step(keys: list[str] | None, kwds: dict[str, any]) -> list[str] | None:
+    """Get the keys of the data after applying a single transformation.
+
+    Parameters
+    ----------
+    keys : list[str] | None
+        Keys of the data or None if the data is a single DataFrame.
+    kwds : dict[str, any]
+        The transformation dictionary.
+
+    Returns
+    -------
+    list[str] | None
+        Keys of the transformed data or None if it is a single DataFrame.
+
+    """
+    id = kwds["id"]
+    include = kwds.get("include", [])
+    exclude = kwds.get("exclude", [])
+    params = _get_params(kwds)
+
+    if id in __MULTI_KEY_TRANSFORMATIONS__:
+        fn = getattr(transforming, id)
+        data = None if keys is None else dict.fromkeys(keys)
+        result = fn(data, include=include, exclude=exclude, **params)
+        return list(result.keys()) if isinstance(result, dict) else None
+
+    keys_fn = _get_step_keys_fn(kwds)
+    if keys is None:
+        return keys_fn(None, **params)
+
+    result = {}
+    for key in keys:
+        new_keys = None
+        if not key_is_skipped(key, include, exclude):
+            new_keys = keys_fn(key, **params)
+        if new_keys is None:
+            result[key] = None
+        else:
+            result.update(dict.fromkeys(new_keys))
+    return list(result.keys())
+
+
+# %% public functions ##########################################################
+def returns_keys(keys: list[str] | callable | None = None) -> callable:
+    """Declare the keys returned by a custom transformation function.
+
+    Stages using only built-in transformations and custom functions declaring
+    their keys are traced without importing data or executing any function.
+
+    Parameters
+    ----------
+    keys : list[str] | callable | None, optional
+        The keys of the dictionary returned by the function or a function of
+        the key of the transformed DataFrame and the transformation parameters
+        returning these keys. Default is None, which declares that a single
+        DataFrame is returned and the key is kept.
+
+    Returns
+    -------
+    callable
+        The decorator.
+
+    Examples
+    --------
+    >>> @returns_keys(lambda key, **kwds: [f"{key}_x", f"{key}_y"])
+    ... def split_xy(data, **kwds):
+    ...     return {f"{kwds['key']}_x": data[["x"]], f"{kwds['key']}_y": data[["y"]]}
+
+    """
+    if keys is None:
+        keys_fn = lambda *_, **__: None  # noqa: E731
+    elif callable(keys):
+        keys_fn = keys
+    else:
+        keys_fn = lambda *_, **__: list(keys)  # noqa: E731
+
+    def decorator(fn: callable) -> callable:
+        setattr(fn, __KEYS_ATTRIBUTE__, keys_fn)
+        return fn
+
+    return decorator
+
+
+def trace_keys(
+    keys: list[str] | None, transformations: list[dict[str, any]]
+) -> list[str] | None:
+    """Derive the keys of the transformed data from the transformation parameters.
+
+    Built-in transformations changing the keys are called without data, all
+    other built-in transformations keep the keys. Custom functions must declare
+    their keys using `returns_keys`.
+
+    Parameters
+    ----------
+    keys : list[str] | None
+        Keys of the loaded data or None if it is a single DataFrame.
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+
+    Returns
+    -------
+    list[str] | None
+        Keys of the transformed data or None if it is a single DataFrame.
+
+    Raises
+    ------
+    ValueError
+        If the keys can not be derived statically.
+
+    """
+    for kwds in transformations:
+        keys = _trace_step(keys, kwds)
+    __LOGGER__.debug(f"traced keys: {keys}")
+    return keys
+
+
+def get_source_stats(transformations: list[dict[str, any]]) -> list[tuple]:
+    """Get the modification time and size of the modules of custom functions.
+
+    The modules are located without importing them.
+
+    Parameters
+    ----------
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+
+    Returns
+    -------
+    list[tuple]
+        A tuple (path, mtime, size) for each module found.
+
+    """
+    stats = []
+    for kwds in transformations:
+        import_from = kwds.get("import_from")
+        if import_from is None or "." not in import_from:
+            continue
+        try:
+            spec = importlib.util.find_spec(import_from.rsplit(".", 1)[0])
+            stat = os.stat(spec.origin)
+        except Exception as e:
+            __LOGGER__.debug(f"unable to locate '{import_from}': {e}")
+            continue
+        stats.append((spec.origin, stat.st_mtime_ns, stat.st_size))
+    return stats
@@ -12,24 +12,178 @@
 # %% imports ###################################################################
 from __future__ import annotations
 
+import collections
+import functools
 import importlib
+import importlib.util
+import inspect
 import logging
 import os
 import pickle
+import sys
 
 import numpy as np
 import pandas as pd
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
-from dvc_stage.utils import import_from_string, key_is_skipped, parse_path
+import dvc_stage
+from dvc_stage.caching import (
+    evict,
+    get_cache_path,
+    get_data_hash,
+    get_hash,
+    read_cached_object,
+    write_cached_object,
+)
+from dvc_stage.loading import LazyDataDict
+from dvc_stage.utils import (
+    get_executor,
+    import_from_string,
+    key_is_skipped,
+    parse_path,
+)
 
 # %% globals ###################################################################
 __COLUMN_TRANSFORMER_CACHE__ = {}
+# recently fitted column transformers by configuration and data hash
+__FITTED_COLUMN_TRANSFORMERS__ = collections.OrderedDict()
+__FITTED_COLUMN_TRANSFORMERS_SIZE__ = 16
+# incrementally fitted transformers by column transformer configuration and item
+__PARTIAL_FITS__ = {}
+# files of incrementally fitted transformers written by `dump_partial_fits`
+__PARTIAL_FIT_DUMPS__ = {}
 __LOGGER__ = logging.getLogger(__name__)
+# keys of a transformation dictionary not passed to the transformation
+__STEP_KEYS__ = {
+    "cache",
+    "description",
+    "dump_to_file",
+    "exclude",
+    "executor",
+    "id",
+    "import_from",
+    "include",
+    "load_from_file",
+    "memoize",
+    "parallel",
+    "pass_dict_to_fn",
+    "pass_item_to_fn",
+    "pass_key_to_fn",
+    "remainder",
+    "row_local",
+    "transformers",
+}
+# keys of a transformation dictionary not affecting its result
+__MEMOIZE_IGNORED_KEYS__ = {"description", "executor", "parallel", "row_local"}
+# transformations operating on all keys of the data at once
+__MULTI_KEY_TRANSFORMATIONS__ = {"combine", "sql"}
+# transformations with side effects or in-process state, which can not be skipped
+__STATEFUL_TRANSFORMATIONS__ = {
+    "column_transformer_fit",
+    "column_transformer_fit_transform",
+    "column_transformer_partial_fit",
+}
+# transformations operating on each row independently, which can be applied to
+# chunks of data
+__ROW_LOCAL_TRANSFORMATIONS__ = {
+    "abs",
+    "add_date_offset_to_column",
+    "add_prefix",
+    "add_suffix",
+    "assign",
+    "assign_expr",
+    "astype",
+    "clip",
+    "column_transformer_partial_fit",
+    "column_transformer_transform",
+    "drop",
+    "dropna",
+    "fillna",
+    "filter",
+    "isna",
+    "mask",
+    "notna",
+    "optimize_dtypes",
+    "partition_by",
+    "query",
+    "rename",
+    "replace",
+    "round",
+    "set_index",
+    "where",
+}
 
 
 # %% private functions #########################################################
+def _get_period_bounds(
+    data: pd.DataFrame, date_time_col: str, freq: str
+) -> tuple[np.ndarray | None, np.ndarray, pd.PeriodIndex]:
+    """Get the row positions of the period boundaries in the sorted data.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to split.
+    date_time_col : str
+        Column containing the date time index.
+    freq : str
+        Frequency of the periods.
+
+    Returns
+    -------
+    tuple[np.ndarray | None, np.ndarray, pd.PeriodIndex]
+        The positions sorting the data, or None if it is already sorted, the
+        position of the first row of each period in the sorted data, followed
+        by the number of rows, and the periods between the first and last date.
+
+    """
+    date_times = data[date_time_col]
+    if date_times.dt.tz is not None:
+        # periods are defined on the local wall time
+        date_times = date_times.dt.tz_localize(None)
+    values = date_times.to_numpy()
+    if date_times.is_monotonic_increasing:
+        order = None
+    else:
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+    periods = pd.period_range(values[0], values[-1], freq=freq)
+    starts = periods.start_time.to_numpy().astype(values.dtype)
+    bounds = np.append(np.searchsorted(values, starts, side="left"), len(values))
+    return order, bounds, periods
+
+
+def _take_rows(
+    data: pd.DataFrame, order: np.ndarray | None, ranges: list[tuple[int, int]]
+) -> pd.DataFrame:
+    """Select the rows within ranges of positions in the sorted data.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data.
+    order : np.ndarray | None
+        The positions sorting the data or None if it is already sorted.
+    ranges : list[tuple[int, int]]
+        Ranges `[start, stop)` of positions in the sorted data.
+
+    Returns
+    -------
+    pd.DataFrame
+        The selected rows in sorted order.
+
+    """
+    ranges = [(a, b) for a, b in ranges if b > a]
+    if order is None and len(ranges) == 1:
+        # slicing does not copy the data
+        return data.iloc[ranges[0][0] : ranges[0][1]]
+    positions = [np.arange(a, b) if order is None else order[a:b] for a, b in ranges]
+    if not positions:
+        return data.iloc[:0]
+    return data.take(np.concatenate(positions))
+
+
 def _date_time_split(
     data: pd.DataFrame, size: float, freq: str, date_time_col: str
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
@@ -53,29 +207,55 @@ def _date_time_split(
     Returns
     -------
     tuple[pd.DataFrame, pd.DataFrame]
-        Tuple containing left and right split data.
+        Tuple containing left and right split data, with the date time column
+        first.
 
     """
-    start_point = data[date_time_col].dt.date.min()
-    end_date = data[date_time_col].dt.date.max()
-
-    data.set_index(date_time_col, inplace=True)
+    order, bounds, periods = _get_period_bounds(data, date_time_col, freq)
 
     # Reserve some data for testing
-    period_range = pd.period_range(start_point, end_date, freq=freq)
-    periods = len(period_range)
-    split_point = int(np.round(size * periods))
-    left_periods = period_range[:split_point]
-    right_periods = period_range[split_point:]
+    split_point = int(np.round(size * len(periods)))
+    left_periods = periods[:split_point]
+    right_periods = periods[split_point:]
     __LOGGER__.debug(f"left split from {left_periods.min()} till {left_periods.max()}")
     __LOGGER__.debug(
         f"right split from {right_periods.min()} till {right_periods.max()}"
     )
 
-    left_data = data.loc[: str(left_periods.max())].reset_index()
-    right_data = data.loc[str(right_periods.min()) :].reset_index()
+    columns = [date_time_col] + [c for c in data.columns if c != date_time_col]
+    left_data = _take_rows(data, order, [(0, bounds[split_point])])
+    right_data = _take_rows(data, order, [(bounds[split_point], bounds[-1])])
+
+    return (
+        left_data[columns].reset_index(drop=True),
+        right_data[columns].reset_index(drop=True),
+    )
+
+
+def _sample_ids(unique_ids: any, size: float, seed: int) -> list[any]:
+    """Select a random subset of ids.
+
+    Parameters
+    ----------
+    unique_ids : any
+        Iterable of unique ids.
+    size : float
+        Fraction of ids to select.
+    seed : int
+        Seed used for id shuffling.
+
+    Returns
+    -------
+    list[any]
+        The selected ids.
 
-    return left_data, right_data
+    """
+    # a dedicated generator reproduces the legacy global seeding without
+    # altering the global random state
+    rng = np.random.RandomState(seed)
+    unique_ids = list(sorted(unique_ids))
+    rng.shuffle(unique_ids)
+    return unique_ids[: int(size * len(unique_ids))]
 
 
 def _id_split(
@@ -100,18 +280,159 @@ def _id_split(
         Tuple containing left and right split data.
 
     """
-    np.random.seed(seed)
     if id_col:
         ids = data[id_col]
     else:
         ids = data.index
-    unique_ids = list(sorted(ids.unique()))
-    np.random.shuffle(unique_ids)
-    selected_ids = unique_ids[: int(size * len(unique_ids))]
+    selected_ids = _sample_ids(ids.unique(), size, seed)
     mask = ids.isin(selected_ids)
     return data[mask], data[~mask]
 
 
+def _id_hash_split(
+    data: pd.DataFrame,
+    size: float,
+    seed: int = 0,
+    id_col: str | None = None,
+    buckets: int = 10000,
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Split data on ids, assigned to a split by a hash of their value.
+
+    Each id is hashed into one of `buckets` buckets and ids in the first
+    `size * buckets` buckets form the left split. In contrast to the "id" split,
+    each row is assigned independently of all other ids, so the assignment of
+    an id does not change when new ids are added and the data may be split
+    in chunks.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to split.
+    size : float
+        Fraction of buckets in the left split.
+    seed : int, optional
+        Seed mixed into the hash of each id. Default is 0.
+    id_col : str | None, optional
+        Column containing id information. Default is None, using the index.
+    buckets : int, optional
+        Number of hash buckets, i.e. the resolution of `size`.
+        Default is 10000.
+
+    Returns
+    -------
+    tuple[pd.DataFrame, pd.DataFrame]
+        Tuple containing left and right split data.
+
+    """
+    if id_col:
+        ids = data[id_col]
+    else:
+        ids = data.index
+    hashes = pd.util.hash_array(np.asarray(ids))
+    # numeric values are hashed without key, hence the seed is mixed in by
+    # hashing again with a salt derived from it
+    salt = pd.util.hash_array(np.array([seed], dtype="u8"))[0]
+    hashes = pd.util.hash_array(hashes ^ salt)
+    mask = hashes % np.uint64(buckets) < np.uint64(round(size * buckets))
+    return data[mask], data[~mask]
+
+
+def _get_union_categories(
+    frames: list[pd.DataFrame],
+) -> dict[str, pd.CategoricalDtype]:
+    """Get the union of the categories of categorical columns.
+
+    Parameters
+    ----------
+    frames : list[pd.DataFrame]
+        DataFrames to concatenate.
+
+    Returns
+    -------
+    dict[str, pd.CategoricalDtype]
+        The unified dtypes of all unordered categorical columns of the first
+        DataFrame whose categories differ between the DataFrames.
+
+    """
+    columns = [
+        column
+        for column, dtype in frames[0].dtypes.items()
+        if isinstance(dtype, pd.CategoricalDtype) and not dtype.ordered
+    ]
+    if not columns:
+        return {}
+    dtypes = [df.dtypes for df in frames]
+
+    categories = {}
+    for column in columns:
+        column_dtypes = [d.get(column) for d in dtypes]
+        if not all(
+            isinstance(d, pd.CategoricalDtype) and not d.ordered for d in column_dtypes
+        ):
+            continue
+        first = column_dtypes[0].categories
+        others = [
+            d.categories for d in column_dtypes[1:] if not d.categories.equals(first)
+        ]
+        if others:
+            categories[column] = pd.CategoricalDtype(first.append(others).unique())
+    return categories
+
+
+def _set_categories(
+    data: pd.DataFrame, categories: dict[str, pd.CategoricalDtype]
+) -> pd.DataFrame:
+    """Set the categories of categorical columns without copying other columns.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The data.
+    categories : dict[str, pd.CategoricalDtype]
+        The new dtypes of categorical columns.
+
+    Returns
+    -------
+    pd.DataFrame
+        A shallow copy of the data with the new categories.
+
+    """
+    data = data.copy(deep=False)
+    for column, dtype in categories.items():
+        if column in data.columns:
+            data[column] = data[column].array.set_categories(dtype.categories)
+    return data
+
+
+def _is_row_local(kwds: dict[str, any]) -> bool:
+    """Check if a transformation operates on each row independently.
+
+    Parameters
+    ----------
+    kwds : dict[str, any]
+        The transformation dictionary.
+
+    Returns
+    -------
+    bool
+        True if the transformation is known to be row-local or is marked with
+        `row_local: true`.
+
+    """
+    if "row_local" in kwds:
+        return kwds["row_local"]
+    elif kwds["id"] == "split":
+        return kwds.get("by") == "id_hash"
+    elif kwds["id"] == "dropna":
+        # dropping columns depends on the values of all rows
+        return kwds.get("axis", 0) in (0, "index", "rows")
+    elif kwds["id"] == "fillna":
+        # propagated or limited fills depend on the preceding rows
+        return kwds.get("method") is None and kwds.get("limit") is None
+    else:
+        return kwds["id"] in __ROW_LOCAL_TRANSFORMATIONS__
+
+
 def _initialize_sklearn_transformer(transformer_class_name: str, **kwds: any) -> any:
     """Create an instance of the specified transformer class.
 
@@ -143,11 +464,38 @@ def _initialize_sklearn_transformer(transformer_class_name: str, **kwds: any) ->
         return transformer_class(**kwds)
 
 
+def _get_column_transformer_key(
+    transformers: list[dict[str, any]], remainder: str = "drop", **kwds: any
+) -> str:
+    """Get a hash of the configuration of a ColumnTransformer.
+
+    Parameters
+    ----------
+    transformers : list[dict[str, any]]
+        List of transformer dictionaries.
+    remainder : str, optional
+        How to handle columns that were not specified in the transformers.
+        Default is "drop".
+    **kwds : any
+        Additional keyword arguments passed to ColumnTransformer initialization.
+
+    Returns
+    -------
+    str
+        The hash of the configuration.
+
+    """
+    return get_hash(transformers, remainder, kwds)
+
+
 def _get_column_transformer(
     transformers: list[dict[str, any]], remainder: str = "drop", **kwds: any
 ) -> any:
     """Build a Scikit-Learn ColumnTransformer from a list of dictionaries.
 
+    The ColumnTransformer is cached by its configuration. Once fitted, the
+    fitted ColumnTransformer is returned.
+
     Parameters
     ----------
     transformers : list[dict[str, any]]
@@ -168,7 +516,9 @@ def _get_column_transformer(
     """
     from sklearn.compose import make_column_transformer
 
-    column_transformer_key = id(transformers)
+    column_transformer_key = _get_column_transformer_key(
+        transformers, remainder, **kwds
+    )
     column_transformer = __COLUMN_TRANSFORMER_CACHE__.get(column_transformer_key, None)
     if column_transformer is None:
         transformers = list(
@@ -192,24 +542,125 @@ def _get_column_transformer(
     return column_transformer
 
 
-def _get_transformation(
-    data: pd.DataFrame | None, id: str, import_from: str | None
+def _fit_column_transformer(
+    data: pd.DataFrame, cache: bool | dict = False, **kwds: any
+) -> any:
+    """Fit a ColumnTransformer or reuse one fitted on the same data.
+
+    Fitted ColumnTransformers are kept in memory by the hash of their
+    configuration and the training data. If `cache` is set, they are also
+    persisted using joblib and reused across processes.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Input data to fit the ColumnTransformer.
+    cache : bool | dict, optional
+        Persist fitted ColumnTransformers in the cache. Can be a dictionary
+        with the optional keys "dir" and "max_size", which is enforced by
+        `apply_transformations`. Default is False.
+    **kwds : any
+        Additional keyword arguments passed to `_get_column_transformer`.
+
+    Returns
+    -------
+    any
+        The fitted ColumnTransformer.
+
+    """
+    from sklearn.base import clone
+
+    column_transformer_key = _get_column_transformer_key(**kwds)
+    key = get_hash(column_transformer_key, get_data_hash(data))
+    cache = cache if isinstance(cache, dict) else {}
+    path = get_cache_path(f"{key}.joblib", "column_transformer", cache.get("dir"))
+
+    column_transformer = __FITTED_COLUMN_TRANSFORMERS__.get(key, None)
+    if column_transformer is not None:
+        __LOGGER__.debug("reusing fitted column transformer")
+        __FITTED_COLUMN_TRANSFORMERS__.move_to_end(key)
+    elif cache:
+        column_transformer = read_cached_object(path)
+        if column_transformer is not None:
+            __LOGGER__.info("loaded fitted column transformer from cache")
+    if column_transformer is None:
+        column_transformer = clone(_get_column_transformer(**kwds)).fit(data)
+        if cache:
+            write_cached_object(column_transformer, path)
+
+    __FITTED_COLUMN_TRANSFORMERS__[key] = column_transformer
+    if len(__FITTED_COLUMN_TRANSFORMERS__) > __FITTED_COLUMN_TRANSFORMERS_SIZE__:
+        __FITTED_COLUMN_TRANSFORMERS__.popitem(last=False)
+    # subsequent transformations with the same configuration use this one
+    __COLUMN_TRANSFORMER_CACHE__[column_transformer_key] = column_transformer
+    return column_transformer
+
+
+def _dump_column_transformer(
+    column_transformer: any, dump_to_file: str, item: str | None = None
+) -> None:
+    """Pickle a fitted ColumnTransformer to a file.
+
+    Parameters
+    ----------
+    column_transformer : any
+        The fitted ColumnTransformer.
+    dump_to_file : str
+        Filepath to write the fitted object to.
+    item : str | None, optional
+        Item identifier for foreach stages. Default is None.
+
+    """
+    dirname = os.path.dirname(dump_to_file)
+    if not os.path.exists(dirname):
+        os.makedirs(dirname)
+    path = parse_path(dump_to_file, item=item)[0]
+    with open(path, "wb+") as file:
+        pickle.dump(column_transformer, file)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_column_transformer(path: str, mtime: float) -> any:
+    """Load a fitted ColumnTransformer from a file.
+
+    Parameters
+    ----------
+    path : str
+        Path of a file written by joblib or pickle.
+    mtime : float
+        Modification time of the file, invalidating cached objects.
+
+    Returns
+    -------
+    any
+        The fitted ColumnTransformer.
+
+    """
+    import joblib
+
+    __LOGGER__.debug(f"loading column transformer from '{path}'")
+    return joblib.load(path, mmap_mode="r")
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_transformation(
+    id: str, import_from: str | None, data_type: type
 ) -> callable:
-    """Return a callable function that transforms a pandas dataframe.
+    """Resolve a transformation function for a given type of data.
 
     Parameters
     ----------
-    data : pd.DataFrame | None
-        Pandas DataFrame to be transformed.
     id : str
         Identifier for the transformation to be applied to the data.
     import_from : str | None
         When id="custom", it is the path to the python function to be imported.
+    data_type : type
+        Type of the data to be transformed.
 
     Returns
     -------
     callable
-        A callable function that transforms a pandas dataframe.
+        A callable function that transforms data of the given type.
 
     Raises
     ------
@@ -221,15 +672,43 @@ def _get_transformation(
         fn = import_from_string(import_from)
     elif id in globals().keys():
         fn = globals()[id]
-    elif hasattr(data, id):
-        fn = lambda _, **kwds: getattr(data, id)(**kwds)  # noqa: E731
-    elif data is None and hasattr(pd.DataFrame, id):
+    elif hasattr(data_type, id):
+        fn = lambda data, **kwds: getattr(data, id)(**kwds)  # noqa: E731
+    elif data_type is type(None) and hasattr(pd.DataFrame, id):
         fn = lambda _, **__: None  # noqa: E731
     else:
         raise ValueError(f'transformation function "{id}" not found')
     return fn
 
 
+def _get_transformation(
+    data: pd.DataFrame | None, id: str, import_from: str | None
+) -> callable:
+    """Return a callable function that transforms a pandas dataframe.
+
+    Parameters
+    ----------
+    data : pd.DataFrame | None
+        Pandas DataFrame to be transformed.
+    id : str
+        Identifier for the transformation to be applied to the data.
+    import_from : str | None
+        When id="custom", it is the path to the python function to be imported.
+
+    Returns
+    -------
+    callable
+        A callable function that transforms a pandas dataframe.
+
+    Raises
+    ------
+    ValueError
+        If the transformation function is not found.
+
+    """
+    return _resolve_transformation(id, import_from, type(data))
+
+
 def _apply_transformation(
     data: pd.DataFrame | dict[str, pd.DataFrame],
     id: str,
@@ -239,6 +718,8 @@ def _apply_transformation(
     quiet: bool = False,
     pass_key_to_fn: bool = False,
     pass_dict_to_fn: bool = False,
+    parallel: bool | int = False,
+    executor: str = "thread",
     **kwds: any,
 ) -> dict[str, pd.DataFrame] | pd.DataFrame:
     """Apply transformation to data.
@@ -264,6 +745,15 @@ def _apply_transformation(
     pass_dict_to_fn : bool, optional
         If True, pass the raw data dict to the transformation function.
         Default is False.
+    parallel : bool | int, optional
+        Transform the DataFrames of a dict concurrently. Can be the number of
+        workers, True uses the default number of workers of the executor.
+        Default is False.
+    executor : str, optional
+        Executor used for concurrent transformations, either "thread" or
+        "process". Threads are always used for column transformers fitted in
+        this process and for transformations writing a `dump_to_file`.
+        Default is "thread".
     **kwds : any
         Additional keyword arguments to pass to the transformation function.
 
@@ -279,36 +769,77 @@ def _apply_transformation(
 
     """
     __LOGGER__.disabled = quiet
-    # Always pass dict to combine function
-    pass_dict_to_fn = id == "combine"
+    # Always pass dict to functions operating on multiple keys
+    pass_dict_to_fn = id in __MULTI_KEY_TRANSFORMATIONS__
+    # Always pass the key to report the memory usage per key and to allow
+    # unique keys of the partitions of multiple DataFrames
+    pass_key_to_fn = pass_key_to_fn or id in ("optimize_dtypes", "partition_by")
+    # incremental fits update shared state and must not run concurrently
+    parallel = parallel and id != "column_transformer_partial_fit"
+    # fitted transformers are cached in this process and must not be fitted
+    # or dumped in child processes
+    if id in __STATEFUL_TRANSFORMATIONS__ or kwds.get("dump_to_file") is not None:
+        executor = "thread"
     if isinstance(data, dict) and not pass_dict_to_fn:
         __LOGGER__.debug("arg is dict")
-        results_dict = {}
-        it = tqdm(data.items(), disable=quiet, leave=False)
-        for key, dat in it:
-            description = f"transforming df with key '{key}'"
-            __LOGGER__.debug(description)
-            it.set_description(description)
-            if key_is_skipped(key, include, exclude):
-                __LOGGER__.debug(f"skipping transformation of DataFrame with key {key}")
-                transformed_data = dat
-            else:
-                __LOGGER__.debug(f"transforming DataFrame with key {key}")
-                if pass_key_to_fn:
-                    kwds.update({"key": key})
-                transformed_data = _apply_transformation(
-                    data=dat,
+        results_dict = LazyDataDict() if isinstance(data, LazyDataDict) else {}
+        transform_keys = dict.fromkeys(
+            key for key in data.keys() if not key_is_skipped(key, include, exclude)
+        )
+        futures = {}
+        pool = None
+        if parallel and len(transform_keys) > 1:
+            workers = None if parallel is True else parallel
+            __LOGGER__.debug(f"transforming data using {executor} workers")
+            pool = get_executor(executor, workers)
+            for key in transform_keys:
+                futures[key] = pool.submit(
+                    _apply_transformation,
+                    data=data[key],
                     id=id,
                     import_from=import_from,
-                    exclude=exclude,
-                    include=include,
                     quiet=quiet,
-                    **kwds,
+                    **(dict(kwds, key=key) if pass_key_to_fn else kwds),
                 )
-            if isinstance(transformed_data, dict):
-                results_dict.update(transformed_data)
-            else:
-                results_dict[key] = transformed_data
+        it = tqdm(data.keys(), disable=quiet, leave=False)
+        try:
+            for key in it:
+                description = f"transforming df with key '{key}'"
+                __LOGGER__.debug(description)
+                it.set_description(description)
+                if key not in transform_keys:
+                    __LOGGER__.debug(
+                        f"skipping transformation of DataFrame with key {key}"
+                    )
+                    if isinstance(data, LazyDataDict):
+                        # pass skipped data on without loading it
+                        data.copy_item(key, results_dict)
+                        continue
+                    transformed_data = data[key]
+                elif key in futures:
+                    # results are merged in the order of the keys
+                    transformed_data = futures.pop(key).result()
+                else:
+                    __LOGGER__.debug(f"transforming DataFrame with key {key}")
+                    if pass_key_to_fn:
+                        kwds.update({"key": key})
+                    transformed_data = _apply_transformation(
+                        data=data[key],
+                        id=id,
+                        import_from=import_from,
+                        exclude=exclude,
+                        include=include,
+                        quiet=quiet,
+                        **kwds,
+                    )
+                if isinstance(transformed_data, dict):
+                    results_dict.update(transformed_data)
+                else:
+                    results_dict[key] = transformed_data
+        finally:
+            if pool is not None:
+                # pending transformations are cancelled if one of them failed
+                pool.shutdown(cancel_futures=True)
         it.set_description("all transformations applied")
         return results_dict
     else:
@@ -328,6 +859,87 @@ def _apply_transformation(
             raise e
 
 
+def _get_step_version(kwds: dict[str, any]) -> str | None:
+    """Get the version of the function applied by a transformation.
+
+    Parameters
+    ----------
+    kwds : dict[str, any]
+        The transformation dictionary.
+
+    Returns
+    -------
+    str | None
+        The source code of custom and built-in functions, if available, and
+        the version of the package providing the function. Built-in functions
+        are versioned by dvc-stage, so changes of their helpers invalidate
+        memoized results with each release.
+
+    """
+    id = kwds["id"]
+    if id == "custom":
+        fn = import_from_string(kwds["import_from"])
+        package = getattr(fn, "__module__", None) or ""
+        module = sys.modules.get(package.split(".")[0])
+        version = getattr(module, "__version__", None)
+    elif id in globals().keys():
+        fn = globals()[id]
+        version = dvc_stage.__version__
+    else:
+        return pd.__version__
+    try:
+        return f"{version}\n{inspect.getsource(fn)}"
+    except (OSError, TypeError):
+        return version
+
+
+def _get_step_keys(
+    transformations: list[dict[str, any]], data_hash: str, item: str | None
+) -> list[str | None]:
+    """Get the cache keys of the results of all transformations.
+
+    The key of each step is derived from the key of the previous step, the
+    configuration of the step and the version of its function.
+    Steps after a transformation with side effects, in-process state or
+    external inputs, like fitting a column transformer or loading a fitted one
+    from a file, can not be resumed and have no key.
+    Such transformations can be marked using `memoize: false`.
+
+    Parameters
+    ----------
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+    data_hash : str
+        Hash of the input data.
+    item : str | None
+        Item identifier for foreach stages.
+
+    Returns
+    -------
+    list[str | None]
+        The cache key of each step or None if it can not be memoized.
+
+    """
+    keys = []
+    key = data_hash
+    for kwds in transformations:
+        if key is not None and (
+            not kwds.get("memoize", True)
+            or kwds.get("dump_to_file") is not None
+            or kwds.get("load_from_file") is not None
+            or kwds["id"] in __STATEFUL_TRANSFORMATIONS__
+        ):
+            __LOGGER__.debug(f"memoization stops at transformation '{kwds['id']}'")
+            key = None
+        if key is not None:
+            config = {
+                k: v for k, v in kwds.items() if k not in __MEMOIZE_IGNORED_KEYS__
+            }
+            key = get_hash(key, config, _get_step_version(kwds), item)
+        keys.append(key)
+    return keys
+
+
 # %% public functions ##########################################################
 def split(
     data: pd.DataFrame, by: str, left_split_key: str, right_split_key: str, **kwds: any
@@ -339,7 +951,7 @@ def split(
     data : pd.DataFrame
         Data to split.
     by : str
-        Type of split.
+        Type of split, one of "id", "id_hash" or "date_time".
     left_split_key : str
         Key for left split.
     right_split_key : str
@@ -364,6 +976,8 @@ def split(
     else:
         if by == "id":
             left_split, right_split = _id_split(data, **kwds)
+        elif by == "id_hash":
+            left_split, right_split = _id_hash_split(data, **kwds)
         elif by == "date_time":
             left_split, right_split = _date_time_split(data, **kwds)
         else:
@@ -372,14 +986,222 @@ def split(
         return {left_split_key: left_split, right_split_key: right_split}
 
 
+def partition_by(
+    data: pd.DataFrame,
+    by: str | list[str],
+    values: list[any] | None = None,
+    key_format: str | None = None,
+    dropna: bool = True,
+    key: str | None = None,
+) -> dict[str, pd.DataFrame | None]:
+    """Split data into one key per value of one or more columns.
+
+    All groups are determined in a single pass over the data.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to split.
+    by : str | list[str]
+        Column or list of columns to group by.
+    values : list[any] | None, optional
+        Group values to return, in this order. Values missing in the data
+        result in empty DataFrames and all other groups are dropped. Required
+        for tracing, so the output files are known. Lists of values are used for
+        multiple columns. Default is None, which returns all groups.
+    key_format : str | None, optional
+        Format of the keys with the fields "value", the values of the group
+        joined by "_", "key", the key of the data, and the names of the
+        columns in `by`. Default is None, which uses "{key}_{value}" if the
+        data has a key, so the partitions of multiple DataFrames do not
+        overwrite each other, and "{value}" otherwise.
+    dropna : bool, optional
+        Drop rows with missing values in `by`. Default is True.
+    key : str | None, optional
+        Key of the data. Default is None.
+
+    Returns
+    -------
+    dict[str, pd.DataFrame | None]
+        Dictionary containing the data of each group.
+
+    Raises
+    ------
+    ValueError
+        If values are not given during tracing.
+
+    """
+    columns = [by] if isinstance(by, str) else list(by)
+    if key_format is None:
+        key_format = "{value}" if key is None else "{key}_{value}"
+
+    def get_key(value: any) -> str:
+        value = tuple(value) if isinstance(value, (tuple, list)) else (value,)
+        fields = dict(zip(columns, value))
+        value_str = "_".join(map(str, value))
+        return key_format.format(value=value_str, key=key, **fields)
+
+    if data is None:
+        __LOGGER__.debug("tracing partition_by function")
+        if values is None:
+            raise ValueError(
+                "partition_by requires 'values' to determine the outputs of the stage"
+            )
+        return {get_key(v): None for v in values}
+
+    indices = data.groupby(
+        by if isinstance(by, str) else columns, sort=True, dropna=dropna
+    ).indices
+    __LOGGER__.debug(f"partitioning data into {len(indices)} groups")
+    if values is None:
+        return {get_key(v): data.take(i) for v, i in indices.items()}
+    else:
+        empty = np.array([], dtype=np.intp)
+        return {
+            get_key(v): data.take(
+                indices.get(tuple(v) if isinstance(v, list) else v, empty)
+            )
+            for v in values
+        }
+
+
+def date_time_folds(
+    data: pd.DataFrame,
+    date_time_col: str,
+    freq: str,
+    folds: int,
+    method: str = "expanding",
+    test_periods: int = 1,
+    train_periods: int | None = None,
+    gap: int = 0,
+    left_split_key: str = "train",
+    right_split_key: str = "test",
+    key_format: str = "{split}_{fold}",
+) -> dict[str, pd.DataFrame | None]:
+    """Split data along the date time axis into multiple folds.
+
+    The data is sorted once and the boundaries of all periods are located by
+    binary search, so all folds are created in a single pass.
+
+    Supported methods are:
+
+    - "expanding": The last `folds * test_periods` periods are split into test
+      windows of `test_periods` periods. Each fold is trained on all periods
+      before its test window.
+    - "rolling": Like "expanding", but the training window is limited to the
+      last `train_periods` periods before the test window.
+    - "kfold": The periods are split into `folds` contiguous blocks. Each block
+      is used once for testing and all other periods for training.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Data to split.
+    date_time_col : str
+        Column containing the date time index.
+    freq : str
+        Frequency of the periods, e.g. "D" or "M".
+    folds : int
+        Number of folds.
+    method : str, optional
+        Either "expanding", "rolling" or "kfold". Default is "expanding".
+    test_periods : int, optional
+        Number of periods in each test window. Default is 1.
+    train_periods : int | None, optional
+        Number of periods in each training window, required for "rolling".
+        Default is None.
+    gap : int, optional
+        Number of periods between training and test windows excluded from
+        training. Default is 0.
+    left_split_key : str, optional
+        Name of the training splits used in `key_format`. Default is "train".
+    right_split_key : str, optional
+        Name of the test splits used in `key_format`. Default is "test".
+    key_format : str, optional
+        Format of the keys, with the fields "split" and "fold".
+        Default is "{split}_{fold}".
+
+    Returns
+    -------
+    dict[str, pd.DataFrame | None]
+        Dictionary containing the training and test data of each fold.
+
+    Raises
+    ------
+    ValueError
+        If an invalid method is provided or there are not enough periods.
+
+    """
+    if method not in ("expanding", "rolling", "kfold"):
+        raise ValueError(f"invalid choice for method: {method}")
+    if method == "rolling" and train_periods is None:
+        raise ValueError("method 'rolling' requires 'train_periods'")
+
+    keys = [
+        (
+            key_format.format(split=left_split_key, fold=fold),
+            key_format.format(split=right_split_key, fold=fold),
+        )
+        for fold in range(folds)
+    ]
+    if data is None:
+        __LOGGER__.debug("tracing date_time_folds function")
+        return {k: None for fold_keys in keys for k in fold_keys}
+
+    order, bounds, periods = _get_period_bounds(data, date_time_col, freq)
+    num_periods = len(periods)
+
+    if method == "kfold":
+        edges = np.linspace(0, num_periods, folds + 1).round().astype(int)
+        windows = list(zip(edges[:-1], edges[1:]))
+    else:
+        first = num_periods - folds * test_periods
+        windows = [
+            (first + fold * test_periods, first + (fold + 1) * test_periods)
+            for fold in range(folds)
+        ]
+    if windows[0][0] < 0 or any(a >= b for a, b in windows):
+        raise ValueError(
+            f"{num_periods} periods are not enough for {folds} folds of "
+            f"{test_periods} periods"
+        )
+
+    result = {}
+    for (train_key, test_key), (start, stop) in zip(keys, windows):
+        if method == "kfold":
+            train_ranges = [
+                (0, max(start - gap, 0)),
+                (min(stop + gap, num_periods), num_periods),
+            ]
+        else:
+            train_stop = max(start - gap, 0)
+            train_start = 0
+            if train_periods is not None:
+                train_start = max(train_stop - train_periods, 0)
+            train_ranges = [(train_start, train_stop)]
+        __LOGGER__.debug(f"{test_key} from {periods[start]} till {periods[stop - 1]}")
+        result[train_key] = _take_rows(
+            data, order, [(bounds[a], bounds[b]) for a, b in train_ranges]
+        )
+        result[test_key] = _take_rows(data, order, [(bounds[start], bounds[stop])])
+
+    return result
+
+
 def combine(
     data: dict[str, pd.DataFrame],
     include: list[str],
     exclude: list[str],
     new_key: str = "combined",
+    key_column: str | None = None,
+    ignore_index: bool = False,
 ) -> pd.DataFrame | None:
     """Concatenate multiple DataFrames.
 
+    Unordered categorical columns with different categories are converted to
+    the union of all categories before concatenation, so they are not
+    converted to object columns.
+
     Parameters
     ----------
     data : dict[str, pd.DataFrame]
@@ -390,6 +1212,12 @@ def combine(
         Keys to exclude.
     new_key : str, optional
         New key for concatenated data. Default is "combined".
+    key_column : str | None, optional
+        Name of a categorical column holding the key of each row.
+        Default is None.
+    ignore_index : bool, optional
+        Create a new range index instead of concatenating the indices, which
+        is considerably faster for many DataFrames. Default is False.
 
     Returns
     -------
@@ -397,15 +1225,24 @@ def combine(
         The combined DataFrame.
 
     """
+    keys = []
     to_combine = []
     for key in list(data.keys()):
         if not key_is_skipped(key, include, exclude):
+            keys.append(key)
             to_combine.append(data.pop(key))
 
     if to_combine[0] is None:
         combined = None
     else:
-        combined = pd.concat(to_combine)
+        categories = _get_union_categories(to_combine)
+        if categories:
+            __LOGGER__.debug(f"unifying categories of columns {list(categories)}")
+            to_combine = [_set_categories(df, categories) for df in to_combine]
+        combined = pd.concat(to_combine, ignore_index=ignore_index)
+        if key_column is not None:
+            codes = np.repeat(np.arange(len(keys)), [len(df) for df in to_combine])
+            combined[key_column] = pd.Categorical.from_codes(codes, categories=keys)
 
     if len(data) > 0:
         data[new_key] = combined
@@ -415,14 +1252,93 @@ def combine(
     return data
 
 
+def sql(
+    data: pd.DataFrame | dict[str, pd.DataFrame],
+    query: str | dict[str, str],
+    include: list[str] = [],
+    exclude: list[str] = [],
+    new_key: str = "sql",
+    table: str = "data",
+    config: dict[str, any] | None = None,
+) -> pd.DataFrame | dict[str, pd.DataFrame] | None:
+    """Run a SQL query on the data using an in-process DuckDB connection.
+
+    Each key of the data is registered as a table without copying the data.
+    DuckDB executes queries multi-threaded and can spill to disk, if a
+    `memory_limit` and `temp_directory` are configured. Indices of the
+    DataFrames are not visible to the query.
+
+    Parameters
+    ----------
+    data : pd.DataFrame | dict[str, pd.DataFrame]
+        A DataFrame or a dictionary of DataFrames.
+    query : str | dict[str, str]
+        The query or a dictionary of queries, whose results are stored under
+        the keys of the dictionary.
+    include : list[str], optional
+        Keys registered as tables. Default is [], which registers all keys.
+    exclude : list[str], optional
+        Keys not registered as tables. Default is [].
+    new_key : str, optional
+        Key of the result of a single query. Default is "sql".
+    table : str, optional
+        Table name of the data, if it is a single DataFrame. Default is "data".
+    config : dict[str, any] | None, optional
+        DuckDB configuration, e.g. `threads`, `memory_limit` or
+        `temp_directory`. Default is None.
+
+    Returns
+    -------
+    pd.DataFrame | dict[str, pd.DataFrame] | None
+        The input data with the results of the queries added. The result of a
+        single query on a single DataFrame is returned directly.
+
+    """
+    queries = {new_key: query} if isinstance(query, str) else query
+
+    if isinstance(data, dict):
+        tables = {
+            k: v for k, v in data.items() if not key_is_skipped(k, include, exclude)
+        }
+    else:
+        tables = {table: data}
+
+    if any(v is None for v in tables.values()):
+        __LOGGER__.debug("tracing sql function")
+        results = dict.fromkeys(queries)
+    else:
+        import duckdb
+
+        with duckdb.connect(config=config or {}) as connection:
+            for name, df in tables.items():
+                connection.register(name, df)
+            results = {}
+            for key, q in queries.items():
+                __LOGGER__.debug(f"executing query for key '{key}'")
+                results[key] = connection.execute(q).df()
+
+    if isinstance(data, dict):
+        data = data.copy()
+        data.update(results)
+        return data
+    elif isinstance(query, str):
+        return results[new_key]
+    else:
+        return results
+
+
 def column_transformer_fit(
     data: pd.DataFrame,
     dump_to_file: str | None = None,
     item: str | None = None,
+    cache: bool | dict = False,
     **kwds: any,
 ) -> pd.DataFrame | None:
     """Fit the data to the input.
 
+    ColumnTransformers already fitted on the same data with the same
+    configuration are reused.
+
     Parameters
     ----------
     data : pd.DataFrame
@@ -431,6 +1347,11 @@ def column_transformer_fit(
         Filepath to write fitted object to. Default is None.
     item : str | None, optional
         Item identifier for foreach stages. Default is None.
+    cache : bool | dict, optional
+        Persist the fitted ColumnTransformer in `.dvc/tmp/dvc-stage` using
+        joblib. Can be a dictionary with the optional keys "dir" and
+        "max_size", which is enforced once all transformations are applied.
+        Default is False.
     **kwds : any
         Additional keyword arguments passed to `_get_column_transformer`.
 
@@ -443,22 +1364,19 @@ def column_transformer_fit(
     if data is None:
         return None
     else:
-        column_transfomer = _get_column_transformer(**kwds)
-        column_transfomer = column_transfomer.fit(data)
+        column_transfomer = _fit_column_transformer(data, cache=cache, **kwds)
 
         if dump_to_file is not None:
-            dirname = os.path.dirname(dump_to_file)
-            if not os.path.exists(dirname):
-                os.makedirs(dirname)
-            path = parse_path(dump_to_file, item=item)[0]
-            with open(path, "wb+") as file:
-                pickle.dump(column_transfomer, file)
+            _dump_column_transformer(column_transfomer, dump_to_file, item)
 
         return data
 
 
 def column_transformer_transform(
-    data: pd.DataFrame, **kwds: any
+    data: pd.DataFrame,
+    load_from_file: str | None = None,
+    item: str | None = None,
+    **kwds: any,
 ) -> pd.DataFrame | None:
     """Apply the column transformer to the input data.
 
@@ -466,6 +1384,13 @@ def column_transformer_transform(
     ----------
     data : pd.DataFrame
         Input data to transform.
+    load_from_file : str | None, optional
+        Filepath of a fitted ColumnTransformer, e.g. written by
+        `column_transformer_fit` using `dump_to_file` in another stage.
+        Default is None, which uses the ColumnTransformer last fitted with the
+        same configuration.
+    item : str | None, optional
+        Item identifier for foreach stages. Default is None.
     **kwds : any
         Additional keyword arguments to pass to the column transformer.
 
@@ -478,13 +1403,152 @@ def column_transformer_transform(
     if data is None:
         return None
     else:
-        column_transfomer = _get_column_transformer(**kwds)
+        if load_from_file is not None:
+            path = parse_path(load_from_file, item=item)[0]
+            column_transfomer = _load_column_transformer(
+                os.path.abspath(path), os.path.getmtime(path)
+            )
+        else:
+            column_transfomer = _get_column_transformer(**kwds)
         column_transfomer.set_output(transform="pandas")
 
         data = column_transfomer.transform(data)
         return data
 
 
+def column_transformer_partial_fit(
+    data: pd.DataFrame,
+    dump_to_file: str | None = None,
+    item: str | None = None,
+    **kwds: any,
+) -> pd.DataFrame | None:
+    """Incrementally fit the ColumnTransformer to a chunk of the input.
+
+    All transformers must support `partial_fit`, e.g. StandardScaler,
+    MinMaxScaler or IncrementalPCA. Each call updates the transformers with
+    the given chunk or key of the data, so the training data never needs to
+    be in memory at once. The ColumnTransformer fitted on all data seen so far
+    is used by subsequent transformations with the same configuration.
+    It is written to `dump_to_file` once all data has been seen, see
+    `dump_partial_fits`.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Chunk of the input data to fit the ColumnTransformer.
+    dump_to_file : str | None, optional
+        Filepath to write fitted object to. Default is None.
+    item : str | None, optional
+        Item identifier for foreach stages. Default is None.
+    **kwds : any
+        Additional keyword arguments passed to `_get_column_transformer`.
+
+    Returns
+    -------
+    pd.DataFrame | None
+        The input data unchanged.
+
+    Raises
+    ------
+    ValueError
+        If a transformer does not support `partial_fit`.
+
+    """
+    if data is None:
+        return None
+
+    from sklearn.base import clone
+
+    try:
+        from sklearn.frozen import FrozenEstimator
+    except ImportError as e:
+        raise ImportError(
+            "column_transformer_partial_fit requires scikit-learn >= 1.6"
+        ) from e
+
+    column_transformer_key = _get_column_transformer_key(**kwds)
+    state = __PARTIAL_FITS__.get((column_transformer_key, item), None)
+    if state is None:
+        template = clone(_get_column_transformer(**kwds))
+        estimators = {
+            name: transformer
+            for name, transformer, _ in template.transformers
+            if transformer not in ("drop", "passthrough")
+        }
+        for name, transformer in estimators.items():
+            if not hasattr(transformer, "partial_fit"):
+                raise ValueError(f'transformer "{name}" does not support partial_fit')
+        state = (template, estimators)
+        __PARTIAL_FITS__[(column_transformer_key, item)] = state
+    template, estimators = state
+
+    for name, _, columns in template.transformers:
+        if name in estimators:
+            estimators[name].partial_fit(data[columns])
+
+    # wrap the fitted transformers, so only the column selection is fitted
+    column_transformer = clone(template)
+    column_transformer.transformers = [
+        (name, FrozenEstimator(estimators[name]) if name in estimators else t, c)
+        for name, t, c in template.transformers
+    ]
+    column_transformer.fit(data.head(1))
+    __COLUMN_TRANSFORMER_CACHE__[column_transformer_key] = column_transformer
+
+    if dump_to_file is not None:
+        __PARTIAL_FIT_DUMPS__[(dump_to_file, item)] = column_transformer
+
+    return data
+
+
+def dump_partial_fits() -> None:
+    """Write incrementally fitted column transformers to their `dump_to_file`.
+
+    Called once after all chunks or keys of the data have been transformed.
+    """
+    for (dump_to_file, item), column_transformer in __PARTIAL_FIT_DUMPS__.items():
+        __LOGGER__.debug(f"writing incrementally fitted transformer '{dump_to_file}'")
+        _dump_column_transformer(column_transformer, dump_to_file, item)
+    __PARTIAL_FIT_DUMPS__.clear()
+
+
+def reset_partial_fits() -> None:
+    """Discard the state of all incrementally fitted column transformers."""
+    __PARTIAL_FITS__.clear()
+    __PARTIAL_FIT_DUMPS__.clear()
+
+
+def check_partial_fits(transformations: list[dict[str, any]]) -> None:
+    """Ensure no transformer is applied before its incremental fit is complete.
+
+    If the data is processed chunk by chunk or key by key, transformers
+    following `column_transformer_partial_fit` would only use the statistics
+    of the data seen so far.
+
+    Parameters
+    ----------
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+
+    Raises
+    ------
+    ValueError
+        If `column_transformer_transform` follows an incremental fit.
+
+    """
+    partial_fit = None
+    for kwds in transformations:
+        description = kwds.get("description", kwds["id"])
+        if kwds["id"] == "column_transformer_partial_fit":
+            partial_fit = partial_fit or description
+        elif partial_fit is not None and kwds["id"] == "column_transformer_transform":
+            raise ValueError(
+                f"transformation '{description}' uses the transformers of "
+                f"'{partial_fit}' before all data has been seen. Apply it in a "
+                "separate stage using 'load_from_file'."
+            )
+
+
 def column_transformer_fit_transform(
     data: pd.DataFrame, dump_to_file: str | None = None, **kwds: any
 ) -> pd.DataFrame | None:
@@ -508,7 +1572,8 @@ def column_transformer_fit_transform(
         The transformed data.
 
     """
-    data = column_transformer_fit(data, dump_to_file, **kwds)
+    cache = kwds.pop("cache", False)
+    data = column_transformer_fit(data, dump_to_file, cache=cache, **kwds)
     data = column_transformer_transform(data, **kwds)
     return data
 
@@ -540,11 +1605,227 @@ def add_date_offset_to_column(
     return data
 
 
+def assign_expr(
+    data: pd.DataFrame,
+    columns: dict[str, str],
+    engine: str | None = None,
+) -> pd.DataFrame | None:
+    """Assign columns computed from expressions, e.g. "a * b + log(c)".
+
+    All expressions are evaluated in a single call to `DataFrame.eval`, which
+    uses numexpr, if it is installed, to evaluate them multi-threaded without
+    intermediate arrays. Expressions may use columns assigned before.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The input pandas DataFrame.
+    columns : dict[str, str]
+        Mapping of column names to expressions.
+    engine : str | None, optional
+        The engine used by `DataFrame.eval`, either "numexpr" or "python".
+        Default is None, which uses numexpr if it is installed.
+
+    Returns
+    -------
+    pd.DataFrame | None
+        A copy of the DataFrame with the assigned columns.
+
+    Raises
+    ------
+    ValueError
+        If a column name is not a valid identifier.
+
+    """
+    invalid = [name for name in columns.keys() if not str(name).isidentifier()]
+    if invalid:
+        raise ValueError(f"column names {invalid} are not valid identifiers")
+    if data is None:
+        return None
+
+    expr = "\n".join(f"{name} = {e}" for name, e in columns.items())
+    return data.eval(expr, engine=engine)
+
+
+def optimize_dtypes(
+    data: pd.DataFrame,
+    downcast: bool = True,
+    max_category_ratio: float = 0.5,
+    string_dtype: str | None = "string[pyarrow]",
+    key: str | None = None,
+) -> pd.DataFrame | None:
+    """Reduce the memory usage of a DataFrame by converting column dtypes.
+
+    Integer columns are downcast to the smallest integer type of the same
+    signedness holding their values and float columns to float32 if this is
+    lossless. The memory saved is reported as info message.
+    String columns with few unique values are converted to categoricals, all
+    other string columns to Arrow-backed strings.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The input pandas DataFrame.
+    downcast : bool, optional
+        Whether to downcast numeric columns. Default is True.
+    max_category_ratio : float, optional
+        Maximum ratio of unique values to rows of string columns converted to
+        categoricals. Set to 0 to disable. Default is 0.5.
+    string_dtype : str | None, optional
+        Dtype of the remaining string columns. Default is "string[pyarrow]",
+        which is only used if pyarrow is installed. None keeps the dtype.
+    key : str | None, optional
+        Data key used in the reported memory usage. Default is None.
+
+    Returns
+    -------
+    pd.DataFrame | None
+        The DataFrame with optimized dtypes.
+
+    """
+    if data is None:
+        return None
+
+    # measuring the memory usage of string columns is expensive
+    report = not __LOGGER__.disabled and __LOGGER__.isEnabledFor(logging.INFO)
+    if report:
+        before = data.memory_usage(deep=True)
+    dtypes = {}
+    if downcast:
+        ints = data.select_dtypes(include=[np.signedinteger, np.unsignedinteger])
+        if len(ints.columns) > 0:
+            mins, maxs = ints.min(), ints.max()
+            for col in ints.columns:
+                current = ints[col].dtype
+                if np.issubdtype(current, np.unsignedinteger):
+                    candidates = (np.uint8, np.uint16, np.uint32)
+                else:
+                    candidates = (np.int8, np.int16, np.int32)
+                for dtype in candidates:
+                    if np.dtype(dtype).itemsize >= current.itemsize:
+                        break
+                    info = np.iinfo(dtype)
+                    if info.min <= mins[col] and maxs[col] <= info.max:
+                        dtypes[col] = dtype
+                        break
+        floats = data.select_dtypes(include=[np.float64])
+        if len(floats.columns) > 0:
+            downcasted = floats.astype(np.float32)
+            lossless = ((downcasted == floats) | floats.isna()).all()
+            dtypes.update(dict.fromkeys(lossless.index[lossless], np.float32))
+
+    strings = [
+        col
+        for col, dtype in data.dtypes.items()
+        if isinstance(dtype, pd.StringDtype)
+        or (
+            pd.api.types.is_object_dtype(dtype)
+            and pd.api.types.infer_dtype(data[col]) == "string"
+        )
+    ]
+    if len(strings) > 0 and len(data) > 0:
+        ratios = data[strings].nunique() / len(data)
+        for col in strings:
+            if ratios[col] <= max_category_ratio:
+                dtypes[col] = "category"
+            elif (
+                string_dtype is not None
+                and data[col].dtype != string_dtype
+                and importlib.util.find_spec("pyarrow") is not None
+            ):
+                dtypes[col] = string_dtype
+
+    if dtypes:
+        data = data.astype(dtypes)
+    if report:
+        # only the converted columns are measured again
+        after = before.copy()
+        converted = list(dtypes.keys())
+        after[converted] = data[converted].memory_usage(deep=True, index=False)
+        before, after = before.sum(), after.sum()
+        __LOGGER__.info(
+            f"optimized dtypes{f' of key {key}' if key else ''}: "
+            f"{before} bytes -> {after} bytes ({before / max(after, 1):.1f}x)"
+        )
+    return data
+
+
+def check_row_local(transformations: list[dict[str, any]]) -> None:
+    """Ensure that all transformations can be applied to chunks of data.
+
+    Transformations are considered row-local if they are known to operate on
+    each row independently or if they are marked with `row_local: true`.
+
+    Parameters
+    ----------
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+
+    Raises
+    ------
+    ValueError
+        If any transformation requires the full data or uses an incrementally
+        fitted transformer before all chunks have been seen.
+
+    """
+    barriers = [
+        kwds.get("description", kwds["id"])
+        for kwds in transformations
+        if not _is_row_local(kwds)
+    ]
+    check_partial_fits(transformations)
+    if barriers:
+        raise ValueError(
+            f"transformations {barriers} require the full data and can not be "
+            "applied to chunks. Mark row-local transformations with "
+            "'row_local: true' or disable chunked loading."
+        )
+
+
+def resolve_transformations(transformations: list[dict[str, any]]) -> None:
+    """Resolve all transformation functions and column transformers up front.
+
+    Resolved functions and column transformers are cached, so they are not
+    looked up again when the transformations are applied. Methods of data
+    other than DataFrames are resolved on first use.
+
+    Parameters
+    ----------
+    transformations : list[dict[str, any]]
+        A list of transformation dictionaries.
+
+    """
+    for kwds in transformations:
+        id = kwds["id"]
+        try:
+            _resolve_transformation(id, kwds.get("import_from"), pd.DataFrame)
+        except ValueError:
+            __LOGGER__.debug(f'transformation "{id}" is not a DataFrame method')
+        if id in (
+            "column_transformer_fit",
+            "column_transformer_transform",
+            "column_transformer_fit_transform",
+            "column_transformer_partial_fit",
+        ):
+            if "transformers" not in kwds:
+                continue
+            _get_column_transformer(
+                kwds["transformers"],
+                kwds.get("remainder", "drop"),
+                **{k: v for k, v in kwds.items() if k not in __STEP_KEYS__},
+            )
+
+
 def apply_transformations(
     data: pd.DataFrame | dict[str, pd.DataFrame],
     transformations: list[dict[str, any]],
     quiet: bool = False,
     item: str | None = None,
+    parallel: bool | int = False,
+    executor: str = "thread",
+    memoize: bool | dict = False,
+    data_hash: str | None = None,
+    partial: bool = False,
 ) -> dict[str, pd.DataFrame] | pd.DataFrame:
     """Apply a list of transformations to a DataFrame or dict of DataFrames.
 
@@ -562,6 +1843,27 @@ def apply_transformations(
         Whether to suppress the progress bar and logging output. Default is False.
     item : str | None, optional
         Item identifier for foreach stages. Default is None.
+    parallel : bool | int, optional
+        Default for transformations without a `parallel` key. Transform the
+        DataFrames of a dict concurrently, using the given number of workers
+        or the default number of workers of the executor if True.
+        Default is False.
+    executor : str, optional
+        Default for transformations without an `executor` key, either "thread"
+        or "process". Default is "thread".
+    memoize : bool | dict, optional
+        Cache the result of each transformation and resume from the last
+        cached result of an unchanged prefix of the transformations. Can be a
+        dictionary with the optional keys "dir", the cache directory, and
+        "max_size", the maximum size of the cache, e.g. "10GB".
+        Default is False.
+    data_hash : str | None, optional
+        Hash identifying the input data for memoization. Default is None, which
+        hashes the content of the data.
+    partial : bool, optional
+        Whether the data is only a chunk or key of the input. Incrementally
+        fitted transformers are then not written to their `dump_to_file`
+        until `dump_partial_fits` is called. Default is False.
 
     Returns
     -------
@@ -570,13 +1872,41 @@ def apply_transformations(
 
     """
     __LOGGER__.disabled = quiet
-    it = tqdm(transformations, disable=quiet, leave=False)
     __LOGGER__.debug("applying transformations")
     __LOGGER__.debug(transformations)
+
+    start = 0
+    if memoize:
+        cache = memoize if isinstance(memoize, dict) else {}
+        if data_hash is None:
+            data_hash = get_data_hash(data)
+        step_keys = _get_step_keys(transformations, data_hash, item)
+        cache_paths = [
+            None
+            if key is None
+            else get_cache_path(f"{key}.pkl", "transform", cache.get("dir"))
+            for key in step_keys
+        ]
+        for i in reversed(range(len(cache_paths))):
+            if cache_paths[i] is not None:
+                cached = read_cached_object(cache_paths[i])
+                if cached is not None:
+                    __LOGGER__.info(f"resuming after cached transformation {i + 1}")
+                    data = cached
+                    start = i + 1
+                    break
+
+    it = tqdm(transformations[start:], disable=quiet, leave=False)
     with logging_redirect_tqdm():
-        for kwds in it:
+        for i, kwds in enumerate(it, start):
+            # do not alter the configuration, which may be applied repeatedly
+            kwds = kwds.copy()
             desc = kwds.pop("description", kwds["id"])
             it.set_description(desc)
+            kwds.pop("row_local", None)
+            kwds.pop("memoize", None)
+            kwds.setdefault("parallel", parallel)
+            kwds.setdefault("executor", executor)
             if kwds.pop("pass_item_to_fn", False):
                 kwds["item"] = item
             data = _apply_transformation(
@@ -584,4 +1914,18 @@ def apply_transformations(
                 quiet=quiet,
                 **kwds,
             )
+            if memoize and cache_paths[i] is not None:
+                # store a plain dict to not pickle the loaders of lazy data
+                obj = dict(data.items()) if isinstance(data, dict) else data
+                write_cached_object(obj, cache_paths[i])
+    # evict once after all transformations instead of after each cached result
+    caches = [memoize] + [kwds.get("cache") for kwds in transformations[start:]]
+    for cache_dir, max_size in {
+        (c.get("dir"), c["max_size"])
+        for c in caches
+        if isinstance(c, dict) and c.get("max_size") is not None
+    }:
+        evict(cache_dir, max_size)
+    if not partial:
+        dump_partial_fits()
     return data
@@ -12,15 +12,20 @@
 # %% imports ###################################################################
 from __future__ import annotations
 
+import fnmatch
+import functools
 import glob
 import importlib
 import logging
+import os
 import re
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 
 import pandas as pd
 
 # %% globals ###################################################################
 __LOGGER__ = logging.getLogger(__name__)
+__GLOB_CACHE__ = {}
 
 
 # %% functions #################################################################
@@ -79,11 +84,207 @@ def flatten_dict(
     return dict(items)
 
 
+def _flatten_paths(path: str | list) -> list[str]:
+    """Flatten a possibly nested list of paths.
+
+    Parameters
+    ----------
+    path : str | list
+        A path or a nested list of paths.
+
+    Returns
+    -------
+    list[str]
+        The flat list of paths.
+
+    """
+    if isinstance(path, list):
+        return [q for p in path for q in _flatten_paths(p)]
+    else:
+        return [path]
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a shell-style pattern into a regular expression.
+
+    Parameters
+    ----------
+    pattern : str
+        The pattern.
+
+    Returns
+    -------
+    re.Pattern
+        The compiled regular expression.
+
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _scandir(path: str) -> dict[str, bool]:
+    """List a directory.
+
+    Parameters
+    ----------
+    path : str
+        The directory path.
+
+    Returns
+    -------
+    dict[str, bool]
+        Mapping from entry names to whether the entry is a directory.
+
+    """
+    try:
+        with os.scandir(path or os.curdir) as it:
+            return {e.name: e.is_dir() for e in it}
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return {}
+
+
+def _get_mtime(path: str) -> int | None:
+    """Get the modification time of a directory.
+
+    Parameters
+    ----------
+    path : str
+        The directory path.
+
+    Returns
+    -------
+    int | None
+        The modification time in nanoseconds or None if it does not exist.
+
+    """
+    try:
+        return os.stat(path or os.curdir).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _resolve_globs(
+    patterns: tuple[str],
+) -> tuple[dict[str, list[str]], dict[str, int | None]]:
+    """Resolve multiple glob patterns, scanning each directory only once.
+
+    Patterns are split into path components and expanded level by level,
+    sharing the directory listings between all patterns. Both "/" and the
+    separator of the platform separate path components.
+    The semantics follow `glob.glob` without recursive wildcards, i.e. wildcards
+    do not match hidden files unless the pattern component starts with a dot.
+
+    Parameters
+    ----------
+    patterns : tuple[str]
+        The glob patterns.
+
+    Returns
+    -------
+    tuple[dict[str, list[str]], dict[str, int | None]]
+        Mapping from each pattern to the matching paths and the modification
+        times of all directories the result depends on.
+
+    """
+    results = {p: [] for p in patterns}
+    mtimes = {}
+    # directory -> list of (pattern, remaining path components)
+    pending = {}
+    for pattern in patterns:
+        normalized = pattern.replace(os.altsep, os.sep) if os.altsep else pattern
+        if not glob.has_magic(pattern):
+            dirname = os.path.dirname(pattern)
+            mtimes[dirname] = _get_mtime(dirname)
+            if os.path.lexists(pattern):
+                results[pattern].append(pattern)
+        elif normalized.endswith(os.sep) or "~" in pattern:
+            results[pattern] = glob.glob(pattern)
+            # never reuse results of patterns handled by glob
+            mtimes[None] = None
+        else:
+            components = normalized.split(os.sep)
+            i = next(i for i, c in enumerate(components) if glob.has_magic(c))
+            base = os.sep.join(components[:i])
+            if i > 0 and not base:
+                base = os.sep
+            pending.setdefault(base, []).append((pattern, components[i:]))
+
+    while pending:
+        next_pending = {}
+        for base, items in pending.items():
+            mtimes[base] = _get_mtime(base)
+            entries = None
+            for pattern, components in items:
+                component, rest = components[0], components[1:]
+                if glob.has_magic(component):
+                    if entries is None:
+                        entries = _scandir(base)
+                    regex = _compile_pattern(component)
+                    names = [
+                        n
+                        for n in entries.keys()
+                        if regex.match(n)
+                        and (component.startswith(".") or not n.startswith("."))
+                    ]
+                elif not component:
+                    names = [component] if os.path.isdir(base) else []
+                elif entries is not None:
+                    names = [component] if component in entries else []
+                else:
+                    names = [component]
+                    if not os.path.lexists(os.path.join(base, component)):
+                        names = []
+                for name in names:
+                    path = os.path.join(base, name)
+                    if not rest:
+                        results[pattern].append(path)
+                    elif entries is None or entries.get(name, True):
+                        next_pending.setdefault(path, []).append((pattern, rest))
+        pending = next_pending
+
+    return results, mtimes
+
+
+def resolve_globs(patterns: list[str]) -> dict[str, list[str]]:
+    """Resolve multiple glob patterns at once.
+
+    Results are memoized per process and reused as long as the modification
+    times of all involved directories are unchanged.
+
+    Parameters
+    ----------
+    patterns : list[str]
+        The glob patterns.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Mapping from each pattern to the matching paths.
+
+    """
+    patterns = tuple(dict.fromkeys(patterns))
+    cache_key = (os.getcwd(), patterns)
+    cached = __GLOB_CACHE__.get(cache_key, None)
+    if cached is not None:
+        results, mtimes = cached
+        if None not in mtimes and all(
+            _get_mtime(d) == mtime for d, mtime in mtimes.items()
+        ):
+            __LOGGER__.debug("reusing resolved glob patterns")
+            return results
+
+    results, mtimes = _resolve_globs(patterns)
+    __GLOB_CACHE__[cache_key] = (results, mtimes)
+    return results
+
+
 def get_deps(
     path: str | list[str], params: dict[str, any], item: str | None = None
 ) -> tuple[list[str], set[str]]:
     """Get dependencies given a path pattern and parameter values.
 
+    All glob patterns are resolved together and memoized per process.
+
     Parameters
     ----------
     path : str | list[str]
@@ -108,19 +309,22 @@ def get_deps(
     """
     deps = []
     param_keys = set()
-    if isinstance(path, list):
-        for p in path:
-            rdeps, rparam_keys = get_deps(p, params, item)
-            deps += rdeps
-            param_keys |= rparam_keys
-    else:
-        path, matches = parse_path(path, item=item, **params)
+    patterns = []
+    for p in _flatten_paths(path):
+        p, matches = parse_path(p, item=item, **params)
         param_keys |= matches
         if "item" in matches and item is None:
-            deps = [path]
+            deps.append(p)
             param_keys.remove("item")
         else:
-            deps = glob.glob(path)
+            patterns.append(p)
+
+    resolved = resolve_globs(patterns)
+    for pattern in patterns:
+        assert len(resolved[pattern]) > 0, (
+            f'Dependencies not found for path "{pattern}".\nIs DVC Pipeline up to date?'
+        )
+        deps += resolved[pattern]
 
     deps = list(sorted(set(deps)))
 
@@ -209,3 +413,35 @@ def key_is_skipped(key: str, include: list[str], exclude: list[str]) -> bool:
     )
     __LOGGER__.debug(f'key "{key}" is {"" if cond else "not "}skipped')
     return cond
+
+
+def get_executor(executor: str, workers: int | None = None) -> Executor:
+    """Create a pool executor to run tasks concurrently.
+
+    Parameters
+    ----------
+    executor : str
+        Type of the executor, either "thread" or "process".
+    workers : int | None, optional
+        Maximum number of workers. Default is None, which lets
+        `concurrent.futures` choose the number of workers.
+
+    Returns
+    -------
+    Executor
+        The pool executor.
+
+    Raises
+    ------
+    ValueError
+        If the executor type is unsupported.
+
+    """
+    if executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers)
+    elif executor == "process":
+        return ProcessPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(
+            f"executor {executor} unsupported. can either be 'thread' or 'process'."
+        )
@@ -13,6 +13,7 @@
 # %% imports ###################################################################
 from __future__ import annotations
 
+import functools
 import inspect
 import logging
 
@@ -28,17 +29,18 @@ __LOGGER__ = logging.getLogger(__name__)
 
 
 # %% global functions ##########################################################
-def _get_validation(id: str, data: any, import_from: str) -> callable:
-    """Return the validation function with the given ID.
+@functools.lru_cache(maxsize=256)
+def _resolve_validation(id: str, import_from: str | None, data_type: type) -> callable:
+    """Resolve a validation function for a given type of data.
 
     Parameters
     ----------
     id : str
         ID of the validation function to get.
-    data : Any
-        Data source to be validated.
-    import_from : str
+    import_from : str | None
         Import path to the custom validation function (if ``id="custom"``).
+    data_type : type
+        Type of the data to be validated.
 
     Returns
     -------
@@ -53,8 +55,8 @@ def _get_validation(id: str, data: any, import_from: str) -> callable:
     """
     if id == "custom":
         fn = import_from_string(import_from)
-    elif hasattr(data, id):
-        fn = lambda _, **kwds: getattr(data, id)(**kwds)  # noqa E731
+    elif hasattr(data_type, id):
+        fn = lambda data, **kwds: getattr(data, id)(**kwds)  # noqa E731
     elif id in globals().keys():
         fn = globals()[id]
     else:
@@ -62,6 +64,32 @@ def _get_validation(id: str, data: any, import_from: str) -> callable:
     return fn
 
 
+def _get_validation(id: str, data: any, import_from: str) -> callable:
+    """Return the validation function with the given ID.
+
+    Parameters
+    ----------
+    id : str
+        ID of the validation function to get.
+    data : Any
+        Data source to be validated.
+    import_from : str
+        Import path to the custom validation function (if ``id="custom"``).
+
+    Returns
+    -------
+    callable
+        The validation function.
+
+    Raises
+    ------
+    ValueError
+        If the validation function with the given ID is not found.
+
+    """
+    return _resolve_validation(id, import_from, type(data))
+
+
 def _apply_validation(
     data: any,
     id: str,
@@ -118,8 +146,8 @@ def _apply_validation(
     """
     if isinstance(data, dict) and not pass_dict_to_fn:
         __LOGGER__.debug("arg is dict")
-        it = tqdm(data.items(), leave=False)
-        for key, df in it:
+        it = tqdm(data.keys(), leave=False)
+        for key in it:
             description = f"validating df with key '{key}'"
             __LOGGER__.debug(description)
             it.set_description(description)
@@ -127,7 +155,7 @@ def _apply_validation(
                 if pass_key_to_fn:
                     kwds.update({"key": key})
                 _apply_validation(
-                    data=df,
+                    data=data[key],
                     id=id,
                     import_from=import_from,
                     reduction=reduction,
@@ -173,26 +201,22 @@ def _apply_validation(
 
 
 # %% public functions ##########################################################
-def validate_pandera_schema(
-    data: pd.DataFrame, schema: dict | str, **kwargs: dict[str, any]
-) -> bool:
-    """Validate a Pandas DataFrame against a Pandera schema.
+def get_pandera_schema(schema: dict, **kwargs: dict[str, any]) -> any:
+    """Get a Pandera schema from its specification.
 
     Parameters
     ----------
-    data : pd.DataFrame
-        Pandas DataFrame to be validated.
-    schema : dict | str
-        Schema to validate against. Can be specified as a dictionary with
-        keys "import_from", "from_yaml", "from_json", or a string that specifies
-        a file path to a serialized Pandera schema object.
+    schema : dict
+        Schema specification. Can be specified as a dictionary with keys
+        "import_from", "from_yaml", "from_json", or a dictionary containing a
+        serialized Pandera schema object.
     **kwargs : dict[str, any]
         Optional keyword arguments passed to the Pandera schema function.
 
     Returns
     -------
-    bool
-        True if the DataFrame validates against the schema.
+    pa.DataFrameSchema
+        The Pandera schema.
 
     Raises
     ------
@@ -230,11 +254,63 @@ def validate_pandera_schema(
         raise ValueError(
             f"Schema has invalid type '{type(schema)}', dictionary expected."
         )
+    return schema
+
+
+def validate_pandera_schema(
+    data: pd.DataFrame, schema: dict | str, **kwargs: dict[str, any]
+) -> bool:
+    """Validate a Pandas DataFrame against a Pandera schema.
+
+    Parameters
+    ----------
+    data : pd.DataFrame
+        Pandas DataFrame to be validated.
+    schema : dict | str
+        Schema to validate against. Can be specified as a dictionary with
+        keys "import_from", "from_yaml", "from_json", or a string that specifies
+        a file path to a serialized Pandera schema object.
+    **kwargs : dict[str, any]
+        Optional keyword arguments passed to the Pandera schema function.
+
+    Returns
+    -------
+    bool
+        True if the DataFrame validates against the schema.
+
+    Raises
+    ------
+    ValueError
+        If the schema is of an invalid type or if the schema cannot be
+        deserialized from the provided dictionary or file.
 
+    """
+    schema = get_pandera_schema(schema, **kwargs)
     schema.validate(data)
     return True
 
 
+def resolve_validations(validations: list[dict[str, any]]) -> None:
+    """Resolve all validation functions up front.
+
+    Resolved functions are cached, so they are not looked up again when the
+    validations are applied. Methods of data other than DataFrames are
+    resolved on first use.
+
+    Parameters
+    ----------
+    validations : list[dict[str, any]]
+        A list of validation dictionaries.
+
+    """
+    for kwds in validations:
+        id = kwds["id"]
+        try:
+            _resolve_validation(id, kwds.get("import_from"), pd.DataFrame)
+        except ValueError:
+            __LOGGER__.debug(f'validation "{id}" is not a DataFrame method')
+
+
 def apply_validations(
     data: any,
     validations: list[dict],
@@ -257,6 +333,8 @@ def apply_validations(
     it = tqdm(validations, leave=False)
     with logging_redirect_tqdm():
         for kwds in it:
+            # do not alter the configuration, which may be applied repeatedly
+            kwds = kwds.copy()
             it.set_description(kwds.pop("description", kwds["id"]))
             if kwds.pop("pass_item_to_fn", False):
                 kwds["item"] = item
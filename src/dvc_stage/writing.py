@@ -19,10 +19,12 @@ import pandas as pd
 from tqdm import tqdm
 from tqdm.contrib.logging import logging_redirect_tqdm
 
+from dvc_stage.loading import LazyDataDict
 from dvc_stage.utils import import_from_string, parse_path
 
 # %% globals ###################################################################
 __LOGGER__ = logging.getLogger(__name__)
+__APPENDABLE_FORMATS__ = ("csv", "custom")
 
 
 # %% private functions #########################################################
@@ -52,19 +54,40 @@ def _get_writing_function(data: any, format: str, import_from: str | None) -> ca
     if format == "custom":
         fn = import_from_string(import_from)
     elif hasattr(data, "to_" + format):
-        fn = lambda _, path: getattr(data, "to_" + format)(path)  # noqa E731
+        fn = lambda _, path, **kwds: getattr(data, "to_" + format)(  # noqa E731
+            path, **kwds
+        )
     else:
         raise ValueError(f'writing function for format "{format}" not found')
     return fn
 
 
 # %% public functions ##########################################################
+def check_appendable(format: str) -> None:
+    """Ensure that data can be appended to files of the given format.
+
+    Parameters
+    ----------
+    format : str
+        The format to write the data in.
+
+    Raises
+    ------
+    ValueError
+        If appending data in this format is not supported.
+
+    """
+    if format not in __APPENDABLE_FORMATS__:
+        raise ValueError(f'appending data in format "{format}" unsupported')
+
+
 def write_data(
     data: pd.DataFrame | dict[str, pd.DataFrame],
     format: str,
     path: str,
     import_from: str | None = None,
     item: str | None = None,
+    append: bool = False,
     **kwds: any,
 ) -> None:
     """Write data to a file. Main entrypoint for writing substage.
@@ -81,6 +104,10 @@ def write_data(
         The module path of a custom writing function. Default is None.
     item : str | None, optional
         Item identifier for foreach stages. Default is None.
+    append : bool, optional
+        Append data to an existing file instead of overwriting it.
+        Supported for "csv" and custom writing functions, which receive the
+        additional keyword argument `append=True`. Default is False.
     **kwds : any
         Additional keyword arguments passed to the writing function.
 
@@ -91,18 +118,29 @@ def write_data(
 
     if isinstance(data, dict):
         __LOGGER__.debug("arg is dict")
-        it = tqdm(data.items(), leave=False)
+        it = tqdm(data.keys(), leave=False)
         with logging_redirect_tqdm():
-            for k, v in it:
+            for k in it:
                 formatted_path = parse_path(path, key=k, item=item)[0]
                 __LOGGER__.debug(f"writing df with key {k} to '{formatted_path}'")
                 it.set_description(f"writing df with key {k}")
                 write_data(
                     format=format,
-                    data=v,
+                    data=data[k],
                     path=formatted_path,
+                    import_from=import_from,
+                    append=append,
+                    **kwds,
                 )
+                if isinstance(data, LazyDataDict):
+                    data.release(k)
     else:
         __LOGGER__.debug(f"saving data to {path} as {format}")
         fn = _get_writing_function(data, format, import_from)
+        if append:
+            check_appendable(format)
+            if format == "csv":
+                kwds.update(mode="a", header=False)
+            else:
+                kwds["append"] = True
         fn(data, path, **kwds)
@@ -2,7 +2,13 @@
 
 from unittest.mock import patch
 
+import pandas as pd
+import pytest
+import yaml
+
 from dvc_stage.cli import _print_stage_definition, cli
+from dvc_stage.loading import load_data
+from dvc_stage.stage import _run_stage_chunked
 
 
 class TestCLI:
@@ -59,6 +65,51 @@ class TestCLI:
                     stage="test_stage", validate=False, item="item1"
                 )
 
+    def test_cli_cache_prune(self, tmp_path):
+        """Test that the cache is pruned to the given size."""
+        (tmp_path / "transform").mkdir()
+        (tmp_path / "transform" / "entry.pkl").write_bytes(b"0" * 16)
+        argv = ["dvc-stage", "cache", "prune", "--max-size", "1KB", "--dir"]
+        with patch("sys.argv", argv + [str(tmp_path)]):
+            cli()
+        assert (tmp_path / "transform" / "entry.pkl").exists()
+        with patch("sys.argv", ["dvc-stage", "cache", "prune", "--dir", str(tmp_path)]):
+            cli()
+        assert not (tmp_path / "transform" / "entry.pkl").exists()
+
+    def test_cli_cache_requires_action(self):
+        """Test that the cache command fails without a subcommand."""
+        with patch("sys.argv", ["dvc-stage", "cache"]):
+            with pytest.raises(SystemExit):
+                cli()
+
+    def test_update_all_loads_params_once(self, tmp_path, monkeypatch):
+        """Test that all stages are updated using a single config session."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "input.csv").write_text("a\n1\n")
+        stage_params = {
+            "load": {"path": "input.csv", "format": "csv"},
+            "transformations": [{"id": "dropna"}],
+            "write": {"path": "output.csv", "format": "csv"},
+        }
+        params = {"stage_a": stage_params, "stage_b": stage_params}
+        dvc_yaml = {
+            "stages": {
+                "stage_a": {"cmd": "dvc-stage run stage_a"},
+                "stage_b": {"cmd": "dvc-stage run stage_b"},
+                "other": {"cmd": "python other.py"},
+            }
+        }
+        (tmp_path / "dvc.yaml").write_text(yaml.dump(dvc_yaml))
+        with patch("dvc.api.params_show", return_value=params) as mock_params:
+            with patch("sys.argv", ["dvc-stage", "update-all", "--yes"]):
+                cli()
+        assert mock_params.call_count == 1
+        updated = yaml.safe_load((tmp_path / "dvc.yaml").read_text())["stages"]
+        assert updated["stage_a"]["outs"] == ["output.csv"]
+        assert updated["stage_b"]["cmd"] == "dvc-stage run stage_b"
+        assert updated["other"] == dvc_yaml["stages"]["other"]
+
     @patch("dvc_stage.cli.get_stage_definition")
     @patch("builtins.print")
     def test_print_stage_definition(self, mock_print, mock_get_stage):
@@ -67,3 +118,31 @@ class TestCLI:
         _print_stage_definition("test_stage")
         mock_get_stage.assert_called_once_with("test_stage")
         mock_print.assert_called_once()
+
+    def test_run_stage_chunked(self, tmp_path, sample_dataframe):
+        """Test that chunks are transformed and appended to the output."""
+        sample_dataframe.to_csv(tmp_path / "input.csv", index=False)
+        data = load_data(format="csv", paths=str(tmp_path / "input.csv"), chunksize=3)
+        _run_stage_chunked(
+            data,
+            transformations=[{"id": "rename", "columns": {"feature1": "f1"}}],
+            validations=[{"id": "isnull", "reduction": "any", "expected": False}],
+            write={"format": "csv", "path": str(tmp_path / "out" / "output.csv")},
+        )
+        result = pd.read_csv(tmp_path / "out" / "output.csv", index_col=0)
+        expected = sample_dataframe.rename(columns={"feature1": "f1"})
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_run_stage_chunked_unsupported_format(self, tmp_path, sample_dataframe):
+        """Test that formats not supporting appending fail before writing."""
+        sample_dataframe.to_csv(tmp_path / "input.csv", index=False)
+        data = load_data(format="csv", paths=str(tmp_path / "input.csv"), chunksize=3)
+        path = tmp_path / "output.parquet"
+        with pytest.raises(ValueError, match="appending"):
+            _run_stage_chunked(
+                data,
+                transformations=None,
+                validations=None,
+                write={"format": "parquet", "path": str(path)},
+            )
+        assert not path.exists()
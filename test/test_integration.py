@@ -1,6 +1,8 @@
 """Integration tests for the complete DVC-Stage pipeline."""
 
+import copy
 import os
+import shutil
 import tempfile
 from pathlib import Path
 from unittest.mock import patch
@@ -11,6 +13,7 @@ import yaml
 
 from dvc_stage.cli import _run_stage
 from dvc_stage.config import get_stage_definition, get_stage_params
+from dvc_stage.tracing import trace_keys
 from dvc_stage.utils import get_deps
 
 
@@ -188,9 +191,65 @@ class TestIntegration:
         assert "params" in stage
 
     @patch("dvc.api.params_show")
-    @patch("dvc_stage.cli.apply_transformations")
-    @patch("dvc_stage.cli.write_data")
-    @patch("dvc_stage.cli.load_data")
+    def test_get_stage_definition_cached_outs(self, mock_params_show, temp_workspace):
+        """Test that the traced outputs are cached by the stage parameters."""
+        params = {
+            "test_pipeline": {
+                "load": {"path": "data/input.csv", "format": "csv"},
+                "transformations": [
+                    {
+                        "id": "split",
+                        "by": "id",
+                        "left_split_key": "train",
+                        "right_split_key": "test",
+                    }
+                ],
+                "write": {"path": "outdir/${key}.csv", "format": "csv"},
+            },
+        }
+        mock_params_show.side_effect = lambda **_: copy.deepcopy(params)
+
+        with patch("dvc_stage.config.trace_keys", wraps=trace_keys) as mock_trace:
+            for _ in range(2):
+                definition = get_stage_definition("test_pipeline")
+                outs = definition["stages"]["test_pipeline"]["outs"]
+                assert outs == ["outdir/test.csv", "outdir/train.csv"]
+            assert mock_trace.call_count == 1
+
+            params["test_pipeline"]["transformations"][0]["right_split_key"] = "val"
+            definition = get_stage_definition("test_pipeline")
+            outs = definition["stages"]["test_pipeline"]["outs"]
+            assert outs == ["outdir/train.csv", "outdir/val.csv"]
+            assert mock_trace.call_count == 2
+
+    @patch("dvc.api.params_show")
+    def test_get_stage_definition_uncached_outs(self, mock_params_show, temp_workspace):
+        """Test that the traced outputs are not cached if disabled or without DVC."""
+        params = {
+            "test_pipeline": {
+                "load": {"path": "data/input.csv", "format": "csv"},
+                "transformations": [{"id": "dropna"}],
+                "write": {"path": "outdir/output.csv", "format": "csv"},
+                "trace_cache": False,
+            },
+        }
+        mock_params_show.side_effect = lambda **_: copy.deepcopy(params)
+        trace_dir = temp_workspace / ".dvc" / "tmp" / "dvc-stage" / "trace"
+
+        with patch("dvc_stage.config.trace_keys", wraps=trace_keys) as mock_trace:
+            get_stage_definition("test_pipeline")
+            assert not trace_dir.exists()
+
+            del params["test_pipeline"]["trace_cache"]
+            shutil.rmtree(temp_workspace / ".dvc", ignore_errors=True)
+            get_stage_definition("test_pipeline")
+            assert not (temp_workspace / ".dvc").exists()
+            assert mock_trace.call_count == 2
+
+    @patch("dvc.api.params_show")
+    @patch("dvc_stage.stage.apply_transformations")
+    @patch("dvc_stage.stage.write_data")
+    @patch("dvc_stage.stage.load_data")
     def test_run_stage_integration(
         self, mock_load, mock_write, mock_transform, mock_params_show, temp_workspace
     ):
@@ -0,0 +1,416 @@
+"""Tests for the loading module."""
+
+import fnmatch
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+from dvc_stage.loading import (
+    __LOADERS__,
+    LazyDataDict,
+    _compile_key_map,
+    _get_data_key,
+    _get_data_keys,
+    _get_loading_function,
+    load_data,
+    register_loader,
+)
+
+
+class TestLoadData:
+    """Test cases for load_data function."""
+
+    @pytest.fixture
+    def csv_files(self, tmp_path):
+        """Create a set of small csv files."""
+        paths = []
+        for i in range(8):
+            path = tmp_path / f"file_{i}.csv"
+            pd.DataFrame({"A": [i, i + 1], "B": [i * 2, i * 3]}).to_csv(
+                path, index=False
+            )
+            paths.append(str(path))
+        return paths
+
+    def test_load_single_file(self, csv_files):
+        """Test loading a single file."""
+        data = load_data(format="csv", paths=csv_files[0])
+        assert isinstance(data, pd.DataFrame)
+        assert list(data.columns) == ["A", "B"]
+
+    def test_load_multiple_files(self, csv_files):
+        """Test loading multiple files into a keyed dict."""
+        data = load_data(format="csv", paths=csv_files, quiet=True)
+        assert list(data.keys()) == [f"file_{i}" for i in range(8)]
+
+    def test_load_with_key_map(self, csv_files):
+        """Test mapping file names to keys."""
+        data = load_data(
+            format="csv", paths=csv_files[:2], key_map={"*file_0.csv": "first"}
+        )
+        assert list(data.keys()) == ["first", "file_1"]
+
+    def test_key_map_first_match(self, csv_files):
+        """Test that the first matching pattern of the key map is used."""
+        key_map = {"*file_[2-9].csv": "late", csv_files[0]: "literal", "*.csv": "any"}
+        data = load_data(format="csv", paths=csv_files[:3], key_map=key_map)
+        assert list(data.keys()) == ["literal", "any", "late"]
+
+    def test_key_map_equivalent_to_fnmatch(self):
+        """Test that keys match the first pattern matched by fnmatch."""
+        key_map = {
+            "data/a/x_*.csv": "a",
+            "data/*/y.csv": "y",
+            "data/*.csv": "data",
+            "data/a/b/*": "b",
+            "*/z?.csv": "z",
+            "data/a/x_1.csv": "literal",
+        }
+        paths = [
+            "data/a/x_1.csv",
+            "data/a/y.csv",
+            "data/a/b/x_1.csv",
+            "data/a/b/z1.csv",
+            "data/z1.csv",
+            "other/z12.csv",
+            "other/x.csv",
+        ]
+        for path in paths:
+            expected = next(
+                (k for p, k in key_map.items() if fnmatch.fnmatch(path, p)),
+                os.path.splitext(os.path.basename(path))[0],
+            )
+            assert _get_data_key(path, key_map) == expected
+
+    def test_key_map_scaling(self):
+        """Test that paths are only matched against patterns of their directory."""
+        n = 1000
+        key_map = {f"data/{i}/*.csv": str(i) for i in range(n)}
+        key_map.update({f"data/{i}/fixed.csv": "fixed" for i in range(n)})
+        _, matches, _ = _compile_key_map(tuple(key_map.items()))
+        paths = [f"data/{i}/file.csv" for i in range(n)]
+        for path in paths:
+            candidates = [m for d, m in matches.items() if path.startswith(d)]
+            assert sum(m.__self__.groups for m in candidates) == 1
+        assert _get_data_keys(paths, key_map) == [str(i) for i in range(n)]
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_load_concurrently(self, csv_files, executor):
+        """Test concurrent loading returns the same keyed dict in the same order."""
+        expected = load_data(format="csv", paths=csv_files, quiet=True)
+        data = load_data(
+            format="csv",
+            paths=csv_files,
+            quiet=True,
+            workers=4,
+            executor=executor,
+        )
+        assert list(data.keys()) == list(expected.keys())
+        for k, v in expected.items():
+            pd.testing.assert_frame_equal(data[k], v)
+
+    def test_load_invalid_executor(self, csv_files):
+        """Test that an invalid executor raises a ValueError."""
+        with pytest.raises(ValueError):
+            load_data(format="csv", paths=csv_files, workers=2, executor="fork")
+
+    def test_load_chunked(self, csv_files):
+        """Test that chunksize yields an iterator over chunks per key."""
+        data = load_data(format="csv", paths=csv_files[:2], chunksize=1)
+        assert list(data.keys()) == ["file_0", "file_1"]
+        chunks = list(data["file_1"])
+        assert len(chunks) == 2
+        assert chunks[1].index.tolist() == [1]
+
+    def test_load_optimize_dtypes(self, csv_files):
+        """Test that dtypes are optimized after loading."""
+        data = load_data(format="csv", paths=csv_files[:2], optimize_dtypes=True)
+        assert data["file_1"]["A"].dtype == "int8"
+
+    def test_load_tracing(self, csv_files):
+        """Test that data loading is skipped if format is None."""
+        data = load_data(format=None, paths=csv_files, workers=4)
+        assert data == {f"file_{i}": None for i in range(8)}
+
+
+class TestLazyDataDict:
+    """Test cases for LazyDataDict."""
+
+    @pytest.fixture
+    def csv_files(self, tmp_path):
+        """Create a set of small csv files."""
+        paths = []
+        for i in range(3):
+            path = tmp_path / f"file_{i}.csv"
+            pd.DataFrame({"A": [i, i + 1]}).to_csv(path, index=False)
+            paths.append(str(path))
+        return paths
+
+    def test_load_lazy(self, csv_files):
+        """Test that data is only loaded on first access."""
+        data = load_data(format="csv", paths=csv_files, lazy=True)
+        assert isinstance(data, LazyDataDict)
+        assert list(data.keys()) == ["file_0", "file_1", "file_2"]
+        assert not any(data.is_loaded(k) for k in data.keys())
+
+        df = data["file_1"]
+        assert df["A"].tolist() == [1, 2]
+        assert data.is_loaded("file_1")
+        assert not data.is_loaded("file_0")
+
+    def test_release(self, csv_files):
+        """Test that released data is loaded again on next access."""
+        data = load_data(format="csv", paths=csv_files, lazy=True)
+        data["file_0"]
+        data.release("file_0")
+        assert not data.is_loaded("file_0")
+        assert data["file_0"]["A"].tolist() == [0, 1]
+
+        data["file_1"] = pd.DataFrame({"B": [1]})
+        data.release("file_1")
+        assert data.is_loaded("file_1")
+
+    def test_copy_and_update(self, csv_files):
+        """Test that copies share the loading functions and update loads values."""
+        data = load_data(format="csv", paths=csv_files, lazy=True)
+        other = data.copy()
+        assert isinstance(other, LazyDataDict)
+        assert not other.is_loaded("file_2")
+
+        merged = {}
+        merged.update(other)
+        assert all(isinstance(v, pd.DataFrame) for v in merged.values())
+        assert list(merged.keys()) == list(data.keys())
+        pd.testing.assert_frame_equal(merged["file_2"], data["file_2"])
+
+    def test_pop(self, csv_files):
+        """Test that popped values are loaded."""
+        data = load_data(format="csv", paths=csv_files, lazy=True)
+        df = data.pop("file_0")
+        assert isinstance(df, pd.DataFrame)
+        assert "file_0" not in data
+        assert data.pop("file_0", None) is None
+
+
+class TestLoadCache:
+    """Test cases for the parsed-input cache."""
+
+    def test_load_cached(self, tmp_path):
+        """Test that parsed data is cached and reused."""
+        path = tmp_path / "input.csv"
+        pd.DataFrame({"A": [1, 2], "B": ["x", "y"]}).to_csv(path, index=False)
+        cache = {"dir": str(tmp_path / "cache")}
+
+        data = load_data(format="csv", paths=str(path), cache=cache)
+        entries = list((tmp_path / "cache" / "load").iterdir())
+        assert len(entries) == 1
+
+        cached = load_data(format="csv", paths=str(path), cache=cache)
+        pd.testing.assert_frame_equal(cached, data)
+
+        load_data(format="csv", paths=str(path), cache=cache, usecols=["A"])
+        assert len(list((tmp_path / "cache" / "load").iterdir())) == 2
+
+    def test_cache_invalidated_on_change(self, tmp_path):
+        """Test that changed files are parsed again."""
+        path = tmp_path / "input.csv"
+        cache = {"dir": str(tmp_path / "cache")}
+        pd.DataFrame({"A": [1]}).to_csv(path, index=False)
+        load_data(format="csv", paths=str(path), cache=cache)
+        pd.DataFrame({"A": [2]}).to_csv(path, index=False)
+        data = load_data(format="csv", paths=str(path), cache=cache)
+        assert data["A"].tolist() == [2]
+
+    def test_cache_eviction(self, tmp_path):
+        """Test that the cache size is bounded."""
+        cache = {"dir": str(tmp_path / "cache"), "max_size": 1}
+        path = tmp_path / "input.csv"
+        pd.DataFrame({"A": [1]}).to_csv(path, index=False)
+        load_data(format="csv", paths=str(path), cache=cache)
+        assert list((tmp_path / "cache" / "load").iterdir()) == []
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_evict_once(self, tmp_path, workers):
+        """Test that the cache is evicted once after all files are loaded."""
+        cache = {"dir": str(tmp_path / "cache"), "max_size": "1GB"}
+        paths = []
+        for i in range(3):
+            paths.append(str(tmp_path / f"input{i}.csv"))
+            pd.DataFrame({"A": [i]}).to_csv(paths[-1], index=False)
+        with patch("dvc_stage.loading.evict") as evict:
+            data = load_data(format="csv", paths=paths, cache=cache, workers=workers)
+        evict.assert_called_once_with(cache["dir"], "1GB")
+        assert len(data) == 3
+        assert len(list((tmp_path / "cache" / "load").iterdir())) == 3
+
+    def test_uncompressed(self, tmp_path):
+        """Test that cache entries are written without compression."""
+        path = tmp_path / "input.csv"
+        pd.DataFrame({"A": [0] * 1000}).to_csv(path, index=False)
+        load_data(format="csv", paths=str(path), cache={"dir": str(tmp_path)})
+        (entry,) = (tmp_path / "load").iterdir()
+        assert entry.stat().st_size >= 1000 * 8
+
+
+class TestArrowBackend:
+    """Test cases for the Arrow data backend."""
+
+    @pytest.mark.parametrize("format", ["feather", "parquet", "csv"])
+    def test_load_arrow_backend(self, tmp_path, sample_dataframe, format):
+        """Test that data is loaded into Arrow-backed columns."""
+        path = str(tmp_path / f"input.{format}")
+        getattr(sample_dataframe, f"to_{format}")(path)
+        data = load_data(format=format, paths=path, backend="arrow")
+        assert all(isinstance(d, pd.ArrowDtype) for d in data.dtypes)
+        assert data["feature3"].tolist() == sample_dataframe["feature3"].tolist()
+
+    def test_load_arrow_parquet_columns(self, tmp_path, sample_dataframe):
+        """Test that columns and filters are passed to pyarrow."""
+        path = str(tmp_path / "input.parquet")
+        sample_dataframe.to_parquet(path)
+        data = load_data(
+            format="parquet",
+            paths=path,
+            backend="arrow",
+            columns=["feature1", "target"],
+            filters=[("target", "==", 1)],
+        )
+        assert list(data.columns) == ["feature1", "target"]
+        assert len(data) == 2
+
+    def test_invalid_backend(self, tmp_path, sample_dataframe):
+        """Test that an invalid backend raises a ValueError."""
+        path = str(tmp_path / "input.csv")
+        sample_dataframe.to_csv(path)
+        with pytest.raises(ValueError):
+            load_data(format="csv", paths=path, backend="polars")
+
+
+class TestLoaderRegistry:
+    """Test cases for the loader registry and engine selection."""
+
+    @pytest.fixture
+    def registry(self):
+        """Remove registered loaders after the test."""
+        yield
+        __LOADERS__.clear()
+        _get_loading_function.cache_clear()
+
+    def test_register_loader(self, registry, tmp_path):
+        """Test that registered loaders are used for their format and engine."""
+
+        @register_loader("txt")
+        def read_txt(path):
+            with open(path) as f:
+                return f.read()
+
+        register_loader("txt", lambda path: "fast", engine="fast")
+        path = tmp_path / "input.txt"
+        path.write_text("content")
+        assert load_data(format="txt", paths=str(path)) == "content"
+        assert load_data(format="txt", paths=str(path), engine="fast") == "fast"
+
+    def test_auto_engine(self, tmp_path, sample_dataframe, caplog):
+        """Test that the selected engine is logged."""
+        path = str(tmp_path / "input.csv")
+        sample_dataframe.to_csv(path, index=False)
+        with caplog.at_level("INFO", logger="dvc_stage.loading"):
+            data = load_data(format="csv", paths=path, engine="auto")
+        assert 'with engine "pyarrow"' in caplog.text
+        pd.testing.assert_frame_equal(data, pd.read_csv(path), check_dtype=False)
+
+        assert load_data(format="csv", paths=path, engine="auto", nrows=1).shape[0] == 1
+
+    def test_orjson_engine(self, tmp_path, sample_dataframe):
+        """Test loading JSON lines with orjson."""
+        path = str(tmp_path / "input.jsonl")
+        sample_dataframe.to_json(path, orient="records", lines=True)
+        data = load_data(format="json", paths=path, engine="orjson", lines=True)
+        pd.testing.assert_frame_equal(
+            data, pd.read_json(path, lines=True), check_dtype=False
+        )
+
+    def test_invalid_engine(self, tmp_path, sample_dataframe):
+        """Test that an unknown engine raises a ValueError."""
+        path = str(tmp_path / "input.feather")
+        sample_dataframe.to_feather(path)
+        with pytest.raises(ValueError):
+            load_data(format="feather", paths=path, engine="fast")
+
+
+class TestDtypesFromSchema:
+    """Test cases for loading with dtypes from a pandera schema."""
+
+    def test_dtypes_from_schema(self, tmp_path, monkeypatch):
+        """Test that dtypes and dates are taken from the schema."""
+        pytest.importorskip("pandera")
+        (tmp_path / "schemas.py").write_text(
+            "import pandera as pa\n"
+            "schema = pa.DataFrameSchema({\n"
+            "    'id': pa.Column(int),\n"
+            "    'label': pa.Column('category'),\n"
+            "    'date': pa.Column('datetime64[ns]'),\n"
+            "    'value': pa.Column(float, nullable=True),\n"
+            "    'count': pa.Column(int, nullable=True),\n"
+            "})\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        schema = {"import_from": "schemas.schema"}
+        path = str(tmp_path / "input.csv")
+        pd.DataFrame(
+            {
+                "id": [1, 2],
+                "label": ["a", "b"],
+                "date": ["2024-01-01", "2024-01-02"],
+                "value": [1, None],
+                "count": [1, None],
+            }
+        ).to_csv(path, index=False)
+
+        data = load_data(format="csv", paths=path, dtypes_from_schema=schema)
+        assert isinstance(data["label"].dtype, pd.CategoricalDtype)
+        assert pd.api.types.is_datetime64_any_dtype(data["date"])
+        assert data["value"].dtype == float
+        assert data["count"].isna().sum() == 1
+
+        data = load_data(
+            format="csv",
+            paths=path,
+            dtypes_from_schema=schema,
+            dtype={"label": str},
+            usecols=["id", "label"],
+        )
+        assert not isinstance(data["label"].dtype, pd.CategoricalDtype)
+
+    def test_dtypes_from_schema_push_down(self, tmp_path, monkeypatch):
+        """Test that dates of columns not selected by the planner are ignored."""
+        pytest.importorskip("pandera")
+        from dvc_stage.planning import push_down
+
+        (tmp_path / "schemas.py").write_text(
+            "import pandera as pa\n"
+            "schema = pa.DataFrameSchema({\n"
+            "    'id': pa.Column(int),\n"
+            "    'date': pa.Column('datetime64[ns]'),\n"
+            "})\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        path = str(tmp_path / "input.csv")
+        pd.DataFrame({"id": [1, 2], "date": ["2024-01-01", "2024-01-02"]}).to_csv(
+            path, index=False
+        )
+        load = {
+            "format": "csv",
+            "dtypes_from_schema": {"import_from": "schemas.schema"},
+        }
+        for items in (["id"], ["id", "date"]):
+            kwds = push_down(load, [{"id": "filter", "items": items}])
+            assert callable(kwds["usecols"])
+            data = load_data(paths=path, **kwds)
+            assert list(data.columns) == items
+        assert pd.api.types.is_datetime64_any_dtype(data["date"])
+
+        data = load_data(paths=path, usecols=("id",), **load)
+        assert list(data.columns) == ["id"]
@@ -0,0 +1,176 @@
+"""Tests for the planning module."""
+
+import pandas as pd
+
+from dvc_stage.loading import load_data
+from dvc_stage.planning import ColumnSelector, plan_pushdown, push_down
+from dvc_stage.transforming import apply_transformations
+
+
+class TestPlanPushdown:
+    """Test cases for plan_pushdown function."""
+
+    def test_projection(self):
+        """Test that columns are derived from a projection."""
+        columns, filters = plan_pushdown(
+            [
+                {"id": "rename", "columns": {"a": "x"}},
+                {"id": "query", "expr": "x > 1 and b == 'foo'"},
+                {"id": "filter", "items": ["x", "c"]},
+            ]
+        )
+        assert columns == {"a", "b", "c"}
+        assert filters == [("a", ">", 1), ("b", "==", "foo")]
+
+    def test_column_transformer_projection(self):
+        """Test that columns are derived from a column transformer."""
+        columns, _ = plan_pushdown(
+            [
+                {
+                    "id": "column_transformer_fit_transform",
+                    "transformers": [{"class_name": "passthrough", "columns": ["a"]}],
+                }
+            ]
+        )
+        assert columns == {"a"}
+
+        columns, _ = plan_pushdown(
+            [
+                {"id": "query", "expr": "a > 1"},
+                {"id": "column_transformer_transform", "load_from_file": "ct.pkl"},
+            ]
+        )
+        assert columns is None
+
+    def test_unknown_transformation(self):
+        """Test that unknown transformations prevent column pushdown."""
+        columns, filters = plan_pushdown(
+            [
+                {"id": "query", "expr": "1 < a"},
+                {"id": "custom", "import_from": "a.b"},
+                {"id": "filter", "items": ["a"]},
+            ]
+        )
+        assert columns is None
+        assert filters == [("a", ">", 1)]
+
+    def test_filters_only_from_leading_queries(self):
+        """Test that queries after value changing steps are no filters."""
+        columns, filters = plan_pushdown(
+            [
+                {"id": "fillna", "value": {"a": 0}},
+                {"id": "query", "expr": "a > 1"},
+                {"id": "filter", "items": ["b"]},
+            ]
+        )
+        assert columns == {"a", "b"}
+        assert filters == []
+
+    def test_unsupported_query(self):
+        """Test that queries referencing variables stop the planning."""
+        columns, filters = plan_pushdown(
+            [{"id": "query", "expr": "a > @x"}, {"id": "filter", "items": ["a"]}]
+        )
+        assert columns is None
+        assert filters == []
+
+
+class TestPushDown:
+    """Test cases for push_down function."""
+
+    def test_push_down_csv(self, tmp_path, sample_dataframe):
+        """Test that pushdown does not change the transformed data."""
+        path = str(tmp_path / "input.csv")
+        sample_dataframe.to_csv(path, index=False)
+        transformations = [
+            {"id": "query", "expr": "target == 1"},
+            {"id": "filter", "items": ["feature1", "category"]},
+        ]
+        load = push_down({"format": "csv"}, transformations)
+        assert load["usecols"] == ColumnSelector(["category", "feature1", "target"])
+
+        expected = apply_transformations(
+            load_data(format="csv", paths=path), transformations
+        )
+        result = apply_transformations(load_data(paths=path, **load), transformations)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_push_down_csv_missing_column(self, tmp_path, sample_dataframe):
+        """Test that columns selected by filter may be missing in the data."""
+        path = str(tmp_path / "input.csv")
+        sample_dataframe.to_csv(path, index=False)
+        transformations = [{"id": "filter", "items": ["feature1", "missing"]}]
+        load = push_down({"format": "csv"}, transformations)
+        result = apply_transformations(load_data(paths=path, **load), transformations)
+        assert list(result.columns) == ["feature1"]
+
+    def test_push_down_csv_auto_engine(self, tmp_path, sample_dataframe):
+        """Test that columns selected by filter are loaded by any engine."""
+        path = str(tmp_path / "input.csv")
+        sample_dataframe.to_csv(path, index=False)
+        transformations = [{"id": "filter", "items": ["feature1", "missing"]}]
+        load = push_down({"format": "csv", "engine": "auto"}, transformations)
+        result = apply_transformations(load_data(paths=path, **load), transformations)
+        assert list(result.columns) == ["feature1"]
+
+    def test_push_down_parse_dates(self):
+        """Test that columns parsed as dates are loaded."""
+        transformations = [{"id": "filter", "items": ["value"]}]
+        load = push_down(
+            {"format": "csv", "parse_dates": {"date": ["day", "time"]}},
+            transformations,
+        )
+        assert load["usecols"] == ColumnSelector(["day", "time", "value"])
+
+    def test_push_down_parquet(self, tmp_path, sample_dataframe):
+        """Test that columns and filters are passed to the parquet loader."""
+        path = str(tmp_path / "input.parquet")
+        sample_dataframe.to_parquet(path)
+        transformations = [
+            {"id": "query", "expr": "target == 1"},
+            {
+                "id": "column_transformer_fit_transform",
+                "transformers": [
+                    {"class_name": "passthrough", "columns": ["feature1"]}
+                ],
+            },
+        ]
+        load = push_down({"format": "parquet"}, transformations)
+        assert load["columns"] == ["feature1", "target"]
+        assert load["filters"] == [("target", "==", 1)]
+
+        data = load_data(paths=path, **load)
+        expected = sample_dataframe.loc[sample_dataframe.target == 1, load["columns"]]
+        pd.testing.assert_frame_equal(data, expected)
+
+    def test_push_down_parquet_filter_items(self):
+        """Test that columns selected by filter are not passed to parquet."""
+        load = push_down(
+            {"format": "parquet"},
+            [{"id": "filter", "items": ["feature1", "missing"]}],
+        )
+        assert "columns" not in load
+
+    def test_push_down_parquet_missing_values(self, tmp_path):
+        """Test that rows with missing values are kept like by query."""
+        path = str(tmp_path / "input.parquet")
+        data = pd.DataFrame({"a": [1.0, None, 2.0, 3.0], "b": ["x", "y", None, "z"]})
+        data.to_parquet(path)
+        transformations = [
+            {"id": "query", "expr": "a != 1 and b not in ['z'] and a < 3"}
+        ]
+        load = push_down({"format": "parquet"}, transformations)
+        assert load["filters"] == [("a", "<", 3)]
+
+        expected = apply_transformations(
+            load_data(format="parquet", paths=path), transformations
+        )
+        result = apply_transformations(load_data(paths=path, **load), transformations)
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_user_parameters_are_kept(self):
+        """Test that configured loader arguments are not overwritten."""
+        load = push_down(
+            {"format": "csv", "usecols": ["a"]}, [{"id": "filter", "items": ["b"]}]
+        )
+        assert load["usecols"] == ["a"]
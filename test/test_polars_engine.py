@@ -0,0 +1,156 @@
+"""Tests for the polars engine module."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dvc_stage.loading import load_data
+from dvc_stage.transforming import apply_transformations
+
+pa = pytest.importorskip("pyarrow")
+pl = pytest.importorskip("polars")
+
+from dvc_stage import polars_engine  # noqa: E402
+
+
+class TestPolarsEngine:
+    """Test cases for the polars engine."""
+
+    @pytest.fixture
+    def paths(self, tmp_path):
+        """Create csv files with missing values and dates."""
+        paths = []
+        for i in range(2):
+            path = tmp_path / f"file_{i}.csv"
+            pd.DataFrame(
+                {
+                    "id": np.arange(40) % 8,
+                    "a": [np.nan if j % 7 == 0 else j + i for j in range(40)],
+                    "b": ["x", "y", "z", "w"] * 10,
+                    "date": pd.date_range("2024-01-01", periods=40, freq="D"),
+                }
+            ).to_csv(path, index=False)
+            paths.append(str(path))
+        return paths
+
+    def run(self, paths, transformations, **load):
+        """Apply transformations using pandas and polars."""
+        expected = load_data(format="csv", paths=paths, **load)
+        expected = apply_transformations(expected, transformations, quiet=True)
+        data = polars_engine.load_data(format="csv", paths=paths, **load)
+        data = polars_engine.apply_transformations(data, transformations)
+        return expected, polars_engine.collect(data)
+
+    def assert_equal(self, result, expected):
+        """Compare polars and pandas results ignoring dtypes."""
+        assert list(result.columns) == list(expected.columns)
+        pd.testing.assert_frame_equal(
+            result.astype(object).fillna(np.nan),
+            expected.astype(object).fillna(np.nan),
+            check_dtype=False,
+            check_index_type=False,
+        )
+
+    def test_lazy_transformations(self, paths):
+        """Test that translated transformations match pandas."""
+        transformations = [
+            {"id": "rename", "columns": {"a": "value"}},
+            {"id": "query", "expr": "value > 3 and b != 'x'"},
+            {"id": "fillna", "value": {"value": 0}},
+            {"id": "drop", "columns": ["id"]},
+            {"id": "combine", "include": [], "exclude": [], "key_column": "source"},
+        ]
+        expected, result = self.run(paths, transformations)
+        assert isinstance(result, pd.DataFrame)
+        self.assert_equal(result, expected)
+        assert result["source"].astype(str).unique().tolist() == ["file_0", "file_1"]
+
+    def test_index_and_dtypes(self, tmp_path):
+        """Test that row labels are kept and integers with missing values too."""
+        path = tmp_path / "input.csv"
+        path.write_text("a,b\n1,1\n,2\n3,3\n4,4\n")
+        expected, result = self.run(str(path), [{"id": "query", "expr": "b > 1"}])
+        pd.testing.assert_index_equal(result.index, expected.index, exact=False)
+        assert expected["a"].dtype == np.float64
+        assert result["a"].dtype == pd.ArrowDtype(pa.int64())
+
+    def test_index_col(self, paths):
+        """Test that loaded indices keep their dtype and name."""
+        transformations = [{"id": "query", "expr": "a > 3"}]
+        load = {"parse_dates": ["date"], "index_col": "date"}
+        expected, result = self.run(paths[0], transformations, **load)
+        pd.testing.assert_index_equal(result.index, expected.index)
+        assert result.index.name == "date"
+
+        expected, result = self.run(paths[0], transformations, index_col="b")
+        pd.testing.assert_index_equal(result.index, expected.index)
+
+    def test_parquet_index(self, tmp_path):
+        """Test that indices stored in parquet files are restored."""
+        data = pd.DataFrame({"a": range(6)}, index=pd.Index(list("uvwxyz"), name="k"))
+        data.to_parquet(tmp_path / "named.parquet")
+        data.reset_index(drop=True).iloc[2:].to_parquet(tmp_path / "range.parquet")
+        for name in ("named", "range"):
+            path = str(tmp_path / f"{name}.parquet")
+            transformations = [{"id": "query", "expr": "a > 2"}]
+            expected = apply_transformations(
+                load_data(format="parquet", paths=path), transformations, quiet=True
+            )
+            result = polars_engine.collect(
+                polars_engine.apply_transformations(
+                    polars_engine.load_data(format="parquet", paths=path),
+                    transformations,
+                )
+            )
+            pd.testing.assert_index_equal(result.index, expected.index, exact=False)
+
+    def test_read_csv_compatibility(self, tmp_path):
+        """Test missing values, files without header and query literals."""
+        path = tmp_path / "input.csv"
+        path.write_text("a,b\n1,NA\nNaN,x\n3,n/a\n")
+        expected, result = self.run(str(path), [{"id": "query", "expr": "b == 'x'"}])
+        self.assert_equal(result, expected)
+
+        expected, result = self.run(str(path), [{"id": "dropna"}], header=None)
+        assert list(result.columns) == [0, 1]
+        self.assert_equal(result, expected)
+
+        data = polars_engine.load_data(format="csv", paths=str(path))
+        with pytest.raises(ValueError, match="can not be compared"):
+            polars_engine.apply_transformations(
+                data, [{"id": "query", "expr": "a == 'x'"}]
+            )
+
+    def test_splits(self, paths):
+        """Test that id and date time splits match pandas."""
+        kwds = {"left_split_key": "train", "right_split_key": "test", "size": 0.5}
+        transformations = [
+            {"id": "split", "by": "id", "id_col": "id", "seed": 1, **kwds},
+            {
+                "id": "split",
+                "by": "date_time",
+                "include": ["train"],
+                "date_time_col": "date",
+                "freq": "W",
+                "left_split_key": "train_early",
+                "right_split_key": "train_late",
+                "size": 0.5,
+            },
+        ]
+        expected, result = self.run(paths[0], transformations, parse_dates=["date"])
+        assert list(result.keys()) == list(expected.keys())
+        for key in expected.keys():
+            self.assert_equal(result[key], expected[key])
+
+    def test_pandas_fallback(self, paths):
+        """Test that unsupported transformations are applied using pandas."""
+        transformations = [
+            {"id": "query", "expr": "a > 3"},
+            {"id": "transpose"},
+            {"id": "rename", "columns": {4: "first"}},
+        ]
+        data = polars_engine.load_data(format="csv", paths=paths[0])
+        result = polars_engine.apply_transformations(data, transformations)
+        assert isinstance(result, pd.DataFrame)
+        assert list(result.columns[:1]) == ["first"]
+        assert result.loc["a", "first"] == 4
@@ -0,0 +1,161 @@
+"""Tests for the stage module."""
+
+import copy
+import os
+from unittest.mock import patch
+
+import pandas as pd
+import pytest
+
+import dvc_stage
+from dvc_stage.config import get_stage_definition
+from dvc_stage.stage import Stage
+
+
+class TestStage:
+    """Test cases for the Stage class."""
+
+    @pytest.fixture
+    def params(self, tmp_path, monkeypatch, sample_dataframe):
+        """Create input data and stage parameters."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        sample_dataframe.to_csv(tmp_path / "data" / "input.csv", index=False)
+        return {
+            "test_stage": {
+                "load": {"path": "data/input.csv", "format": "csv"},
+                "transformations": [
+                    {"id": "query", "expr": "target == 1", "description": "filter"},
+                    {"id": "rename", "columns": {"feature1": "f1"}},
+                ],
+                "validations": [
+                    {
+                        "id": "isnull",
+                        "reduction": "any",
+                        "expected": False,
+                        "description": "no missing values",
+                    }
+                ],
+                "write": {"path": "out/output.csv", "format": "csv"},
+            }
+        }
+
+    def test_run_repeatedly(self, params):
+        """Test that a stage can be run multiple times in the same process."""
+        expected_params = copy.deepcopy(params["test_stage"])
+        with patch("dvc.api.params_show", return_value=params):
+            stage = Stage("test_stage", validate=False)
+
+        for _ in range(2):
+            data = stage.run()
+            assert list(data["input"].columns)[0] == "f1"
+            assert len(pd.read_csv("out/output.csv")) == 2
+
+        assert stage.transformations == expected_params["transformations"]
+        assert stage.validations == expected_params["validations"]
+
+    def test_shared_session(self, params):
+        """Test that validation and execution load the configuration once."""
+        with patch("dvc.api.params_show", return_value=params) as mock_params:
+            dvc_yaml = get_stage_definition("test_stage")
+            mock_params.reset_mock()
+            with patch(
+                "dvc_stage.config.load_dvc_yaml", return_value=dvc_yaml
+            ) as mock_dvc_yaml:
+                data = Stage("test_stage").run()
+        assert list(data["input"].columns)[0] == "f1"
+        mock_params.assert_called_once_with(stages="test_stage")
+        assert mock_dvc_yaml.call_count == 1
+
+    def test_get_deps(self, params):
+        """Test that the dependencies are resolved."""
+        with patch("dvc.api.params_show", return_value=params):
+            stage = Stage("test_stage", validate=False)
+        assert stage.get_deps() == ["data/input.csv"]
+
+    def test_polars_engine(self, params):
+        """Test that stages can be executed by polars."""
+        pytest.importorskip("polars")
+        params["test_stage"]["engine"] = "polars"
+        with patch("dvc.api.params_show", return_value=params):
+            data = Stage("test_stage", validate=False).run()
+        assert list(data["input"].columns)[0] == "f1"
+        assert len(pd.read_csv("out/output.csv")) == 2
+
+    def test_invalid_engine(self, params):
+        """Test that unsupported engines and options raise a ValueError."""
+        params["test_stage"]["engine"] = "spark"
+        with patch("dvc.api.params_show", return_value=params):
+            with pytest.raises(ValueError):
+                Stage("test_stage", validate=False)
+        params["test_stage"]["engine"] = "polars"
+        params["test_stage"]["depth_first"] = True
+        with patch("dvc.api.params_show", return_value=params):
+            with pytest.raises(ValueError):
+                Stage("test_stage", validate=False)
+
+    def test_package_attribute(self):
+        """Test that the Stage class is exposed by the package."""
+        assert dvc_stage.Stage is Stage
+        with pytest.raises(AttributeError):
+            dvc_stage.Unknown
+
+
+class TestDepthFirst:
+    """Test cases for depth-first execution."""
+
+    @pytest.fixture
+    def params(self, tmp_path, monkeypatch, sample_dataframe):
+        """Create input data and stage parameters."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "data").mkdir()
+        for name in ("a", "b", "c"):
+            sample_dataframe.to_csv(tmp_path / "data" / f"{name}.csv", index=False)
+        return {
+            "test_stage": {
+                "depth_first": True,
+                "load": {"path": "data/*.csv", "format": "csv"},
+                "transformations": [
+                    {
+                        "id": "split",
+                        "by": "id",
+                        "id_col": "feature3",
+                        "size": 0.5,
+                        "seed": 42,
+                        "left_split_key": "a_left",
+                        "right_split_key": "a_right",
+                        "include": ["a"],
+                    },
+                    {"id": "add_suffix", "suffix": "_x"},
+                ],
+                "write": {"path": "out/${key}.csv", "format": "csv"},
+            }
+        }
+
+    def test_run_depth_first(self, params):
+        """Test that each key is processed and written separately."""
+        with patch("dvc.api.params_show", return_value=params):
+            stage = Stage("test_stage", validate=False)
+        assert stage.load["lazy"]
+        assert stage.run() is None
+        assert sorted(os.listdir("out")) == [
+            "a_left.csv",
+            "a_right.csv",
+            "b.csv",
+            "c.csv",
+        ]
+
+    def test_cross_key_steps(self, params):
+        """Test that steps combining keys are rejected."""
+        params["test_stage"]["transformations"].append({"id": "combine"})
+        with patch("dvc.api.params_show", return_value=params):
+            with pytest.raises(ValueError):
+                Stage("test_stage", validate=False)
+
+    @pytest.mark.parametrize("option", ["parallel", "memoize"])
+    def test_unsupported_options(self, params, option):
+        """Test that options ignored by depth-first execution are rejected."""
+        params["test_stage"][option] = True
+        with patch("dvc.api.params_show", return_value=params):
+            with pytest.raises(ValueError, match=option):
+                Stage("test_stage", validate=False)
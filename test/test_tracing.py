@@ -0,0 +1,132 @@
+"""Tests for the tracing module."""
+
+import sys
+import types
+
+import pytest
+
+from dvc_stage.tracing import get_source_stats, returns_keys, trace_keys
+from dvc_stage.transforming import apply_transformations
+
+
+@pytest.fixture
+def custom_fns(monkeypatch):
+    """Register custom functions with and without declared keys."""
+    calls = []
+
+    @returns_keys(lambda key, suffixes: [f"{key}_{s}" for s in suffixes])
+    def explode(data, suffixes, key=None):
+        calls.append(key)
+        return {f"{key}_{s}": data for s in suffixes}
+
+    @returns_keys()
+    def identity(data):
+        calls.append(None)
+        return data
+
+    def undeclared(data):
+        return data
+
+    module = types.ModuleType("trace_fns")
+    module.explode = explode
+    module.identity = identity
+    module.undeclared = undeclared
+    monkeypatch.setitem(sys.modules, "trace_fns", module)
+    return calls
+
+
+class TestTraceKeys:
+    """Test cases for trace_keys function."""
+
+    def test_matches_execution(self, custom_fns):
+        """Test that the keys match tracing by executing all transformations."""
+        transformations = [
+            {"id": "fillna", "value": 0},
+            {"id": "custom", "import_from": "trace_fns.identity"},
+            {
+                "id": "split",
+                "by": "id",
+                "include": ["a"],
+                "left_split_key": "train",
+                "right_split_key": "test",
+                "size": 0.5,
+            },
+            {
+                "id": "partition_by",
+                "by": "x",
+                "values": [1, 2],
+                "include": ["b"],
+                "key_format": "{key}_{value}",
+            },
+            {
+                "id": "custom",
+                "import_from": "trace_fns.explode",
+                "include": ["test"],
+                "pass_key_to_fn": True,
+                "suffixes": ["x", "y"],
+            },
+            {
+                "id": "date_time_folds",
+                "include": ["train"],
+                "date_time_col": "date",
+                "folds": 2,
+                "freq": "D",
+            },
+            {"id": "column_transformer_transform", "load_from_file": "ct.pkl"},
+            {"id": "combine", "include": ["b_1", "b_2"], "new_key": "b"},
+        ]
+        keys = trace_keys(["a", "b"], transformations)
+        assert custom_fns == []
+        assert keys == [
+            "train_0",
+            "test_0",
+            "train_1",
+            "test_1",
+            "test_x",
+            "test_y",
+            "b",
+        ]
+        traced = apply_transformations(
+            dict.fromkeys(["a", "b"]), transformations, quiet=True
+        )
+        assert len(custom_fns) > 0
+        assert keys == list(traced.keys())
+
+    def test_single_frame(self):
+        """Test that a single DataFrame is traced as None."""
+        assert trace_keys(None, [{"id": "dropna"}]) is None
+        assert trace_keys(
+            None,
+            [
+                {
+                    "id": "split",
+                    "by": "id",
+                    "left_split_key": "train",
+                    "right_split_key": "test",
+                }
+            ],
+        ) == ["train", "test"]
+
+    def test_not_traceable(self, custom_fns):
+        """Test that undeclared keys and unknown functions are reported."""
+        with pytest.raises(ValueError, match="not declared"):
+            trace_keys(["a"], [{"id": "custom", "import_from": "trace_fns.undeclared"}])
+        with pytest.raises(ValueError, match="not found"):
+            trace_keys(["a"], [{"id": "does_not_exist"}])
+        with pytest.raises(ValueError, match="values"):
+            trace_keys(["a"], [{"id": "partition_by", "by": "x"}])
+
+
+def test_get_source_stats(tmp_path, monkeypatch):
+    """Test that modules of custom functions are located."""
+    (tmp_path / "trace_module.py").write_text("def fn(data):\n    return data\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    stats = get_source_stats(
+        [
+            {"id": "custom", "import_from": "trace_module.fn"},
+            {"id": "custom", "import_from": "missing_module.fn"},
+            {"id": "dropna"},
+        ]
+    )
+    assert [s[0] for s in stats] == [str(tmp_path / "trace_module.py")]
+    assert "trace_module" not in sys.modules
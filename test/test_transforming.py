@@ -0,0 +1,741 @@
+"""Tests for the transforming module."""
+
+import pickle
+import sys
+import types
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from dvc_stage.loading import load_data
+from dvc_stage.stage import _run_stage_chunked
+from dvc_stage.transforming import (
+    __FITTED_COLUMN_TRANSFORMERS__,
+    _dump_column_transformer,
+    apply_transformations,
+    assign_expr,
+    check_row_local,
+    combine,
+    date_time_folds,
+    optimize_dtypes,
+    partition_by,
+    reset_partial_fits,
+    split,
+    sql,
+)
+
+
+class TestCheckRowLocal:
+    """Test cases for check_row_local function."""
+
+    def test_row_local_transformations(self):
+        """Test that known row-local transformations pass."""
+        check_row_local([{"id": "fillna", "value": 0}, {"id": "rename"}])
+
+    def test_marked_custom_transformation(self):
+        """Test that custom transformations can be marked as row-local."""
+        check_row_local([{"id": "custom", "import_from": "a.b", "row_local": True}])
+
+    def test_barrier(self):
+        """Test that transformations requiring the full data raise an error."""
+        with pytest.raises(ValueError, match="transpose"):
+            check_row_local([{"id": "fillna"}, {"id": "transpose"}])
+
+    def test_id_hash_split(self):
+        """Test that only the hash-based split is row-local."""
+        check_row_local([{"id": "split", "by": "id_hash"}])
+        with pytest.raises(ValueError, match="split"):
+            check_row_local([{"id": "split", "by": "id"}])
+
+    @pytest.mark.parametrize(
+        "kwds",
+        [
+            {"id": "dropna", "axis": 1},
+            {"id": "dropna", "axis": "columns"},
+            {"id": "fillna", "method": "ffill"},
+            {"id": "fillna", "method": "bfill"},
+            {"id": "fillna", "value": 0, "limit": 1},
+        ],
+    )
+    def test_arguments(self, kwds):
+        """Test that arguments depending on other rows are not row-local."""
+        check_row_local([{"id": "dropna", "axis": "index"}, {"id": "fillna"}])
+        with pytest.raises(ValueError, match=kwds["id"]):
+            check_row_local([kwds])
+
+    def test_row_local_flag_is_not_passed(self, sample_dataframe):
+        """Test that the row_local flag is not passed to the transformation."""
+        data = apply_transformations(
+            sample_dataframe, [{"id": "fillna", "value": 0, "row_local": True}]
+        )
+        assert data.shape == sample_dataframe.shape
+
+
+class TestIdHashSplit:
+    """Test cases for the hash-based id split."""
+
+    @pytest.fixture
+    def data(self):
+        """Create data with repeated ids."""
+        rng = np.random.default_rng(0)
+        return pd.DataFrame(
+            {"id": rng.integers(0, 1000, 5000), "value": rng.random(5000)}
+        )
+
+    def test_split_size(self, data):
+        """Test that ids are split approximately by size and not shared."""
+        result = split(
+            data,
+            by="id_hash",
+            left_split_key="train",
+            right_split_key="test",
+            size=0.8,
+            id_col="id",
+        )
+        train, test = result["train"], result["test"]
+        assert len(train) + len(test) == len(data)
+        assert not set(train["id"]) & set(test["id"])
+        assert 0.75 < train["id"].nunique() / data["id"].nunique() < 0.85
+
+    def test_stable_under_growth(self, data):
+        """Test that the assignment of ids does not depend on other ids."""
+        kwds = dict(by="id_hash", left_split_key="l", right_split_key="r", size=0.5)
+        full = split(data.set_index("id"), **kwds)
+        part = split(data.set_index("id").iloc[:100], **kwds)
+        assert set(part["l"].index) <= set(full["l"].index)
+        assert set(part["r"].index) <= set(full["r"].index)
+
+        other = split(data.set_index("id"), seed=1, **kwds)
+        assert set(other["l"].index) != set(full["l"].index)
+
+
+class TestDateTimeSplit:
+    """Test cases for date time splits."""
+
+    @pytest.fixture
+    def data(self):
+        """Create shuffled daily data."""
+        data = pd.DataFrame(
+            {
+                "value": np.arange(90),
+                "date": pd.date_range("2024-01-01 12:00", periods=90, freq="D"),
+            }
+        )
+        return data.sample(frac=1, random_state=0)
+
+    def test_split(self, data):
+        """Test that the input is not altered and splits are sorted."""
+        expected = data.copy()
+        result = split(
+            data,
+            by="date_time",
+            left_split_key="train",
+            right_split_key="test",
+            size=2 / 3,
+            freq="M",
+            date_time_col="date",
+        )
+        pd.testing.assert_frame_equal(data, expected)
+        assert result["train"]["date"].dt.month.unique().tolist() == [1, 2]
+        assert result["test"]["date"].dt.month.unique().tolist() == [3]
+        assert result["test"]["value"].tolist() == list(range(60, 90))
+        assert list(result["test"].columns) == ["date", "value"]
+
+    def test_expanding_folds(self, data):
+        """Test that training windows expand up to each test window."""
+        result = date_time_folds(data, "date", "D", folds=3, test_periods=5, gap=1)
+        assert list(result.keys()) == [
+            f"{s}_{i}" for i in range(3) for s in ("train", "test")
+        ]
+        assert result["test_0"]["value"].tolist() == list(range(75, 80))
+        assert result["train_0"]["value"].tolist() == list(range(74))
+        assert result["test_2"]["value"].tolist() == list(range(85, 90))
+        assert result["train_2"]["value"].tolist() == list(range(84))
+
+    def test_rolling_folds(self, data):
+        """Test that training windows have a fixed size."""
+        result = date_time_folds(
+            data, "date", "D", folds=2, method="rolling", train_periods=10
+        )
+        assert result["train_0"]["value"].tolist() == list(range(78, 88))
+        assert result["test_1"]["value"].tolist() == [89]
+
+    def test_kfold(self, data):
+        """Test that each period is used once for testing."""
+        result = date_time_folds(data, "date", "M", folds=3, method="kfold")
+        tests = [result[f"test_{i}"] for i in range(3)]
+        assert [t["date"].dt.month.unique().tolist() for t in tests] == [[1], [2], [3]]
+        assert len(result["train_1"]) == 31 + 30
+        assert set(result["train_1"].index) == set(tests[0].index) | set(tests[2].index)
+
+    def test_invalid_folds(self, data):
+        """Test that invalid configurations raise a ValueError."""
+        with pytest.raises(ValueError):
+            date_time_folds(data, "date", "D", folds=2, method="sliding")
+        with pytest.raises(ValueError):
+            date_time_folds(data, "date", "D", folds=2, method="rolling")
+        with pytest.raises(ValueError):
+            date_time_folds(data, "date", "M", folds=4, test_periods=1)
+
+    def test_tracing(self):
+        """Test that all keys are returned while tracing."""
+        result = date_time_folds(None, "date", "D", 2, key_format="{fold}_{split}")
+        assert list(result.keys()) == ["0_train", "0_test", "1_train", "1_test"]
+
+
+class TestPartitionBy:
+    """Test cases for the partition_by transformation."""
+
+    @pytest.fixture
+    def data(self):
+        """Create data with a group column."""
+        return pd.DataFrame(
+            {"site": ["a", "b", "a", None], "year": [1, 2, 2, 3], "value": range(4)}
+        )
+
+    def test_partition_by(self, data):
+        """Test that each group is stored under its own key."""
+        result = partition_by(data, "site")
+        assert list(result.keys()) == ["a", "b"]
+        assert result["a"]["value"].tolist() == [0, 2]
+
+        result = partition_by(data, ["site", "year"], key_format="{site}/{year}")
+        assert list(result.keys()) == ["a/1", "a/2", "b/2"]
+
+    def test_values(self, data):
+        """Test that given values define the keys."""
+        result = partition_by(data, "site", values=["b", "c"])
+        assert list(result.keys()) == ["b", "c"]
+        assert result["c"].empty
+        assert list(result["c"].columns) == list(data.columns)
+
+    def test_multiple_keys(self, data):
+        """Test that the key of the data can be used in the new keys."""
+        transformations = [{"id": "partition_by", "by": "site"}]
+        result = apply_transformations({"x": data, "y": data}, transformations)
+        assert list(result.keys()) == ["x_a", "x_b", "y_a", "y_b"]
+
+        transformations[0]["key_format"] = "{value}/{key}"
+        result = apply_transformations({"x": data, "y": data}, transformations)
+        assert list(result.keys()) == ["a/x", "b/x", "a/y", "b/y"]
+
+    def test_tracing(self):
+        """Test that values are required for tracing."""
+        assert partition_by(None, "site", values=["a"]) == {"a": None}
+        with pytest.raises(ValueError):
+            partition_by(None, "site")
+
+
+class TestCombine:
+    """Test cases for the combine transformation."""
+
+    @pytest.fixture
+    def data(self):
+        """Create DataFrames with different categories."""
+        return {
+            "a": pd.DataFrame({"cat": pd.Categorical(["x", "y"]), "value": [1, 2]}),
+            "b": pd.DataFrame({"cat": pd.Categorical(["z"]), "value": [3]}),
+            "c": pd.DataFrame({"value": [4]}),
+        }
+
+    def test_union_categories(self, data):
+        """Test that categorical columns are kept."""
+        result = combine(data, include=["a", "b"], exclude=[])
+        combined = result["combined"]
+        assert list(result.keys()) == ["c", "combined"]
+        assert isinstance(combined["cat"].dtype, pd.CategoricalDtype)
+        assert combined["cat"].tolist() == ["x", "y", "z"]
+        assert combined.index.tolist() == [0, 1, 0]
+
+    def test_key_column(self, data):
+        """Test that the key of each row is added as categorical column."""
+        combined = combine(
+            data, include=[], exclude=[], key_column="source", ignore_index=True
+        )
+        assert combined["source"].tolist() == ["a", "a", "b", "c"]
+        assert combined["source"].cat.categories.tolist() == ["a", "b", "c"]
+        assert combined.index.tolist() == [0, 1, 2, 3]
+        assert combined["value"].tolist() == [1, 2, 3, 4]
+
+
+class TestColumnTransformerCache:
+    """Test cases for fitted column transformers."""
+
+    @pytest.fixture
+    def transformers(self):
+        """Create a column transformer configuration."""
+        pytest.importorskip("sklearn")
+        __FITTED_COLUMN_TRANSFORMERS__.clear()
+        return [
+            {
+                "class_name": "sklearn.preprocessing.StandardScaler",
+                "columns": ["feature1", "feature2"],
+            }
+        ]
+
+    def test_transform_reuses_fit(self, sample_dataframe, transformers):
+        """Test that transformations with equal configuration share the fit."""
+        data = apply_transformations(
+            sample_dataframe,
+            [
+                {"id": "column_transformer_fit", "transformers": transformers},
+                {
+                    "id": "column_transformer_transform",
+                    "transformers": [dict(t) for t in transformers],
+                },
+            ],
+        )
+        assert np.allclose(data.mean(), 0)
+
+    def test_persistent_cache(self, tmp_path, sample_dataframe, transformers):
+        """Test that fitted column transformers are persisted and reused."""
+        fit = {
+            "id": "column_transformer_fit",
+            "transformers": transformers,
+            "cache": {"dir": str(tmp_path)},
+        }
+        apply_transformations(sample_dataframe, [fit])
+        entries = list((tmp_path / "column_transformer").iterdir())
+        assert len(entries) == 1
+
+        __FITTED_COLUMN_TRANSFORMERS__.clear()
+        mtime = entries[0].stat().st_mtime_ns
+        apply_transformations(sample_dataframe, [fit])
+        assert len(list((tmp_path / "column_transformer").iterdir())) == 1
+        assert entries[0].stat().st_mtime_ns >= mtime
+
+        apply_transformations(sample_dataframe.head(3), [fit])
+        assert len(list((tmp_path / "column_transformer").iterdir())) == 2
+
+    def test_cache_max_size(self, tmp_path, sample_dataframe, transformers):
+        """Test that the cache is evicted once after the transformations."""
+        cache = {"dir": str(tmp_path), "max_size": 1}
+        fit = {"id": "column_transformer_fit", "transformers": transformers}
+        with patch("dvc_stage.transforming.evict") as evict:
+            apply_transformations(
+                {"a": sample_dataframe, "b": sample_dataframe.head(3)},
+                [{**fit, "cache": cache}, {**fit, "cache": dict(cache)}],
+            )
+        evict.assert_called_once_with(str(tmp_path), 1)
+
+    def test_load_from_file(self, tmp_path, sample_dataframe, transformers):
+        """Test that a dumped column transformer is loaded by another stage."""
+        path = str(tmp_path / "out" / "ct.pkl")
+        apply_transformations(
+            sample_dataframe,
+            [
+                {
+                    "id": "column_transformer_fit",
+                    "transformers": transformers,
+                    "dump_to_file": path,
+                }
+            ],
+        )
+        data = apply_transformations(
+            sample_dataframe,
+            [{"id": "column_transformer_transform", "load_from_file": path}],
+        )
+        assert np.allclose(data.mean(), 0)
+
+
+class TestPartialFit:
+    """Test cases for incrementally fitted column transformers."""
+
+    @pytest.fixture
+    def transformers(self):
+        """Create a column transformer configuration."""
+        pytest.importorskip("sklearn")
+        reset_partial_fits()
+        return [
+            {
+                "class_name": "sklearn.preprocessing.StandardScaler",
+                "columns": ["feature1", "feature2"],
+            }
+        ]
+
+    def test_partial_fit_keys(self, tmp_path, sample_dataframe, transformers):
+        """Test that fitting key by key equals fitting all data at once."""
+        from sklearn.preprocessing import StandardScaler
+
+        path = str(tmp_path / "out" / "ct.pkl")
+        data = {"a": sample_dataframe.iloc[:1], "b": sample_dataframe.iloc[1:]}
+        apply_transformations(
+            data,
+            [
+                {
+                    "id": "column_transformer_partial_fit",
+                    "transformers": transformers,
+                    "dump_to_file": path,
+                    "parallel": True,
+                }
+            ],
+        )
+        with open(path, "rb") as f:
+            column_transformer = pickle.load(f)
+        column_transformer.set_output(transform="pandas")
+        result = column_transformer.transform(sample_dataframe)
+        expected = StandardScaler().fit_transform(
+            sample_dataframe[["feature1", "feature2"]]
+        )
+        assert np.allclose(result.to_numpy(), expected)
+        assert list(result.columns) == [
+            "standardscaler__feature1",
+            "standardscaler__feature2",
+        ]
+
+    def test_chunked(self, tmp_path, sample_dataframe, transformers):
+        """Test that transformers are fitted over chunks."""
+        sample_dataframe.to_csv(tmp_path / "input.csv", index=False)
+        data = load_data(format="csv", paths=str(tmp_path / "input.csv"), chunksize=3)
+        transformations = [
+            {"id": "column_transformer_partial_fit", "transformers": transformers}
+        ]
+        transformations[0]["dump_to_file"] = str(tmp_path / "ct.pkl")
+        with patch(
+            "dvc_stage.transforming._dump_column_transformer",
+            wraps=_dump_column_transformer,
+        ) as mock_dump:
+            _run_stage_chunked(data, transformations, None, None)
+        assert mock_dump.call_count == 1
+        data = apply_transformations(
+            sample_dataframe,
+            [{"id": "column_transformer_transform", "transformers": transformers}],
+        )
+        assert np.allclose(data.mean(), 0)
+
+    def test_transform_after_partial_fit(self, transformers):
+        """Test that incomplete fits are rejected in chunked runs."""
+        transformations = [
+            {"id": "column_transformer_partial_fit", "transformers": transformers},
+            {"id": "column_transformer_transform", "transformers": transformers},
+        ]
+        with pytest.raises(ValueError, match="before all data has been seen"):
+            check_row_local(transformations)
+
+    def test_unsupported_transformer(self, sample_dataframe, transformers):
+        """Test that transformers without partial_fit raise a ValueError."""
+        transformers[0]["class_name"] = "sklearn.preprocessing.QuantileTransformer"
+        with pytest.raises(ValueError, match="partial_fit"):
+            apply_transformations(
+                sample_dataframe,
+                [
+                    {
+                        "id": "column_transformer_partial_fit",
+                        "transformers": transformers,
+                    }
+                ],
+            )
+
+
+class TestSql:
+    """Test cases for the sql transformation."""
+
+    @pytest.fixture
+    def data(self):
+        """Create DataFrames to join."""
+        pytest.importorskip("duckdb")
+        return {
+            "orders": pd.DataFrame({"customer": [1, 1, 2], "amount": [1.0, 2.0, 3.0]}),
+            "customers": pd.DataFrame({"customer": [1, 2], "name": ["a", "b"]}),
+        }
+
+    def test_join(self, data):
+        """Test that all keys can be queried as tables."""
+        result = apply_transformations(
+            data,
+            [
+                {
+                    "id": "sql",
+                    "query": "SELECT name, sum(amount) AS total FROM orders "
+                    "JOIN customers USING (customer) GROUP BY name ORDER BY name",
+                    "new_key": "totals",
+                }
+            ],
+        )
+        assert list(result.keys()) == ["orders", "customers", "totals"]
+        assert result["totals"].to_dict("list") == {
+            "name": ["a", "b"],
+            "total": [3.0, 3.0],
+        }
+
+    def test_single_frame(self, data):
+        """Test that a single DataFrame is registered as table."""
+        result = sql(data["orders"], query="SELECT count(*) AS n FROM data")
+        assert result["n"].tolist() == [3]
+
+        result = sql(
+            data,
+            query={"ones": "SELECT * FROM orders WHERE customer = 1"},
+            exclude=["customers"],
+        )
+        assert len(result["ones"]) == 2
+
+    def test_tracing(self):
+        """Test that the keys of the results are returned while tracing."""
+        result = sql({"a": None}, query={"b": "SELECT * FROM a"})
+        assert result == {"a": None, "b": None}
+
+
+class TestAssignExpr:
+    """Test cases for the assign_expr transformation."""
+
+    def test_assign_expr(self):
+        """Test that expressions can use columns assigned before."""
+        data = pd.DataFrame({"a": [1.0, 2.0], "b": [3.0, 4.0], "c": [1.0, np.e]})
+        result = apply_transformations(
+            {"x": data},
+            [
+                {
+                    "id": "assign_expr",
+                    "columns": {"d": "a * b + log(c)", "e": "d - a"},
+                }
+            ],
+        )["x"]
+        assert result["d"].tolist() == [3.0, 9.0]
+        assert result["e"].tolist() == [2.0, 7.0]
+        assert "d" not in data.columns
+
+    def test_tracing(self):
+        """Test that tracing works and invalid column names are reported."""
+        assert assign_expr(None, columns={"d": "a + b"}) is None
+        with pytest.raises(ValueError, match="not valid identifiers"):
+            assign_expr(None, columns={"a b": "a + b"})
+
+
+class TestOptimizeDtypes:
+    """Test cases for optimize_dtypes function."""
+
+    @pytest.fixture
+    def data(self):
+        """Create a DataFrame with wasteful dtypes."""
+        return pd.DataFrame(
+            {
+                "small": np.arange(100, dtype=np.int64),
+                "large": np.arange(100, dtype=np.int64) * 100_000,
+                "whole": np.arange(100, dtype=np.float64),
+                "fraction": np.arange(100) / 3,
+                "label": pd.Series(["a", "b"] * 50, dtype=object),
+                "name": pd.Series([f"name {i}" for i in range(100)], dtype=object),
+            }
+        )
+
+    def test_optimize_dtypes(self, data):
+        """Test that dtypes are reduced without changing the values."""
+        optimized = optimize_dtypes(data)
+        assert optimized["small"].dtype == np.int8
+        assert optimized["large"].dtype == np.int32
+        assert optimized["whole"].dtype == np.float32
+        assert optimized["fraction"].dtype == np.float64
+        assert isinstance(optimized["label"].dtype, pd.CategoricalDtype)
+        assert optimized["name"].dtype == "string[pyarrow]"
+        pd.testing.assert_frame_equal(
+            optimized, data, check_dtype=False, check_categorical=False
+        )
+        assert (
+            optimized.memory_usage(deep=True).sum() < data.memory_usage(deep=True).sum()
+        )
+
+    def test_unsigned_integers(self):
+        """Test that unsigned integers are never widened."""
+        data = pd.DataFrame(
+            {
+                "u8": np.arange(1000, dtype=np.uint8),
+                "u16": np.arange(1000, dtype=np.uint16),
+                "u64": np.arange(1000, dtype=np.uint64),
+                "i16": np.arange(1000, dtype=np.int16),
+            }
+        )
+        optimized = optimize_dtypes(data)
+        assert optimized.dtypes.tolist() == [np.uint8, np.uint16, np.uint16, np.int16]
+        assert optimized.memory_usage().sum() < data.memory_usage().sum()
+
+    def test_memory_report(self, data, caplog):
+        """Test that the memory usage is only measured if it is reported."""
+        with patch.object(
+            pd.DataFrame,
+            "memory_usage",
+            autospec=True,
+            side_effect=pd.DataFrame.memory_usage,
+        ) as mock_usage:
+            with caplog.at_level("WARNING", logger="dvc_stage.transforming"):
+                optimize_dtypes(data)
+            assert mock_usage.call_count == 0
+            with caplog.at_level("INFO", logger="dvc_stage.transforming"):
+                optimized = optimize_dtypes(data)
+        before = data.memory_usage(deep=True).sum()
+        after = optimized.memory_usage(deep=True).sum()
+        assert f"{before} bytes -> {after} bytes" in caplog.text
+
+    def test_optimize_dtypes_per_key(self, data):
+        """Test the optimize_dtypes transformation on a dict of DataFrames."""
+        transformed = apply_transformations(
+            {"a": data, "b": data}, [{"id": "optimize_dtypes", "string_dtype": None}]
+        )
+        assert transformed["b"]["small"].dtype == np.int8
+        assert transformed["b"]["name"].dtype == object
+
+    def test_tracing(self):
+        """Test that tracing returns None."""
+        assert optimize_dtypes(None) is None
+
+
+class TestParallelTransformations:
+    """Test cases for concurrent per-key transformations."""
+
+    @pytest.fixture
+    def data(self, sample_dataframe):
+        """Create a dict of DataFrames."""
+        return {f"key_{i}": sample_dataframe * i for i in range(6)}
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_matches_serial(self, data, executor):
+        """Test that results are merged in the same order as serial results."""
+        transformations = [
+            {"id": "fillna", "value": 0, "parallel": 3, "executor": executor},
+            {
+                "id": "split",
+                "by": "id",
+                "id_col": "feature3",
+                "size": 0.5,
+                "seed": 42,
+                "left_split_key": "left",
+                "right_split_key": "right",
+                "include": ["key_1"],
+            },
+            {"id": "add_suffix", "suffix": "_x", "parallel": True},
+        ]
+        expected = apply_transformations(
+            data,
+            [
+                {k: v for k, v in t.items() if k not in ("parallel", "executor")}
+                for t in transformations
+            ],
+        )
+        result = apply_transformations(data, transformations)
+        assert list(result.keys()) == list(expected.keys())
+        assert "left" in result.keys()
+        for key, df in expected.items():
+            pd.testing.assert_frame_equal(result[key], df)
+
+    def test_stage_level_parallel(self, data):
+        """Test that the default executor applies to all transformations."""
+        result = apply_transformations(
+            data,
+            [{"id": "add_prefix", "prefix": "p_"}],
+            parallel=2,
+            executor="thread",
+        )
+        assert list(result.keys()) == list(data.keys())
+        assert list(result["key_5"].columns)[0] == "p_feature1"
+
+    def test_stateful_process_executor(self, data):
+        """Test that column transformers are fitted in the stage process."""
+        pytest.importorskip("sklearn")
+        __FITTED_COLUMN_TRANSFORMERS__.clear()
+        transformers = [
+            {
+                "class_name": "sklearn.preprocessing.StandardScaler",
+                "columns": ["feature1", "feature2"],
+            }
+        ]
+        result = apply_transformations(
+            dict.fromkeys(data.keys(), data["key_1"]),
+            [
+                {"id": "column_transformer_fit", "transformers": transformers},
+                {"id": "column_transformer_transform", "transformers": transformers},
+            ],
+            parallel=2,
+            executor="process",
+        )
+        for df in result.values():
+            assert np.allclose(df.mean(), 0)
+
+    def test_error_cancels_pending(self, data):
+        """Test that pending transformations are cancelled after an error."""
+        with patch("dvc_stage.transforming.get_executor") as mock_executor:
+            pool = mock_executor.return_value
+            pool.submit.return_value.result.side_effect = RuntimeError("failed")
+            with pytest.raises(RuntimeError, match="failed"):
+                apply_transformations(data, [{"id": "fillna", "value": 0}], parallel=2)
+        pool.shutdown.assert_called_once_with(cancel_futures=True)
+
+
+class TestMemoization:
+    """Test cases for memoized transformations."""
+
+    @pytest.fixture
+    def transformations(self, monkeypatch):
+        """Create transformations counting the calls of a custom function."""
+        calls = []
+
+        def count(data):
+            calls.append(1)
+            return data
+
+        module = types.ModuleType("memo_fns")
+        module.count = count
+        monkeypatch.setitem(sys.modules, "memo_fns", module)
+        return calls, [
+            {"id": "custom", "import_from": "memo_fns.count"},
+            {"id": "rename", "columns": {"feature1": "f1"}},
+            {"id": "dropna"},
+        ]
+
+    def test_resume(self, tmp_path, sample_dataframe, transformations):
+        """Test that unchanged steps are loaded from the cache."""
+        calls, transformations = transformations
+        memoize = {"dir": str(tmp_path)}
+        expected = apply_transformations(
+            sample_dataframe, transformations, memoize=memoize
+        )
+        assert len(list((tmp_path / "transform").iterdir())) == 3
+
+        data = apply_transformations(sample_dataframe, transformations, memoize=memoize)
+        pd.testing.assert_frame_equal(data, expected)
+        assert len(calls) == 1
+
+        transformations[2] = {"id": "fillna", "value": 0}
+        apply_transformations(sample_dataframe, transformations, memoize=memoize)
+        assert len(calls) == 1
+        assert len(list((tmp_path / "transform").iterdir())) == 4
+
+        head = sample_dataframe.head(2)
+        apply_transformations(head, transformations, memoize=memoize)
+        assert len(calls) == 2
+
+    def test_stateful_steps(self, tmp_path, sample_dataframe):
+        """Test that steps after stateful transformations are not cached."""
+        memoize = {"dir": str(tmp_path)}
+        transformations = [
+            {"id": "dropna"},
+            {"id": "rename", "columns": {"feature1": "f1"}, "memoize": False},
+            {"id": "fillna", "value": 0},
+        ]
+        apply_transformations(sample_dataframe, transformations, memoize=memoize)
+        assert len(list((tmp_path / "transform").iterdir())) == 1
+
+    def test_package_version(self, tmp_path, sample_dataframe, monkeypatch):
+        """Test that upgrading dvc-stage invalidates built-in steps."""
+        memoize = {"dir": str(tmp_path)}
+        transformations = [{"id": "optimize_dtypes"}]
+        apply_transformations(sample_dataframe, transformations, memoize=memoize)
+        monkeypatch.setattr("dvc_stage.__version__", "0.0.0")
+        apply_transformations(sample_dataframe, transformations, memoize=memoize)
+        assert len(list((tmp_path / "transform").iterdir())) == 2
+
+    def test_max_size(self, tmp_path, sample_dataframe):
+        """Test that the cache size is bounded."""
+        memoize = {"dir": str(tmp_path), "max_size": 1}
+        apply_transformations(sample_dataframe, [{"id": "dropna"}], memoize=memoize)
+        assert list((tmp_path / "transform").iterdir()) == []
+
+    def test_evict_once(self, tmp_path, sample_dataframe, transformations):
+        """Test that the cache is evicted once after all transformations."""
+        _, transformations = transformations
+        memoize = {"dir": str(tmp_path), "max_size": "1GB"}
+        with patch("dvc_stage.transforming.evict") as evict:
+            apply_transformations(sample_dataframe, transformations, memoize=memoize)
+        evict.assert_called_once_with(str(tmp_path), "1GB")
+        assert len(list((tmp_path / "transform").iterdir())) == 3
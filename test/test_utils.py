@@ -1,8 +1,17 @@
 """Tests for the utils module."""
 
+import glob
+import os
+
 import pytest
 
-from dvc_stage.utils import flatten_dict, import_from_string, key_is_skipped, parse_path
+from dvc_stage.utils import (
+    flatten_dict,
+    import_from_string,
+    key_is_skipped,
+    parse_path,
+    resolve_globs,
+)
 
 
 class TestParsePathFunction:
@@ -92,3 +101,41 @@ class TestKeyIsSkippedFunction:
         """Test key skipping with exclude filter."""
         assert key_is_skipped("test_key", [], ["test_key"])
         assert not key_is_skipped("other_key", [], ["test_key"])
+
+
+class TestResolveGlobsFunction:
+    """Test cases for resolve_globs function."""
+
+    @pytest.fixture
+    def file_tree(self, tmp_path, monkeypatch):
+        """Create a small directory tree and change into it."""
+        for d in ("a", "b", "b/sub"):
+            os.makedirs(tmp_path / d)
+            for f in ("x1.csv", "x2.csv", "y.txt", ".hidden.csv"):
+                (tmp_path / d / f).touch()
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            "a/*.csv",
+            "*/x?.csv",
+            "*/*/*.csv",
+            "b/x[12].csv",
+            "a/.*",
+            "*/sub",
+            "a/y.txt",
+            "missing/*.csv",
+        ],
+    )
+    def test_equivalent_to_glob(self, file_tree, pattern):
+        """Test that the results match glob.glob."""
+        resolved = resolve_globs([pattern, "a/*.csv"])
+        assert sorted(resolved[pattern]) == sorted(glob.glob(pattern))
+
+    def test_memoization_invalidated(self, file_tree):
+        """Test that memoized results are updated when directories change."""
+        assert len(resolve_globs(["a/*.csv"])["a/*.csv"]) == 2
+        (file_tree / "a" / "x3.csv").touch()
+        assert len(resolve_globs(["a/*.csv"])["a/*.csv"]) == 3